@@ -10,7 +10,7 @@ use openmls::prelude::{
 use openmls_basic_credential::SignatureKeyPair;
 use openmls_traits::OpenMlsProvider;
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
+use pyo3::types::{PyBytes, PyString};
 use serde_json;
 use tls_codec::{Deserialize as TlsDeserialize, Serialize as TlsSerialize};
 
@@ -387,6 +387,63 @@ impl MlsEngine {
         }
     }
 
+    /// Encrypt several plaintexts for one group in order.
+    /// The group is loaded once and each message advances the sender ratchet.
+    fn encrypt_many<'py>(
+        &mut self,
+        py: Python<'py>,
+        group_id: &str,
+        plaintexts: Vec<Vec<u8>>,
+    ) -> PyResult<Vec<Bound<'py, PyBytes>>> {
+        let sig = self
+            .signature_keys
+            .as_ref()
+            .ok_or_else(|| {
+                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Identity not initialized")
+            })?;
+
+        let mut mls_group = self.load_group(group_id)?;
+
+        let mut result = Vec::with_capacity(plaintexts.len());
+        for plaintext in &plaintexts {
+            let ciphertext = group::encrypt(&self.provider, &mut mls_group, &sig, plaintext)
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e))?;
+            result.push(PyBytes::new(py, &ciphertext));
+        }
+        Ok(result)
+    }
+
+    /// Decrypt several MLS application messages for one group in order.
+    /// The group is loaded once. Returns one ``(ok, value)`` pair per message:
+    /// ``(True, plaintext: bytes)`` on success, or ``(False, reason: str)`` if
+    /// that message failed or was not an application message. A bad message
+    /// does not stop the batch, since earlier messages have already advanced
+    /// the ratchet and their plaintexts cannot be recovered by a retry.
+    fn decrypt_many<'py>(
+        &mut self,
+        py: Python<'py>,
+        group_id: &str,
+        ciphertexts: Vec<Vec<u8>>,
+    ) -> PyResult<Vec<(bool, Bound<'py, PyAny>)>> {
+        let mut mls_group = self.load_group(group_id)?;
+
+        let mut result = Vec::with_capacity(ciphertexts.len());
+        for ciphertext in &ciphertexts {
+            let entry = match group::process_message(&self.provider, &mut mls_group, ciphertext) {
+                Ok(group::ProcessedResult::Application(plaintext)) => {
+                    (true, PyBytes::new(py, &plaintext).into_any())
+                }
+                Ok(_) => (
+                    false,
+                    PyString::new(py, "Message is not an application message").into_any(),
+                ),
+                Err(e) => (false, PyString::new(py, &e).into_any()),
+            };
+            result.push(entry);
+        }
+        Ok(result)
+    }
+
     /// Check if a group exists in storage.
     fn group_exists(&self, group_id: &str) -> bool {
         let gid = GroupId::from_slice(group_id.as_bytes());
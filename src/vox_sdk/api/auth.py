@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from pydantic import TypeAdapter
+
 from vox_sdk.models.auth import (
     LoginResponse,
     MFARequiredResponse,
@@ -20,6 +22,8 @@ from vox_sdk.models.auth import (
 if TYPE_CHECKING:
     from vox_sdk.http import HTTPClient
 
+_WEBAUTHN_CREDENTIALS = TypeAdapter(list[WebAuthnCredentialResponse])
+
 
 class AuthAPI:
     """Methods for /api/v1/auth endpoints."""
@@ -34,7 +38,7 @@ class AuthAPI:
         if display_name is not None:
             payload["display_name"] = display_name
         r = await self._http.post("/api/v1/auth/register", json=payload)
-        return RegisterResponse.model_validate(r.json())
+        return RegisterResponse.model_validate_json(r.content)
 
     async def login(self, username: str, password: str) -> LoginResponse | MFARequiredResponse:
         r = await self._http.post(
@@ -58,13 +62,13 @@ class AuthAPI:
         if assertion is not None:
             payload["assertion"] = assertion
         r = await self._http.post("/api/v1/auth/login/2fa", json=payload)
-        return LoginResponse.model_validate(r.json())
+        return LoginResponse.model_validate_json(r.content)
 
     async def login_webauthn_challenge(self, username: str) -> WebAuthnChallengeResponse:
         r = await self._http.post(
             "/api/v1/auth/login/webauthn/challenge", json={"username": username}
         )
-        return WebAuthnChallengeResponse.model_validate(r.json())
+        return WebAuthnChallengeResponse.model_validate_json(r.content)
 
     async def login_webauthn(
         self,
@@ -87,24 +91,24 @@ class AuthAPI:
         if user_handle is not None:
             payload["user_handle"] = user_handle
         r = await self._http.post("/api/v1/auth/login/webauthn", json=payload)
-        return LoginResponse.model_validate(r.json())
+        return LoginResponse.model_validate_json(r.content)
 
     async def login_federation(self, federation_token: str) -> LoginResponse:
         r = await self._http.post(
             "/api/v1/auth/login/federation", json={"federation_token": federation_token}
         )
-        return LoginResponse.model_validate(r.json())
+        return LoginResponse.model_validate_json(r.content)
 
     async def logout(self) -> None:
         await self._http.post("/api/v1/auth/logout")
 
     async def mfa_status(self) -> MFAStatusResponse:
         r = await self._http.get("/api/v1/auth/2fa")
-        return MFAStatusResponse.model_validate(r.json())
+        return MFAStatusResponse.model_validate_json(r.content)
 
     async def mfa_setup(self, method: str) -> MFASetupResponse:
         r = await self._http.post("/api/v1/auth/2fa/setup", json={"method": method})
-        return MFASetupResponse.model_validate(r.json())
+        return MFASetupResponse.model_validate_json(r.content)
 
     async def mfa_setup_confirm(
         self,
@@ -121,7 +125,7 @@ class AuthAPI:
         if credential_name is not None:
             payload["credential_name"] = credential_name
         r = await self._http.post("/api/v1/auth/2fa/setup/confirm", json=payload)
-        return MFASetupConfirmResponse.model_validate(r.json())
+        return MFASetupConfirmResponse.model_validate_json(r.content)
 
     async def mfa_remove(
         self,
@@ -135,19 +139,19 @@ class AuthAPI:
         if assertion is not None:
             payload["assertion"] = assertion
         r = await self._http.delete("/api/v1/auth/2fa", json=payload)
-        return SuccessResponse.model_validate(r.json())
+        return SuccessResponse.model_validate_json(r.content)
 
     async def list_webauthn_credentials(self) -> list[WebAuthnCredentialResponse]:
         r = await self._http.get("/api/v1/auth/webauthn/credentials")
-        return [WebAuthnCredentialResponse.model_validate(c) for c in r.json()]
+        return _WEBAUTHN_CREDENTIALS.validate_json(r.content)
 
     async def delete_webauthn_credential(self, credential_id: str) -> SuccessResponse:
         r = await self._http.delete(f"/api/v1/auth/webauthn/credentials/{credential_id}")
-        return SuccessResponse.model_validate(r.json())
+        return SuccessResponse.model_validate_json(r.content)
 
     async def list_sessions(self) -> SessionListResponse:
         r = await self._http.get("/api/v1/auth/sessions")
-        return SessionListResponse.model_validate(r.json())
+        return SessionListResponse.model_validate_json(r.content)
 
     async def revoke_session(self, session_id: int) -> None:
         await self._http.delete(f"/api/v1/auth/sessions/{session_id}")
@@ -20,11 +20,11 @@ class BotsAPI:
         r = await self._http.put(
             f"/api/v1/bots/{user_id}/commands", json={"commands": commands}
         )
-        return OkResponse.model_validate(r.json())
+        return OkResponse.model_validate_json(r.content)
 
     async def list_bot_commands(self, user_id: int) -> CommandListResponse:
         r = await self._http.get(f"/api/v1/bots/{user_id}/commands")
-        return CommandListResponse.model_validate(r.json())
+        return CommandListResponse.model_validate_json(r.content)
 
     async def deregister_commands(
         self, user_id: int, command_names: list[str]
@@ -32,11 +32,11 @@ class BotsAPI:
         r = await self._http.delete(
             f"/api/v1/bots/{user_id}/commands", json={"command_names": command_names}
         )
-        return OkResponse.model_validate(r.json())
+        return OkResponse.model_validate_json(r.content)
 
     async def list_commands(self) -> CommandListResponse:
         r = await self._http.get("/api/v1/commands")
-        return CommandListResponse.model_validate(r.json())
+        return CommandListResponse.model_validate_json(r.content)
 
     async def respond_to_interaction(
         self,
@@ -28,7 +28,7 @@ class ChannelsAPI:
 
     async def get_feed(self, feed_id: int) -> FeedResponse:
         r = await self._http.get(f"/api/v1/feeds/{feed_id}")
-        return FeedResponse.model_validate(r.json())
+        return FeedResponse.model_validate_json(r.content)
 
     async def create_feed(
         self,
@@ -44,7 +44,7 @@ class ChannelsAPI:
         if permission_overrides is not None:
             payload["permission_overrides"] = permission_overrides
         r = await self._http.post("/api/v1/feeds", json=payload)
-        return FeedResponse.model_validate(r.json())
+        return FeedResponse.model_validate_json(r.content)
 
     async def update_feed(
         self,
@@ -65,7 +65,7 @@ class ChannelsAPI:
         if position is not None:
             payload["position"] = position
         r = await self._http.patch(f"/api/v1/feeds/{feed_id}", json=payload)
-        return FeedResponse.model_validate(r.json())
+        return FeedResponse.model_validate_json(r.content)
 
     async def delete_feed(self, feed_id: int) -> None:
         await self._http.delete(f"/api/v1/feeds/{feed_id}")
@@ -80,7 +80,7 @@ class ChannelsAPI:
 
     async def get_room(self, room_id: int) -> RoomResponse:
         r = await self._http.get(f"/api/v1/rooms/{room_id}")
-        return RoomResponse.model_validate(r.json())
+        return RoomResponse.model_validate_json(r.content)
 
     async def create_room(
         self,
@@ -96,7 +96,7 @@ class ChannelsAPI:
         if permission_overrides is not None:
             payload["permission_overrides"] = permission_overrides
         r = await self._http.post("/api/v1/rooms", json=payload)
-        return RoomResponse.model_validate(r.json())
+        return RoomResponse.model_validate_json(r.content)
 
     async def update_room(
         self,
@@ -114,7 +114,7 @@ class ChannelsAPI:
         if position is not None:
             payload["position"] = position
         r = await self._http.patch(f"/api/v1/rooms/{room_id}", json=payload)
-        return RoomResponse.model_validate(r.json())
+        return RoomResponse.model_validate_json(r.content)
 
     async def delete_room(self, room_id: int) -> None:
         await self._http.delete(f"/api/v1/rooms/{room_id}")
@@ -123,17 +123,17 @@ class ChannelsAPI:
 
     async def list_categories(self) -> CategoryListResponse:
         r = await self._http.get("/api/v1/categories")
-        return CategoryListResponse.model_validate(r.json())
+        return CategoryListResponse.model_validate_json(r.content)
 
     async def get_category(self, category_id: int) -> CategoryResponse:
         r = await self._http.get(f"/api/v1/categories/{category_id}")
-        return CategoryResponse.model_validate(r.json())
+        return CategoryResponse.model_validate_json(r.content)
 
     async def create_category(self, name: str, position: int = 0) -> CategoryResponse:
         r = await self._http.post(
             "/api/v1/categories", json={"name": name, "position": position}
         )
-        return CategoryResponse.model_validate(r.json())
+        return CategoryResponse.model_validate_json(r.content)
 
     async def update_category(
         self, category_id: int, *, name: str | None = None, position: int | None = None
@@ -144,7 +144,7 @@ class ChannelsAPI:
         if position is not None:
             payload["position"] = position
         r = await self._http.patch(f"/api/v1/categories/{category_id}", json=payload)
-        return CategoryResponse.model_validate(r.json())
+        return CategoryResponse.model_validate_json(r.content)
 
     async def delete_category(self, category_id: int) -> None:
         await self._http.delete(f"/api/v1/categories/{category_id}")
@@ -153,11 +153,11 @@ class ChannelsAPI:
 
     async def get_thread(self, thread_id: int) -> ThreadResponse:
         r = await self._http.get(f"/api/v1/threads/{thread_id}")
-        return ThreadResponse.model_validate(r.json())
+        return ThreadResponse.model_validate_json(r.content)
 
     async def list_threads(self, feed_id: int) -> ThreadListResponse:
         r = await self._http.get(f"/api/v1/feeds/{feed_id}/threads")
-        return ThreadListResponse.model_validate(r.json())
+        return ThreadListResponse.model_validate_json(r.content)
 
     async def create_thread(
         self, feed_id: int, parent_msg_id: int, name: str
@@ -166,7 +166,7 @@ class ChannelsAPI:
             f"/api/v1/feeds/{feed_id}/threads",
             json={"parent_msg_id": parent_msg_id, "name": name},
         )
-        return ThreadResponse.model_validate(r.json())
+        return ThreadResponse.model_validate_json(r.content)
 
     async def update_thread(
         self,
@@ -184,7 +184,7 @@ class ChannelsAPI:
         if locked is not None:
             payload["locked"] = locked
         r = await self._http.patch(f"/api/v1/threads/{thread_id}", json=payload)
-        return ThreadResponse.model_validate(r.json())
+        return ThreadResponse.model_validate_json(r.content)
 
     async def delete_thread(self, thread_id: int) -> None:
         await self._http.delete(f"/api/v1/threads/{thread_id}")
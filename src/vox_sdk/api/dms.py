@@ -30,11 +30,11 @@ class DMsAPI:
         if name is not None:
             payload["name"] = name
         r = await self._http.post("/api/v1/dms", json=payload)
-        return DMResponse.model_validate(r.json())
+        return DMResponse.model_validate_json(r.content)
 
     async def list(self) -> DMListResponse:
         r = await self._http.get("/api/v1/dms")
-        return DMListResponse.model_validate(r.json())
+        return DMListResponse.model_validate_json(r.content)
 
     async def close(self, dm_id: int) -> None:
         await self._http.delete(f"/api/v1/dms/{dm_id}")
@@ -48,7 +48,7 @@ class DMsAPI:
         if icon is not None:
             payload["icon"] = icon
         r = await self._http.patch(f"/api/v1/dms/{dm_id}", json=payload)
-        return DMResponse.model_validate(r.json())
+        return DMResponse.model_validate_json(r.content)
 
     async def add_recipient(self, dm_id: int, user_id: int) -> None:
         await self._http.put(f"/api/v1/dms/{dm_id}/recipients/{user_id}")
@@ -58,7 +58,7 @@ class DMsAPI:
 
     async def convert_to_group(self, dm_id: int) -> DMResponse:
         r = await self._http.post(f"/api/v1/dms/{dm_id}/convert-to-group")
-        return DMResponse.model_validate(r.json())
+        return DMResponse.model_validate_json(r.content)
 
     async def send_read_receipt(self, dm_id: int, up_to_msg_id: int) -> None:
         await self._http.post(
@@ -75,7 +75,7 @@ class DMsAPI:
             payload["body"] = body
         payload.update(kwargs)
         r = await self._http.post(f"/api/v1/dms/{dm_id}/messages", json=payload)
-        return SendMessageResponse.model_validate(r.json())
+        return SendMessageResponse.model_validate_json(r.content)
 
     async def list_messages(
         self, dm_id: int, *, before: int | None = None, limit: int = 50
@@ -84,13 +84,13 @@ class DMsAPI:
         if before is not None:
             params["before"] = before
         r = await self._http.get(f"/api/v1/dms/{dm_id}/messages", params=params)
-        return MessageListResponse.model_validate(r.json())
+        return MessageListResponse.model_validate_json(r.content)
 
     async def edit_message(self, dm_id: int, msg_id: int, body: str) -> EditMessageResponse:
         r = await self._http.patch(
             f"/api/v1/dms/{dm_id}/messages/{msg_id}", json={"body": body}
         )
-        return EditMessageResponse.model_validate(r.json())
+        return EditMessageResponse.model_validate_json(r.content)
 
     async def delete_message(self, dm_id: int, msg_id: int) -> None:
         await self._http.delete(f"/api/v1/dms/{dm_id}/messages/{msg_id}")
@@ -38,18 +38,18 @@ class E2EEAPI:
 
     async def get_prekeys(self, user_id: int) -> PrekeyBundleResponse:
         r = await self._http.get(f"/api/v1/keys/prekeys/{user_id}")
-        return PrekeyBundleResponse.model_validate(r.json())
+        return PrekeyBundleResponse.model_validate_json(r.content)
 
     async def list_devices(self) -> DeviceListResponse:
         r = await self._http.get("/api/v1/keys/devices")
-        return DeviceListResponse.model_validate(r.json())
+        return DeviceListResponse.model_validate_json(r.content)
 
     async def add_device(self, device_id: str, device_name: str) -> AddDeviceResponse:
         r = await self._http.post(
             "/api/v1/keys/devices",
             json={"device_id": device_id, "device_name": device_name},
         )
-        return AddDeviceResponse.model_validate(r.json())
+        return AddDeviceResponse.model_validate_json(r.content)
 
     async def remove_device(self, device_id: str) -> None:
         await self._http.delete(f"/api/v1/keys/devices/{device_id}")
@@ -64,7 +64,7 @@ class E2EEAPI:
         if temp_public_key is not None:
             payload["temp_public_key"] = temp_public_key
         r = await self._http.post("/api/v1/keys/devices/pair", json=payload)
-        return PairDeviceResponse.model_validate(r.json())
+        return PairDeviceResponse.model_validate_json(r.content)
 
     async def respond_to_pairing(self, pair_id: str, approved: bool) -> None:
         await self._http.post(
@@ -79,7 +79,7 @@ class E2EEAPI:
 
     async def download_key_backup(self) -> KeyBackupResponse:
         r = await self._http.get("/api/v1/keys/backup")
-        return KeyBackupResponse.model_validate(r.json())
+        return KeyBackupResponse.model_validate_json(r.content)
 
     async def upload_mls_key_packages(
         self, device_id: str, key_packages: list[str]
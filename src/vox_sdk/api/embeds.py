@@ -16,4 +16,4 @@ class EmbedsAPI:
 
     async def resolve(self, url: str) -> Embed:
         r = await self._http.post("/api/v1/embeds/resolve", json={"url": url})
-        return Embed.model_validate(r.json())
+        return Embed.model_validate_json(r.content)
@@ -26,7 +26,7 @@ class EmojiAPI:
 
     async def list_emoji(self) -> EmojiListResponse:
         r = await self._http.get("/api/v1/emoji")
-        return EmojiListResponse.model_validate(r.json())
+        return EmojiListResponse.model_validate_json(r.content)
 
     async def create_emoji(self, name: str, image_path: str) -> EmojiResponse:
         p = Path(image_path)
@@ -37,11 +37,11 @@ class EmojiAPI:
             data={"name": name},
             files={"image": (p.name, data, mime)},
         )
-        return EmojiResponse.model_validate(r.json())
+        return EmojiResponse.model_validate_json(r.content)
 
     async def update_emoji(self, emoji_id: int, name: str) -> EmojiResponse:
         r = await self._http.patch(f"/api/v1/emoji/{emoji_id}", json={"name": name})
-        return EmojiResponse.model_validate(r.json())
+        return EmojiResponse.model_validate_json(r.content)
 
     async def delete_emoji(self, emoji_id: int) -> None:
         await self._http.delete(f"/api/v1/emoji/{emoji_id}")
@@ -50,7 +50,7 @@ class EmojiAPI:
 
     async def list_stickers(self) -> StickerListResponse:
         r = await self._http.get("/api/v1/stickers")
-        return StickerListResponse.model_validate(r.json())
+        return StickerListResponse.model_validate_json(r.content)
 
     async def create_sticker(self, name: str, image_path: str) -> StickerResponse:
         p = Path(image_path)
@@ -61,11 +61,11 @@ class EmojiAPI:
             data={"name": name},
             files={"image": (p.name, data, mime)},
         )
-        return StickerResponse.model_validate(r.json())
+        return StickerResponse.model_validate_json(r.content)
 
     async def update_sticker(self, sticker_id: int, name: str) -> StickerResponse:
         r = await self._http.patch(f"/api/v1/stickers/{sticker_id}", json={"name": name})
-        return StickerResponse.model_validate(r.json())
+        return StickerResponse.model_validate_json(r.content)
 
     async def delete_sticker(self, sticker_id: int) -> None:
         await self._http.delete(f"/api/v1/stickers/{sticker_id}")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING, Any
 from urllib.parse import quote
 
@@ -15,20 +16,34 @@ from vox_sdk.models.federation import (
 if TYPE_CHECKING:
     from vox_sdk.http import HTTPClient
 
+# Byte -> path-segment encoding: unreserved characters and "@" pass through,
+# everything else becomes %XX. Matches quote(value, safe="@").
+_ADDRESS_SAFE = frozenset(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~@"
+)
+_ADDRESS_ENCODE = [chr(b) if b in _ADDRESS_SAFE else f"%{b:02X}" for b in range(256)]
+_ADDRESS_UNSAFE = re.compile(r"[^A-Za-z0-9_.\-~@]")
+
+
+def _quote_user_address(user_address: str) -> str:
+    if _ADDRESS_UNSAFE.search(user_address) is None:
+        return user_address
+    return "".join([_ADDRESS_ENCODE[b] for b in user_address.encode()])
+
 
 class FederationAPI:
     def __init__(self, http: HTTPClient) -> None:
         self._http = http
 
     async def get_prekeys(self, user_address: str) -> FederatedPrekeyResponse:
-        encoded = quote(user_address, safe="@")
+        encoded = _quote_user_address(user_address)
         r = await self._http.get(f"/api/v1/federation/users/{encoded}/prekeys")
-        return FederatedPrekeyResponse.model_validate(r.json())
+        return FederatedPrekeyResponse.model_validate_json(r.content)
 
     async def get_profile(self, user_address: str) -> FederatedUserProfile:
-        encoded = quote(user_address, safe="@")
+        encoded = _quote_user_address(user_address)
         r = await self._http.get(f"/api/v1/federation/users/{encoded}")
-        return FederatedUserProfile.model_validate(r.json())
+        return FederatedUserProfile.model_validate_json(r.content)
 
     async def join_request(
         self, target_domain: str, *, invite_code: str | None = None
@@ -37,7 +52,7 @@ class FederationAPI:
         if invite_code is not None:
             payload["invite_code"] = invite_code
         r = await self._http.post("/api/v1/federation/join-request", json=payload)
-        return FederationJoinResponse.model_validate(r.json())
+        return FederationJoinResponse.model_validate_json(r.content)
 
     async def block(self, reason: str | None = None) -> None:
         payload: dict[str, Any] = {}
@@ -62,7 +77,7 @@ class FederationAPI:
             "/api/v1/federation/admin/block",
             params={"limit": limit, "offset": offset},
         )
-        return FederationEntryListResponse.model_validate(r.json())
+        return FederationEntryListResponse.model_validate_json(r.content)
 
     async def admin_allow(self, domain: str, reason: str | None = None) -> None:
         payload: dict[str, Any] = {"domain": domain}
@@ -81,4 +96,4 @@ class FederationAPI:
             "/api/v1/federation/admin/allow",
             params={"limit": limit, "offset": offset},
         )
-        return FederationEntryListResponse.model_validate(r.json())
+        return FederationEntryListResponse.model_validate_json(r.content)
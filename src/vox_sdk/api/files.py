@@ -22,7 +22,7 @@ class FilesAPI:
             f"/api/v1/feeds/{feed_id}/files",
             files={"file": (filename, data, mime)},
         )
-        return FileResponse.model_validate(r.json())
+        return FileResponse.model_validate_json(r.content)
 
     async def upload_dm(self, dm_id: int, file_path: str, filename: str, mime: str) -> FileResponse:
         data = await asyncio.to_thread(Path(file_path).read_bytes)
@@ -30,7 +30,7 @@ class FilesAPI:
             f"/api/v1/dms/{dm_id}/files",
             files={"file": (filename, data, mime)},
         )
-        return FileResponse.model_validate(r.json())
+        return FileResponse.model_validate_json(r.content)
 
     async def upload_bytes(
         self, feed_id: int, data: bytes, filename: str, mime: str
@@ -39,11 +39,11 @@ class FilesAPI:
             f"/api/v1/feeds/{feed_id}/files",
             files={"file": (filename, data, mime)},
         )
-        return FileResponse.model_validate(r.json())
+        return FileResponse.model_validate_json(r.content)
 
     async def get(self, file_id: str) -> FileResponse:
         r = await self._http.get(f"/api/v1/files/{file_id}")
-        return FileResponse.model_validate(r.json())
+        return FileResponse.model_validate_json(r.content)
 
     async def delete(self, file_id: str) -> None:
         await self._http.delete(f"/api/v1/files/{file_id}")
@@ -16,8 +16,8 @@ class GifsAPI:
 
     async def search(self, query: str, limit: int = 20) -> GifSearchResponse:
         r = await self._http.get("/api/v1/gifs/search", params={"q": query, "limit": limit})
-        return GifSearchResponse.model_validate(r.json())
+        return GifSearchResponse.model_validate_json(r.content)
 
     async def trending(self, limit: int = 20) -> GifSearchResponse:
         r = await self._http.get("/api/v1/gifs/trending", params={"limit": limit})
-        return GifSearchResponse.model_validate(r.json())
+        return GifSearchResponse.model_validate_json(r.content)
@@ -30,18 +30,18 @@ class InvitesAPI:
         if max_age is not None:
             payload["max_age"] = max_age
         r = await self._http.post("/api/v1/invites", json=payload)
-        return InviteResponse.model_validate(r.json())
+        return InviteResponse.model_validate_json(r.content)
 
     async def delete(self, code: str) -> None:
         await self._http.delete(f"/api/v1/invites/{code}")
 
     async def resolve(self, code: str) -> InvitePreviewResponse:
         r = await self._http.get(f"/api/v1/invites/{code}")
-        return InvitePreviewResponse.model_validate(r.json())
+        return InvitePreviewResponse.model_validate_json(r.content)
 
     async def list(self) -> InviteListResponse:
         r = await self._http.get("/api/v1/invites")
-        return InviteListResponse.model_validate(r.json())
+        return InviteListResponse.model_validate_json(r.content)
 
     def iter_invites(self, *, limit: int = 50) -> PaginatedIterator[InviteResponse]:
         return PaginatedIterator(self._http, "/api/v1/invites", InviteResponse, limit=limit)
@@ -17,14 +17,14 @@ class MembersAPI:
 
     async def list(self, **params: Any) -> MemberListResponse:
         r = await self._http.get("/api/v1/members", params=params)
-        return MemberListResponse.model_validate(r.json())
+        return MemberListResponse.model_validate_json(r.content)
 
     def iter(self, *, limit: int = 50) -> PaginatedIterator[MemberResponse]:
         return PaginatedIterator(self._http, "/api/v1/members", MemberResponse, limit=limit)
 
     async def get(self, user_id: int) -> MemberResponse:
         r = await self._http.get(f"/api/v1/members/{user_id}")
-        return MemberResponse.model_validate(r.json())
+        return MemberResponse.model_validate_json(r.content)
 
     async def join(self, invite_code: str) -> None:
         await self._http.post("/api/v1/members/join", json={"invite_code": invite_code})
@@ -34,7 +34,7 @@ class MembersAPI:
         if nickname is not None:
             payload["nickname"] = nickname
         r = await self._http.patch(f"/api/v1/members/{user_id}", json=payload)
-        return MemberResponse.model_validate(r.json())
+        return MemberResponse.model_validate_json(r.content)
 
     async def remove(self, user_id: int, *, reason: str | None = None) -> None:
         payload: dict[str, Any] = {}
@@ -51,11 +51,11 @@ class MembersAPI:
         if delete_msg_days is not None:
             payload["delete_msg_days"] = delete_msg_days
         r = await self._http.put(f"/api/v1/bans/{user_id}", json=payload)
-        return BanResponse.model_validate(r.json())
+        return BanResponse.model_validate_json(r.content)
 
     async def unban(self, user_id: int) -> None:
         await self._http.delete(f"/api/v1/bans/{user_id}")
 
     async def list_bans(self, **params: Any) -> BanListResponse:
         r = await self._http.get("/api/v1/bans", params=params)
-        return BanListResponse.model_validate(r.json())
+        return BanListResponse.model_validate_json(r.content)
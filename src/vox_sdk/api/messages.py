@@ -31,11 +31,11 @@ class MessagesAPI:
         if after is not None:
             params["after"] = after
         r = await self._http.get(f"/api/v1/feeds/{feed_id}/messages", params=params)
-        return MessageListResponse.model_validate(r.json())
+        return MessageListResponse.model_validate_json(r.content)
 
     async def get(self, feed_id: int, msg_id: int) -> MessageResponse:
         r = await self._http.get(f"/api/v1/feeds/{feed_id}/messages/{msg_id}")
-        return MessageResponse.model_validate(r.json())
+        return MessageResponse.model_validate_json(r.content)
 
     async def send(
         self,
@@ -62,13 +62,13 @@ class MessagesAPI:
         if opaque_blob is not None:
             payload["opaque_blob"] = opaque_blob
         r = await self._http.post(f"/api/v1/feeds/{feed_id}/messages", json=payload)
-        return SendMessageResponse.model_validate(r.json())
+        return SendMessageResponse.model_validate_json(r.content)
 
     async def edit(self, feed_id: int, msg_id: int, body: str) -> EditMessageResponse:
         r = await self._http.patch(
             f"/api/v1/feeds/{feed_id}/messages/{msg_id}", json={"body": body}
         )
-        return EditMessageResponse.model_validate(r.json())
+        return EditMessageResponse.model_validate_json(r.content)
 
     async def delete(self, feed_id: int, msg_id: int) -> None:
         await self._http.delete(f"/api/v1/feeds/{feed_id}/messages/{msg_id}")
@@ -89,7 +89,7 @@ class MessagesAPI:
         r = await self._http.get(
             f"/api/v1/feeds/{feed_id}/threads/{thread_id}/messages", params=params
         )
-        return MessageListResponse.model_validate(r.json())
+        return MessageListResponse.model_validate_json(r.content)
 
     async def send_thread(
         self, feed_id: int, thread_id: int, body: str | None = None, **kwargs: Any
@@ -101,13 +101,13 @@ class MessagesAPI:
         r = await self._http.post(
             f"/api/v1/feeds/{feed_id}/threads/{thread_id}/messages", json=payload
         )
-        return SendMessageResponse.model_validate(r.json())
+        return SendMessageResponse.model_validate_json(r.content)
 
     # --- Reactions ---
 
     async def list_reactions(self, feed_id: int, msg_id: int) -> ReactionListResponse:
         r = await self._http.get(f"/api/v1/feeds/{feed_id}/messages/{msg_id}/reactions")
-        return ReactionListResponse.model_validate(r.json())
+        return ReactionListResponse.model_validate_json(r.content)
 
     async def add_reaction(self, feed_id: int, msg_id: int, emoji: str) -> None:
         await self._http.put(f"/api/v1/feeds/{feed_id}/messages/{msg_id}/reactions/{emoji}")
@@ -125,4 +125,4 @@ class MessagesAPI:
 
     async def list_pins(self, feed_id: int) -> MessageListResponse:
         r = await self._http.get(f"/api/v1/feeds/{feed_id}/pins")
-        return MessageListResponse.model_validate(r.json())
+        return MessageListResponse.model_validate_json(r.content)
@@ -46,18 +46,18 @@ class ModerationAPI:
         if description is not None:
             payload["description"] = description
         r = await self._http.post("/api/v1/reports", json=payload)
-        return ReportResponse.model_validate(r.json())
+        return ReportResponse.model_validate_json(r.content)
 
     async def list_reports(self, **params: Any) -> ReportListResponse:
         r = await self._http.get("/api/v1/reports", params=params)
-        return ReportListResponse.model_validate(r.json())
+        return ReportListResponse.model_validate_json(r.content)
 
     def iter_reports(self, *, limit: int = 50) -> PaginatedIterator[ReportResponse]:
         return PaginatedIterator(self._http, "/api/v1/reports", ReportResponse, limit=limit)
 
     async def get_report(self, report_id: int) -> ReportDetailResponse:
         r = await self._http.get(f"/api/v1/reports/{report_id}")
-        return ReportDetailResponse.model_validate(r.json())
+        return ReportDetailResponse.model_validate_json(r.content)
 
     async def resolve_report(self, report_id: int, action: str) -> None:
         await self._http.post(
@@ -69,7 +69,7 @@ class ModerationAPI:
 
     async def audit_log(self, **params: Any) -> AuditLogResponse:
         r = await self._http.get("/api/v1/audit-log", params=params)
-        return AuditLogResponse.model_validate(r.json())
+        return AuditLogResponse.model_validate_json(r.content)
 
     async def admin_2fa_reset(self, target_user_id: int, reason: str) -> None:
         await self._http.post(
@@ -18,14 +18,14 @@ class RolesAPI:
 
     async def list(self) -> RoleListResponse:
         r = await self._http.get("/api/v1/roles")
-        return RoleListResponse.model_validate(r.json())
+        return RoleListResponse.model_validate_json(r.content)
 
     def iter_roles(self, *, limit: int = 50) -> PaginatedIterator[RoleResponse]:
         return PaginatedIterator(self._http, "/api/v1/roles", RoleResponse, limit=limit)
 
     async def list_members(self, role_id: int) -> MemberListResponse:
         r = await self._http.get(f"/api/v1/roles/{role_id}/members")
-        return MemberListResponse.model_validate(r.json())
+        return MemberListResponse.model_validate_json(r.content)
 
     async def create(
         self,
@@ -43,7 +43,7 @@ class RolesAPI:
         if color is not None:
             payload["color"] = color
         r = await self._http.post("/api/v1/roles", json=payload)
-        return RoleResponse.model_validate(r.json())
+        return RoleResponse.model_validate_json(r.content)
 
     async def update(
         self,
@@ -64,7 +64,7 @@ class RolesAPI:
         if position is not None:
             payload["position"] = position
         r = await self._http.patch(f"/api/v1/roles/{role_id}", json=payload)
-        return RoleResponse.model_validate(r.json())
+        return RoleResponse.model_validate_json(r.content)
 
     async def delete(self, role_id: int) -> None:
         await self._http.delete(f"/api/v1/roles/{role_id}")
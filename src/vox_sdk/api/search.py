@@ -16,4 +16,4 @@ class SearchAPI:
 
     async def messages(self, **params: Any) -> SearchResponse:
         r = await self._http.get("/api/v1/messages/search", params=params)
-        return SearchResponse.model_validate(r.json())
+        return SearchResponse.model_validate_json(r.content)
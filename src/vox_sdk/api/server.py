@@ -16,7 +16,7 @@ class ServerAPI:
 
     async def info(self) -> ServerInfoResponse:
         r = await self._http.get("/api/v1/server")
-        return ServerInfoResponse.model_validate(r.json())
+        return ServerInfoResponse.model_validate_json(r.content)
 
     async def update(
         self,
@@ -33,15 +33,15 @@ class ServerAPI:
         if description is not None:
             payload["description"] = description
         r = await self._http.patch("/api/v1/server", json=payload)
-        return ServerInfoResponse.model_validate(r.json())
+        return ServerInfoResponse.model_validate_json(r.content)
 
     async def layout(self) -> ServerLayoutResponse:
         r = await self._http.get("/api/v1/server/layout")
-        return ServerLayoutResponse.model_validate(r.json())
+        return ServerLayoutResponse.model_validate_json(r.content)
 
     async def gateway_info(self) -> GatewayInfoResponse:
         r = await self._http.get("/api/v1/gateway")
-        return GatewayInfoResponse.model_validate(r.json())
+        return GatewayInfoResponse.model_validate_json(r.content)
 
     async def get_limits(self) -> dict:
         r = await self._http.get("/api/v1/server/limits")
@@ -30,4 +30,4 @@ class SyncAPI:
         if after is not None:
             payload["after"] = after
         r = await self._http.post("/api/v1/sync", json=payload)
-        return SyncResponse.model_validate(r.json())
+        return SyncResponse.model_validate_json(r.content)
@@ -23,7 +23,7 @@ class UsersAPI:
 
     async def get(self, user_id: int) -> UserResponse:
         r = await self._http.get(f"/api/v1/users/{user_id}")
-        return UserResponse.model_validate(r.json())
+        return UserResponse.model_validate_json(r.content)
 
     async def update_profile(
         self,
@@ -41,17 +41,17 @@ class UsersAPI:
         if bio is not None:
             payload["bio"] = bio
         r = await self._http.patch(f"/api/v1/users/{user_id}", json=payload)
-        return UserResponse.model_validate(r.json())
+        return UserResponse.model_validate_json(r.content)
 
     async def get_presence(self, user_id: int) -> PresenceResponse:
         r = await self._http.get(f"/api/v1/users/{user_id}/presence")
-        return PresenceResponse.model_validate(r.json())
+        return PresenceResponse.model_validate_json(r.content)
 
     # --- Friends ---
 
     async def list_friends(self, user_id: int) -> FriendListResponse:
         r = await self._http.get(f"/api/v1/users/{user_id}/friends")
-        return FriendListResponse.model_validate(r.json())
+        return FriendListResponse.model_validate_json(r.content)
 
     async def add_friend(self, user_id: int, target_id: int) -> None:
         await self._http.put(f"/api/v1/users/{user_id}/friends/{target_id}")
@@ -69,7 +69,7 @@ class UsersAPI:
 
     async def list_blocks(self, user_id: int) -> BlockListResponse:
         r = await self._http.get(f"/api/v1/users/{user_id}/blocks")
-        return BlockListResponse.model_validate(r.json())
+        return BlockListResponse.model_validate_json(r.content)
 
     async def block(self, user_id: int, target_id: int) -> None:
         await self._http.put(f"/api/v1/users/{user_id}/blocks/{target_id}")
@@ -81,10 +81,10 @@ class UsersAPI:
 
     async def get_dm_settings(self, user_id: int) -> DMSettingsResponse:
         r = await self._http.get(f"/api/v1/users/{user_id}/dm-settings")
-        return DMSettingsResponse.model_validate(r.json())
+        return DMSettingsResponse.model_validate_json(r.content)
 
     async def update_dm_settings(self, user_id: int, dm_permission: DMPermission) -> DMSettingsResponse:
         r = await self._http.patch(
             f"/api/v1/users/{user_id}/dm-settings", json={"dm_permission": dm_permission}
         )
-        return DMSettingsResponse.model_validate(r.json())
+        return DMSettingsResponse.model_validate_json(r.content)
@@ -30,7 +30,7 @@ class VoiceAPI:
         """
         try:
             r = await self._http.get("/api/v1/voice/media-cert")
-            return MediaCertResponse.model_validate(r.json())
+            return MediaCertResponse.model_validate_json(r.content)
         except VoxHTTPError as exc:
             if exc.status == 404 and exc.code == ErrorCode.NO_CERT_PINNING:
                 return None
@@ -38,7 +38,7 @@ class VoiceAPI:
 
     async def get_members(self, room_id: int) -> VoiceMembersResponse:
         r = await self._http.get(f"/api/v1/rooms/{room_id}/voice")
-        return VoiceMembersResponse.model_validate(r.json())
+        return VoiceMembersResponse.model_validate_json(r.content)
 
     async def join(
         self, room_id: int, *, self_mute: bool = False, self_deaf: bool = False
@@ -47,14 +47,14 @@ class VoiceAPI:
             f"/api/v1/rooms/{room_id}/voice/join",
             json={"self_mute": self_mute, "self_deaf": self_deaf},
         )
-        return VoiceJoinResponse.model_validate(r.json())
+        return VoiceJoinResponse.model_validate_json(r.content)
 
     async def leave(self, room_id: int) -> None:
         await self._http.post(f"/api/v1/rooms/{room_id}/voice/leave")
 
     async def refresh_token(self, room_id: int) -> MediaTokenResponse:
         r = await self._http.post(f"/api/v1/rooms/{room_id}/voice/token-refresh")
-        return MediaTokenResponse.model_validate(r.json())
+        return MediaTokenResponse.model_validate_json(r.content)
 
     async def kick(self, room_id: int, user_id: int) -> None:
         await self._http.post(
@@ -101,4 +101,4 @@ class VoiceAPI:
         r = await self._http.patch(
             f"/api/v1/rooms/{room_id}/stage/topic", json={"topic": topic}
         )
-        return StageTopicResponse.model_validate(r.json())
+        return StageTopicResponse.model_validate_json(r.content)
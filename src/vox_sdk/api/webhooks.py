@@ -21,15 +21,15 @@ class WebhooksAPI:
         if avatar is not None:
             payload["avatar"] = avatar
         r = await self._http.post(f"/api/v1/feeds/{feed_id}/webhooks", json=payload)
-        return WebhookResponse.model_validate(r.json())
+        return WebhookResponse.model_validate_json(r.content)
 
     async def list(self, feed_id: int) -> WebhookListWrapper:
         r = await self._http.get(f"/api/v1/feeds/{feed_id}/webhooks")
-        return WebhookListWrapper.model_validate(r.json())
+        return WebhookListWrapper.model_validate_json(r.content)
 
     async def get(self, webhook_id: int) -> WebhookListItem:
         r = await self._http.get(f"/api/v1/webhooks/{webhook_id}")
-        return WebhookListItem.model_validate(r.json())
+        return WebhookListItem.model_validate_json(r.content)
 
     async def update(
         self, webhook_id: int, *, name: str | None = None, avatar: str | None = None
@@ -40,7 +40,7 @@ class WebhooksAPI:
         if avatar is not None:
             payload["avatar"] = avatar
         r = await self._http.patch(f"/api/v1/webhooks/{webhook_id}", json=payload)
-        return WebhookListItem.model_validate(r.json())
+        return WebhookListItem.model_validate_json(r.content)
 
     async def delete(self, webhook_id: int) -> None:
         await self._http.delete(f"/api/v1/webhooks/{webhook_id}")
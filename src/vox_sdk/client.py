@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any
 
 from vox_sdk.http import HTTPClient
@@ -23,30 +24,7 @@ class Client:
         self.http = HTTPClient(base_url, token, timeout=timeout)
         self.auth = AuthAPI(self.http)
 
-        # Lazily populated API groups (Phase 2+)
-        self._messages: Any = None
-        self._channels: Any = None
-        self._members: Any = None
-        self._roles: Any = None
-        self._server: Any = None
-        self._users: Any = None
-        self._invites: Any = None
-        self._voice: Any = None
-        self._dms: Any = None
-        self._webhooks: Any = None
-        self._bots: Any = None
-        self._e2ee: Any = None
-        self._moderation: Any = None
-        self._files: Any = None
-        self._federation: Any = None
-        self._search: Any = None
-        self._emoji: Any = None
-        self._sync: Any = None
-        self._embeds: Any = None
-        self._gifs: Any = None
-
         self._gateway: Any = None
-        self._crypto: Any = None
 
     # --- Convenience login ---
 
@@ -57,154 +35,112 @@ class Client:
             self.http.token = result.token
         return result
 
-    # --- API group properties ---
+    # --- API group properties (built on first access) ---
 
-    @property
+    @cached_property
     def messages(self) -> Any:
-        if self._messages is None:
-            from vox_sdk.api.messages import MessagesAPI
-            self._messages = MessagesAPI(self.http)
-        return self._messages
+        from vox_sdk.api.messages import MessagesAPI
+        return MessagesAPI(self.http)
 
-    @property
+    @cached_property
     def channels(self) -> Any:
-        if self._channels is None:
-            from vox_sdk.api.channels import ChannelsAPI
-            self._channels = ChannelsAPI(self.http)
-        return self._channels
+        from vox_sdk.api.channels import ChannelsAPI
+        return ChannelsAPI(self.http)
 
-    @property
+    @cached_property
     def members(self) -> Any:
-        if self._members is None:
-            from vox_sdk.api.members import MembersAPI
-            self._members = MembersAPI(self.http)
-        return self._members
+        from vox_sdk.api.members import MembersAPI
+        return MembersAPI(self.http)
 
-    @property
+    @cached_property
     def roles(self) -> Any:
-        if self._roles is None:
-            from vox_sdk.api.roles import RolesAPI
-            self._roles = RolesAPI(self.http)
-        return self._roles
+        from vox_sdk.api.roles import RolesAPI
+        return RolesAPI(self.http)
 
-    @property
+    @cached_property
     def server(self) -> Any:
-        if self._server is None:
-            from vox_sdk.api.server import ServerAPI
-            self._server = ServerAPI(self.http)
-        return self._server
+        from vox_sdk.api.server import ServerAPI
+        return ServerAPI(self.http)
 
-    @property
+    @cached_property
     def users(self) -> Any:
-        if self._users is None:
-            from vox_sdk.api.users import UsersAPI
-            self._users = UsersAPI(self.http)
-        return self._users
+        from vox_sdk.api.users import UsersAPI
+        return UsersAPI(self.http)
 
-    @property
+    @cached_property
     def invites(self) -> Any:
-        if self._invites is None:
-            from vox_sdk.api.invites import InvitesAPI
-            self._invites = InvitesAPI(self.http)
-        return self._invites
+        from vox_sdk.api.invites import InvitesAPI
+        return InvitesAPI(self.http)
 
-    @property
+    @cached_property
     def voice(self) -> Any:
-        if self._voice is None:
-            from vox_sdk.api.voice import VoiceAPI
-            self._voice = VoiceAPI(self.http)
-        return self._voice
+        from vox_sdk.api.voice import VoiceAPI
+        return VoiceAPI(self.http)
 
-    @property
+    @cached_property
     def dms(self) -> Any:
-        if self._dms is None:
-            from vox_sdk.api.dms import DMsAPI
-            self._dms = DMsAPI(self.http)
-        return self._dms
+        from vox_sdk.api.dms import DMsAPI
+        return DMsAPI(self.http)
 
-    @property
+    @cached_property
     def webhooks(self) -> Any:
-        if self._webhooks is None:
-            from vox_sdk.api.webhooks import WebhooksAPI
-            self._webhooks = WebhooksAPI(self.http)
-        return self._webhooks
+        from vox_sdk.api.webhooks import WebhooksAPI
+        return WebhooksAPI(self.http)
 
-    @property
+    @cached_property
     def bots(self) -> Any:
-        if self._bots is None:
-            from vox_sdk.api.bots import BotsAPI
-            self._bots = BotsAPI(self.http)
-        return self._bots
+        from vox_sdk.api.bots import BotsAPI
+        return BotsAPI(self.http)
 
-    @property
+    @cached_property
     def e2ee(self) -> Any:
-        if self._e2ee is None:
-            from vox_sdk.api.e2ee import E2EEAPI
-            self._e2ee = E2EEAPI(self.http)
-        return self._e2ee
+        from vox_sdk.api.e2ee import E2EEAPI
+        return E2EEAPI(self.http)
 
-    @property
+    @cached_property
     def moderation(self) -> Any:
-        if self._moderation is None:
-            from vox_sdk.api.moderation import ModerationAPI
-            self._moderation = ModerationAPI(self.http)
-        return self._moderation
+        from vox_sdk.api.moderation import ModerationAPI
+        return ModerationAPI(self.http)
 
-    @property
+    @cached_property
     def files(self) -> Any:
-        if self._files is None:
-            from vox_sdk.api.files import FilesAPI
-            self._files = FilesAPI(self.http)
-        return self._files
+        from vox_sdk.api.files import FilesAPI
+        return FilesAPI(self.http)
 
-    @property
+    @cached_property
     def federation(self) -> Any:
-        if self._federation is None:
-            from vox_sdk.api.federation import FederationAPI
-            self._federation = FederationAPI(self.http)
-        return self._federation
+        from vox_sdk.api.federation import FederationAPI
+        return FederationAPI(self.http)
 
-    @property
+    @cached_property
     def search(self) -> Any:
-        if self._search is None:
-            from vox_sdk.api.search import SearchAPI
-            self._search = SearchAPI(self.http)
-        return self._search
+        from vox_sdk.api.search import SearchAPI
+        return SearchAPI(self.http)
 
-    @property
+    @cached_property
     def emoji(self) -> Any:
-        if self._emoji is None:
-            from vox_sdk.api.emoji import EmojiAPI
-            self._emoji = EmojiAPI(self.http)
-        return self._emoji
+        from vox_sdk.api.emoji import EmojiAPI
+        return EmojiAPI(self.http)
 
-    @property
+    @cached_property
     def sync(self) -> Any:
-        if self._sync is None:
-            from vox_sdk.api.sync import SyncAPI
-            self._sync = SyncAPI(self.http)
-        return self._sync
+        from vox_sdk.api.sync import SyncAPI
+        return SyncAPI(self.http)
 
-    @property
+    @cached_property
     def gifs(self) -> Any:
-        if self._gifs is None:
-            from vox_sdk.api.gifs import GifsAPI
-            self._gifs = GifsAPI(self.http)
-        return self._gifs
+        from vox_sdk.api.gifs import GifsAPI
+        return GifsAPI(self.http)
 
-    @property
+    @cached_property
     def embeds(self) -> Any:
-        if self._embeds is None:
-            from vox_sdk.api.embeds import EmbedsAPI
-            self._embeds = EmbedsAPI(self.http)
-        return self._embeds
+        from vox_sdk.api.embeds import EmbedsAPI
+        return EmbedsAPI(self.http)
 
-    @property
+    @cached_property
     def crypto(self) -> Any:
-        if self._crypto is None:
-            from vox_sdk.crypto import CryptoManager
-            self._crypto = CryptoManager(self)
-        return self._crypto
+        from vox_sdk.crypto import CryptoManager
+        return CryptoManager(self)
 
     @property
     def gateway(self) -> Any:
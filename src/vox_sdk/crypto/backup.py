@@ -2,6 +2,15 @@
 
 Uses the cryptography library which is a common dependency.
 Falls back gracefully if not installed.
+
+Backups are base64 text. By default they are written as version 2, a JSON
+envelope that every SDK release can restore. Version 3 is an opt-in, more
+compact binary layout::
+
+    b"VBK" | version (1 byte) | salt (16) | nonce (12) | ciphertext
+
+with the first 20 bytes bound as GCM associated data. Versions 1 and 2 are
+JSON envelopes, and all three versions are accepted for decryption.
 """
 
 from __future__ import annotations
@@ -30,62 +39,88 @@ def _require_crypto() -> None:
 _KDF_PARAMS: dict[int, dict[str, int]] = {
     1: {"n": 2**17, "r": 8, "p": 1},
     2: {"n": 2**17, "r": 8, "p": 1},
+    3: {"n": 2**17, "r": 8, "p": 1},
 }
-_CURRENT_VERSION = 2
+_DEFAULT_VERSION = 2
+_JSON_VERSIONS = {1, 2}
 
+_MAGIC = b"VBK"
+_SALT_LEN = 16
+_NONCE_LEN = 12
+_HEADER_LEN = len(_MAGIC) + 1 + _SALT_LEN
+_MIN_BINARY_LEN = _HEADER_LEN + _NONCE_LEN
 
-def encrypt_backup(data: bytes, passphrase: str) -> str:
-    """Encrypt data with a passphrase. Returns a base64-encoded blob."""
-    _require_crypto()
-
-    params = _KDF_PARAMS[_CURRENT_VERSION]
-    salt = os.urandom(16)
 
+def _derive_key(version: int, salt: bytes, passphrase: str) -> bytes:
+    params = _KDF_PARAMS[version]
     kdf = Scrypt(salt=salt, length=32, n=params["n"], r=params["r"], p=params["p"])
-    key = kdf.derive(passphrase.encode())
+    return kdf.derive(passphrase.encode())
 
-    nonce = os.urandom(12)
-    aesgcm = AESGCM(key)
 
-    # Bind ciphertext to envelope metadata via GCM associated data
-    salt_b64 = base64.b64encode(salt).decode()
-    aad = json.dumps({"v": _CURRENT_VERSION, "salt": salt_b64}, sort_keys=True).encode()
-    ciphertext = aesgcm.encrypt(nonce, data, aad)
+def encrypt_backup(data: bytes, passphrase: str, *, version: int = _DEFAULT_VERSION) -> str:
+    """Encrypt data with a passphrase. Returns a base64-encoded blob.
 
-    envelope = {
-        "v": _CURRENT_VERSION,
-        "salt": salt_b64,
-        "nonce": base64.b64encode(nonce).decode(),
-        "ct": base64.b64encode(ciphertext).decode(),
-    }
-    return base64.b64encode(json.dumps(envelope).encode()).decode()
+    ``version`` selects the format: 2 (JSON envelope, the default) or 3
+    (binary). Only pass 3 when every reader restoring the backup supports it.
+    """
+    _require_crypto()
+    if version not in (2, 3):
+        raise ValueError(f"Unsupported backup format version: {version}")
 
+    salt = os.urandom(_SALT_LEN)
+    key = _derive_key(version, salt, passphrase)
+    nonce = os.urandom(_NONCE_LEN)
 
-def decrypt_backup(blob: str, passphrase: str) -> bytes:
-    """Decrypt a backup blob with a passphrase."""
-    _require_crypto()
+    if version == 2:
+        # Bind ciphertext to envelope metadata via GCM associated data
+        salt_b64 = base64.b64encode(salt).decode()
+        aad = json.dumps({"v": version, "salt": salt_b64}, sort_keys=True).encode()
+        envelope = {
+            "v": version,
+            "salt": salt_b64,
+            "nonce": base64.b64encode(nonce).decode(),
+            "ct": base64.b64encode(AESGCM(key).encrypt(nonce, data, aad)).decode(),
+        }
+        return base64.b64encode(json.dumps(envelope).encode()).decode()
 
-    envelope = json.loads(base64.b64decode(blob))
-    version = envelope.get("v")
-    if version not in _KDF_PARAMS:
-        raise ValueError(f"Unsupported backup format version: {version}")
+    # Bind ciphertext to the header (magic, version, salt) via GCM associated data
+    header = _MAGIC + bytes((version,)) + salt
+    ciphertext = AESGCM(key).encrypt(nonce, data, header)
+    return base64.b64encode(header + nonce + ciphertext).decode()
 
-    params = _KDF_PARAMS[version]
-    salt = base64.b64decode(envelope["salt"])
-    nonce = base64.b64decode(envelope["nonce"])
-    ciphertext = base64.b64decode(envelope["ct"])
 
-    kdf = Scrypt(salt=salt, length=32, n=params["n"], r=params["r"], p=params["p"])
-    key = kdf.derive(passphrase.encode())
+def decrypt_backup(blob: str, passphrase: str) -> bytes:
+    """Decrypt a backup blob with a passphrase."""
+    _require_crypto()
 
-    aesgcm = AESGCM(key)
-    # v1 was encrypted without AAD; v2+ binds ciphertext to envelope metadata
-    if version >= 2:
-        aad = json.dumps({"v": version, "salt": envelope["salt"]}, sort_keys=True).encode()
+    raw = base64.b64decode(blob)
+    if raw[: len(_MAGIC)] == _MAGIC:
+        version = raw[len(_MAGIC)]
+        if version in _JSON_VERSIONS or version not in _KDF_PARAMS:
+            raise ValueError(f"Unsupported backup format version: {version}")
+        if len(raw) < _MIN_BINARY_LEN:
+            raise ValueError("Backup blob is truncated")
+        aad: bytes | None = raw[:_HEADER_LEN]
+        salt = raw[len(_MAGIC) + 1 : _HEADER_LEN]
+        nonce = raw[_HEADER_LEN:_MIN_BINARY_LEN]
+        ciphertext = raw[_MIN_BINARY_LEN:]
     else:
-        aad = None
+        envelope = json.loads(raw)
+        version = envelope.get("v")
+        if version not in _JSON_VERSIONS:
+            raise ValueError(f"Unsupported backup format version: {version}")
+        salt = base64.b64decode(envelope["salt"])
+        nonce = base64.b64decode(envelope["nonce"])
+        ciphertext = base64.b64decode(envelope["ct"])
+        # v1 was encrypted without AAD; v2 binds ciphertext to envelope metadata
+        if version >= 2:
+            aad = json.dumps({"v": version, "salt": envelope["salt"]}, sort_keys=True).encode()
+        else:
+            aad = None
+
+    key = _derive_key(version, salt, passphrase)
     try:
-        return aesgcm.decrypt(nonce, ciphertext, aad)
+        return AESGCM(key).decrypt(nonce, ciphertext, aad)
     except Exception as exc:
         raise ValueError(
             "Decryption failed — wrong passphrase or corrupted backup"
@@ -24,11 +24,40 @@ except ImportError:
     zstd = None  # type: ignore[assignment]
     _zstd_decompressor = None  # type: ignore[assignment]
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        # Decode so websockets sends a text frame, as with json.dumps
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson rejects non-str keys and ints wider than 64 bits
+            return json.dumps(obj)
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 EventHandler = Callable[[GatewayEvent], Coroutine[Any, Any, None]]
 
 _MAX_BACKOFF = 60.0
 _BASE_BACKOFF = 1.0
 
+# Fixed-schema client frames, filled in with %-formatting instead of
+# building and serializing a dict per send
+_HEARTBEAT_FRAME = '{"type":"heartbeat"}'
+_RESUME_FRAME = '{"type":"resume","d":{"token":%s,"session_id":%s,"last_seq":%d}}'
+_TYPING_FRAME = '{"type":"typing_start","d":{"feed_id":%d}}'
+_PRESENCE_FRAME = '{"type":"presence_update","d":{"status":%s}}'
+_PRESENCE_CUSTOM_FRAME = (
+    '{"type":"presence_update","d":{"status":%s,"custom_status":%s}}'
+)
+
+# Events _run handles itself, so they are parsed even with no handlers registered
+_PROTOCOL_EVENTS = frozenset({"hello", "ready", "resumed", "heartbeat_ack"})
+
 
 class GatewayClient:
     """Manages the WebSocket connection to the Vox gateway.
@@ -61,6 +90,12 @@ class GatewayClient:
         self._url = ws_url + (f"?{'&'.join(params)}" if params else "")
         self._token = token
         self._protocol_version = protocol_version
+        # Connection frames are fixed per client; serialize them once
+        self._token_json = _json_dumps(token)
+        self._identify_frame = _json_dumps({
+            "type": "identify",
+            "d": {"token": token, "protocol_version": protocol_version},
+        })
         self._compress = compress and _zstd_decompressor is not None
 
         self._ws: Any = None
@@ -69,22 +104,26 @@ class GatewayClient:
         self._heartbeat_interval: float = 45.0
         self._heartbeat_task: asyncio.Task | None = None
         self._last_heartbeat_ack: float = 0.0
-        self._handlers: dict[str, list[EventHandler]] = {}
+        # Tuples: rebuilt on registration (rare), iterated on every event
+        self._handlers: dict[str, tuple[EventHandler, ...]] = {}
         self._closed = False
         self._ready_event: asyncio.Event = asyncio.Event()
         self._ready_data: Ready | None = None
         self._connect_error: BaseException | None = None
 
     def on(self, event_type: str) -> Callable[[EventHandler], EventHandler]:
-        """Decorator to register an event handler."""
+        """Decorator to register an event handler.
+
+        Handlers matching the same event (including ``"*"``) run concurrently.
+        """
         def decorator(func: EventHandler) -> EventHandler:
-            self._handlers.setdefault(event_type, []).append(func)
+            self.add_handler(event_type, func)
             return func
         return decorator
 
     def add_handler(self, event_type: str, handler: EventHandler) -> None:
         """Register an event handler programmatically."""
-        self._handlers.setdefault(event_type, []).append(handler)
+        self._handlers[event_type] = (*self._handlers.get(event_type, ()), handler)
 
     @property
     def session_id(self) -> str | None:
@@ -181,22 +220,28 @@ class GatewayClient:
         payload: dict[str, Any] = {"type": msg_type}
         if data:
             payload["d"] = data
+        await self._send_frame(_json_dumps(payload))
+
+    async def _send_frame(self, frame: str) -> None:
         if self._ws is None:
             raise VoxGatewayError(4000, "Not connected")
-        await self._ws.send(json.dumps(payload))
+        await self._ws.send(frame)
 
     async def send_typing(self, feed_id: int) -> None:
         """Send a typing indicator for a feed."""
-        await self.send("typing_start", {"feed_id": feed_id})
+        await self._send_frame(_TYPING_FRAME % int(feed_id))
 
     async def update_presence(
         self, status: str, custom_status: str | None = None
     ) -> None:
         """Update the client's presence status."""
-        data: dict[str, Any] = {"status": status}
-        if custom_status is not None:
-            data["custom_status"] = custom_status
-        await self.send("presence_update", data)
+        if custom_status is None:
+            frame = _PRESENCE_FRAME % _json_dumps(status)
+        else:
+            frame = _PRESENCE_CUSTOM_FRAME % (
+                _json_dumps(status), _json_dumps(custom_status),
+            )
+        await self._send_frame(frame)
 
     async def send_mls_relay(self, mls_type: str, data: str) -> None:
         """Relay an MLS message (welcome, commit, or proposal) to the server."""
@@ -212,16 +257,11 @@ class GatewayClient:
 
         # Step 2: Identify or resume
         if self._session_id:
-            await self.send("resume", {
-                "token": self._token,
-                "session_id": self._session_id,
-                "last_seq": self._seq,
-            })
+            await self._send_frame(_RESUME_FRAME % (
+                self._token_json, _json_dumps(self._session_id), self._seq,
+            ))
         else:
-            await self.send("identify", {
-                "token": self._token,
-                "protocol_version": self._protocol_version,
-            })
+            await self._send_frame(self._identify_frame)
 
         # Step 3: Start heartbeat
         self._last_heartbeat_ack = asyncio.get_event_loop().time()
@@ -231,7 +271,21 @@ class GatewayClient:
         try:
             while not self._closed:
                 raw = await self._recv(ws)
+                if not isinstance(raw, dict):
+                    log.warning("Ignoring non-object gateway frame: %r", raw)
+                    continue
                 try:
+                    event_type = raw.get("type")
+                    if (
+                        event_type not in _PROTOCOL_EVENTS
+                        and event_type not in self._handlers
+                        and "*" not in self._handlers
+                    ):
+                        # Nobody is listening: track seq, skip building the event
+                        seq = raw.get("seq")
+                        if seq is not None:
+                            self._seq = seq
+                        continue
                     event = parse_event(raw)
                 except Exception:
                     log.exception("Failed to parse event: %s", raw.get("type", "?"))
@@ -262,10 +316,9 @@ class GatewayClient:
         """Receive and decode a message, handling zstd compression."""
         msg = await ws.recv()
         if isinstance(msg, bytes) and self._compress and _zstd_decompressor:
-            msg = _zstd_decompressor.decompress(msg).decode()
-        if isinstance(msg, bytes):
-            msg = msg.decode()
-        return json.loads(msg)
+            msg = _zstd_decompressor.decompress(msg)
+        # Both json.loads and orjson.loads accept UTF-8 bytes directly
+        return _json_loads(msg)
 
     async def _heartbeat_loop(self, ws: Any) -> None:
         try:
@@ -279,15 +332,28 @@ class GatewayClient:
                     log.warning("Heartbeat ACK timeout, closing connection")
                     await ws.close()
                     return
-                await self.send("heartbeat")
+                await self._send_frame(_HEARTBEAT_FRAME)
         except asyncio.CancelledError:
             pass
 
     async def _dispatch(self, event: GatewayEvent) -> None:
-        handlers = self._handlers.get(event.type, [])
-        wildcard = self._handlers.get("*", [])
-        for handler in [*handlers, *wildcard]:
+        handlers = self._handlers.get(event.type, ()) + self._handlers.get("*", ())
+        if not handlers:
+            return
+        if len(handlers) == 1:
             try:
-                await handler(event)
+                await handlers[0](event)
             except Exception:
                 log.exception("Error in event handler for %s", event.type)
+            return
+        # Run independent handlers concurrently; one failing doesn't stop the rest
+        results = await asyncio.gather(
+            *(handler(event) for handler in handlers), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                log.error(
+                    "Error in event handler for %s", event.type, exc_info=result
+                )
+            elif isinstance(result, BaseException):
+                raise result
@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
 
 from vox_sdk.errors import VoxHTTPError, VoxNetworkError
-from vox_sdk.rate_limit import RateLimiter
+from vox_sdk.rate_limit import RateLimiter, classify
 
 _MAX_RETRIES = 3
 _BASE_RETRY_DELAY = 1.0
 _RETRYABLE_STATUSES = {500, 502, 503, 504}
 
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=300
+)
+
 
 class HTTPClient:
     """Async HTTP client for the Vox REST API."""
@@ -24,13 +29,21 @@ class HTTPClient:
         token: str | None = None,
         *,
         timeout: float = 30.0,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self._token = token
+        self._base_headers = self._auth_headers(token)
+        # Used for retry backoff only; injectable so tests can skip the waits
+        self._sleep = sleep
         self._rate_limiter = RateLimiter()
+        # One AsyncClient per HTTPClient: its connections belong to the event
+        # loop that opens them, so sharing one across Clients breaks when a
+        # Client is used under a different loop.
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=timeout,
+            limits=_POOL_LIMITS,
         )
 
     @property
@@ -40,12 +53,11 @@ class HTTPClient:
     @token.setter
     def token(self, value: str | None) -> None:
         self._token = value
+        self._base_headers = self._auth_headers(value)
 
-    def _headers(self) -> dict[str, str]:
-        h: dict[str, str] = {}
-        if self._token:
-            h["Authorization"] = f"Bearer {self._token}"
-        return h
+    @staticmethod
+    def _auth_headers(token: str | None) -> dict[str, str]:
+        return {"Authorization": f"Bearer {token}"} if token else {}
 
     async def request(
         self,
@@ -59,12 +71,12 @@ class HTTPClient:
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         """Make an API request with rate-limit awareness and 429 retry."""
-        merged_headers = self._headers()
-        if headers:
-            merged_headers.update(headers)
+        # httpx copies headers into the request, so the cached dict can go out as-is
+        merged_headers = {**self._base_headers, **headers} if headers else self._base_headers
 
+        category = classify(path)
         for attempt in range(_MAX_RETRIES):
-            await self._rate_limiter.wait_if_needed(path)
+            await self._rate_limiter._wait_for_category(category)
 
             try:
                 response = await self._client.request(
@@ -79,7 +91,7 @@ class HTTPClient:
             except httpx.TransportError as exc:
                 raise VoxNetworkError(str(exc)) from exc
 
-            self._rate_limiter.update_from_response(path, response)
+            self._rate_limiter._update_category(category, response)
 
             if response.status_code == 429:
                 retry_after = _BASE_RETRY_DELAY
@@ -93,13 +105,13 @@ class HTTPClient:
                     if ra_header:
                         retry_after = float(ra_header)
                 if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(retry_after)
+                    await self._sleep(retry_after)
                     continue
                 raise VoxHTTPError.from_response(response)
 
             if response.status_code in _RETRYABLE_STATUSES:
                 if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(_BASE_RETRY_DELAY * (2 ** attempt))
+                    await self._sleep(_BASE_RETRY_DELAY * (2 ** attempt))
                     continue
                 raise VoxHTTPError.from_response(response)
 
@@ -1,119 +1,245 @@
-"""SDK response models."""
+"""SDK response models.
 
-from vox_sdk.models.base import VoxModel
-from vox_sdk.models.errors import ErrorCode, ErrorResponse
+Model classes are imported lazily on first attribute access (PEP 562), so
+``from vox_sdk.models import VoiceJoinResponse`` only loads the submodule that
+defines it.
+"""
 
-from vox_sdk.models.auth import (
-    LoginResponse,
-    MFARequiredResponse,
-    MFASetupConfirmResponse,
-    MFASetupResponse,
-    MFAStatusResponse,
-    RegisterResponse,
-    SessionInfo,
-    SessionListResponse,
-    SuccessResponse,
-    WebAuthnChallengeResponse,
-    WebAuthnCredentialResponse,
-)
-from vox_sdk.models.bots import (
-    CommandListResponse,
-    CommandParam,
-    CommandResponse,
-    Embed,
-    EmbedField,
-    OkResponse,
-    WebhookListItem,
-    WebhookListWrapper,
-    WebhookResponse,
-)
-from vox_sdk.models.enums import DMPermission, FeedType, OverrideTargetType, RoomType
-from vox_sdk.models.channels import (
-    CategoryListResponse,
-    CategoryResponse,
-    FeedResponse,
-    PermissionOverrideOutput,
-    RoomResponse,
-    ThreadListResponse,
-    ThreadResponse,
-)
-from vox_sdk.models.dms import DMListResponse, DMResponse
-from vox_sdk.models.e2ee import (
-    AddDeviceResponse,
-    DeviceInfo,
-    DeviceListResponse,
-    DevicePrekey,
-    KeyBackupResponse,
-    PairDeviceResponse,
-    PrekeyBundleResponse,
-)
-from vox_sdk.models.emoji import (
-    EmojiListResponse,
-    EmojiResponse,
-    StickerListResponse,
-    StickerResponse,
-)
-from vox_sdk.models.federation import (
-    FederatedDevicePrekey,
-    FederatedPrekeyResponse,
-    FederatedUserProfile,
-    FederationJoinResponse,
-)
-from vox_sdk.models.files import FileResponse
-from vox_sdk.models.invites import (
-    InviteListResponse,
-    InvitePreviewResponse,
-    InviteResponse,
-)
-from vox_sdk.models.members import (
-    BanListResponse,
-    BanResponse,
-    MemberListResponse,
-    MemberResponse,
-)
-from vox_sdk.models.messages import (
-    EditMessageResponse,
-    MessageListResponse,
-    MessageResponse,
-    ReactionGroup,
-    ReactionListResponse,
-    SearchResponse,
-    SendMessageResponse,
-)
-from vox_sdk.models.moderation import (
-    AuditLogEntry,
-    AuditLogResponse,
-    ReportDetailResponse,
-    ReportListResponse,
-    ReportResponse,
-)
-from vox_sdk.models.roles import RoleListResponse, RoleResponse
-from vox_sdk.models.server import (
-    CategoryInfo,
-    FeedInfo,
-    GatewayInfoResponse,
-    PermissionOverrideData,
-    RoomInfo,
-    ServerInfoResponse,
-    ServerLayoutResponse,
-)
-from vox_sdk.models.sync import ReadState, SyncEvent, SyncResponse
-from vox_sdk.models.users import (
-    BlockListResponse,
-    DMSettingsResponse,
-    FriendListResponse,
-    FriendResponse,
-    PresenceResponse,
-    UserResponse,
-)
-from vox_sdk.models.voice import (
-    MediaCertResponse,
-    MediaTokenResponse,
-    StageTopicResponse,
-    VoiceJoinResponse,
-    VoiceMemberData,
-    VoiceMembersResponse,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from vox_sdk.models.auth import (
+        LoginResponse,
+        MFARequiredResponse,
+        MFASetupConfirmResponse,
+        MFASetupResponse,
+        MFAStatusResponse,
+        RegisterResponse,
+        SessionInfo,
+        SessionListResponse,
+        SuccessResponse,
+        WebAuthnChallengeResponse,
+        WebAuthnCredentialResponse,
+    )
+    from vox_sdk.models.base import VoxModel
+    from vox_sdk.models.bots import (
+        CommandListResponse,
+        CommandParam,
+        CommandResponse,
+        Embed,
+        EmbedField,
+        OkResponse,
+        WebhookListItem,
+        WebhookListWrapper,
+        WebhookResponse,
+    )
+    from vox_sdk.models.channels import (
+        CategoryListResponse,
+        CategoryResponse,
+        FeedResponse,
+        PermissionOverrideOutput,
+        RoomResponse,
+        ThreadListResponse,
+        ThreadResponse,
+    )
+    from vox_sdk.models.dms import DMListResponse, DMResponse
+    from vox_sdk.models.e2ee import (
+        AddDeviceResponse,
+        DeviceInfo,
+        DeviceListResponse,
+        DevicePrekey,
+        KeyBackupResponse,
+        PairDeviceResponse,
+        PrekeyBundleResponse,
+    )
+    from vox_sdk.models.emoji import (
+        EmojiListResponse,
+        EmojiResponse,
+        StickerListResponse,
+        StickerResponse,
+    )
+    from vox_sdk.models.enums import DMPermission, FeedType, OverrideTargetType, RoomType
+    from vox_sdk.models.errors import ErrorCode, ErrorResponse
+    from vox_sdk.models.federation import (
+        FederatedDevicePrekey,
+        FederatedPrekeyResponse,
+        FederatedUserProfile,
+        FederationJoinResponse,
+    )
+    from vox_sdk.models.files import FileResponse
+    from vox_sdk.models.invites import (
+        InviteListResponse,
+        InvitePreviewResponse,
+        InviteResponse,
+    )
+    from vox_sdk.models.members import (
+        BanListResponse,
+        BanResponse,
+        MemberListResponse,
+        MemberResponse,
+    )
+    from vox_sdk.models.messages import (
+        EditMessageResponse,
+        MessageListResponse,
+        MessageResponse,
+        ReactionGroup,
+        ReactionListResponse,
+        SearchResponse,
+        SendMessageResponse,
+    )
+    from vox_sdk.models.moderation import (
+        AuditLogEntry,
+        AuditLogResponse,
+        ReportDetailResponse,
+        ReportListResponse,
+        ReportResponse,
+    )
+    from vox_sdk.models.roles import RoleListResponse, RoleResponse
+    from vox_sdk.models.server import (
+        CategoryInfo,
+        FeedInfo,
+        GatewayInfoResponse,
+        PermissionOverrideData,
+        RoomInfo,
+        ServerInfoResponse,
+        ServerLayoutResponse,
+    )
+    from vox_sdk.models.sync import ReadState, SyncEvent, SyncResponse
+    from vox_sdk.models.users import (
+        BlockListResponse,
+        DMSettingsResponse,
+        FriendListResponse,
+        FriendResponse,
+        PresenceResponse,
+        UserResponse,
+    )
+    from vox_sdk.models.voice import (
+        MediaCertResponse,
+        MediaTokenResponse,
+        StageTopicResponse,
+        VoiceJoinResponse,
+        VoiceMemberData,
+        VoiceMembersResponse,
+    )
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "VoxModel": "base",
+    "ErrorCode": "errors",
+    "ErrorResponse": "errors",
+    # enums
+    "DMPermission": "enums",
+    "FeedType": "enums",
+    "OverrideTargetType": "enums",
+    "RoomType": "enums",
+    # auth
+    "LoginResponse": "auth",
+    "MFARequiredResponse": "auth",
+    "MFASetupConfirmResponse": "auth",
+    "MFASetupResponse": "auth",
+    "MFAStatusResponse": "auth",
+    "RegisterResponse": "auth",
+    "SessionInfo": "auth",
+    "SessionListResponse": "auth",
+    "SuccessResponse": "auth",
+    "WebAuthnChallengeResponse": "auth",
+    "WebAuthnCredentialResponse": "auth",
+    # bots
+    "CommandListResponse": "bots",
+    "CommandParam": "bots",
+    "CommandResponse": "bots",
+    "Embed": "bots",
+    "EmbedField": "bots",
+    "OkResponse": "bots",
+    "WebhookListItem": "bots",
+    "WebhookListWrapper": "bots",
+    "WebhookResponse": "bots",
+    # channels
+    "CategoryListResponse": "channels",
+    "CategoryResponse": "channels",
+    "FeedResponse": "channels",
+    "PermissionOverrideOutput": "channels",
+    "RoomResponse": "channels",
+    "ThreadListResponse": "channels",
+    "ThreadResponse": "channels",
+    # dms
+    "DMListResponse": "dms",
+    "DMResponse": "dms",
+    # e2ee
+    "AddDeviceResponse": "e2ee",
+    "DeviceInfo": "e2ee",
+    "DeviceListResponse": "e2ee",
+    "DevicePrekey": "e2ee",
+    "KeyBackupResponse": "e2ee",
+    "PairDeviceResponse": "e2ee",
+    "PrekeyBundleResponse": "e2ee",
+    # emoji
+    "EmojiListResponse": "emoji",
+    "EmojiResponse": "emoji",
+    "StickerListResponse": "emoji",
+    "StickerResponse": "emoji",
+    # federation
+    "FederatedDevicePrekey": "federation",
+    "FederatedPrekeyResponse": "federation",
+    "FederatedUserProfile": "federation",
+    "FederationJoinResponse": "federation",
+    # files
+    "FileResponse": "files",
+    # invites
+    "InviteListResponse": "invites",
+    "InvitePreviewResponse": "invites",
+    "InviteResponse": "invites",
+    # members
+    "BanListResponse": "members",
+    "BanResponse": "members",
+    "MemberListResponse": "members",
+    "MemberResponse": "members",
+    # messages
+    "EditMessageResponse": "messages",
+    "MessageListResponse": "messages",
+    "MessageResponse": "messages",
+    "ReactionGroup": "messages",
+    "ReactionListResponse": "messages",
+    "SearchResponse": "messages",
+    "SendMessageResponse": "messages",
+    # moderation
+    "AuditLogEntry": "moderation",
+    "AuditLogResponse": "moderation",
+    "ReportDetailResponse": "moderation",
+    "ReportListResponse": "moderation",
+    "ReportResponse": "moderation",
+    # roles
+    "RoleListResponse": "roles",
+    "RoleResponse": "roles",
+    # server
+    "CategoryInfo": "server",
+    "FeedInfo": "server",
+    "GatewayInfoResponse": "server",
+    "PermissionOverrideData": "server",
+    "RoomInfo": "server",
+    "ServerInfoResponse": "server",
+    "ServerLayoutResponse": "server",
+    # sync
+    "ReadState": "sync",
+    "SyncEvent": "sync",
+    "SyncResponse": "sync",
+    # users
+    "BlockListResponse": "users",
+    "DMSettingsResponse": "users",
+    "FriendListResponse": "users",
+    "FriendResponse": "users",
+    "PresenceResponse": "users",
+    "UserResponse": "users",
+    # voice
+    "MediaCertResponse": "voice",
+    "MediaTokenResponse": "voice",
+    "StageTopicResponse": "voice",
+    "VoiceJoinResponse": "voice",
+    "VoiceMemberData": "voice",
+    "VoiceMembersResponse": "voice",
+}
 
 __all__ = [
     "VoxModel",
@@ -230,3 +356,16 @@ __all__ = [
     "VoiceMemberData",
     "VoiceMembersResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class GatewayEvent:
     """Base for all gateway events."""
     type: str
@@ -16,11 +16,11 @@ class GatewayEvent:
 
 # --- Control ---
 
-@dataclass
+@dataclass(slots=True)
 class Hello(GatewayEvent):
     heartbeat_interval: int = 45000
 
-@dataclass
+@dataclass(slots=True)
 class Ready(GatewayEvent):
     session_id: str = ""
     user_id: int = 0
@@ -31,14 +31,14 @@ class Ready(GatewayEvent):
     protocol_version: int = 1
     capabilities: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class Resumed(GatewayEvent):
     pass  # seq is on base
 
 
 # --- Messages ---
 
-@dataclass
+@dataclass(slots=True)
 class MessageCreate(GatewayEvent):
     msg_id: int = 0
     feed_id: int | None = None
@@ -53,7 +53,7 @@ class MessageCreate(GatewayEvent):
     attachments: list[dict] = field(default_factory=list)
     opaque_blob: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class MessageUpdate(GatewayEvent):
     msg_id: int = 0
     feed_id: int | None = None
@@ -61,30 +61,30 @@ class MessageUpdate(GatewayEvent):
     body: str | None = None
     edit_timestamp: int | None = None
 
-@dataclass
+@dataclass(slots=True)
 class MessageDelete(GatewayEvent):
     msg_id: int = 0
     feed_id: int | None = None
     dm_id: int | None = None
 
-@dataclass
+@dataclass(slots=True)
 class MessageBulkDelete(GatewayEvent):
     feed_id: int = 0
     msg_ids: list[int] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class MessageReactionAdd(GatewayEvent):
     msg_id: int = 0
     user_id: int = 0
     emoji: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class MessageReactionRemove(GatewayEvent):
     msg_id: int = 0
     user_id: int = 0
     emoji: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class MessagePinUpdate(GatewayEvent):
     msg_id: int = 0
     feed_id: int = 0
@@ -93,38 +93,38 @@ class MessagePinUpdate(GatewayEvent):
 
 # --- Members ---
 
-@dataclass
+@dataclass(slots=True)
 class MemberJoin(GatewayEvent):
     user_id: int = 0
     username: str = ""
     display_name: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class MemberLeave(GatewayEvent):
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class MemberUpdate(GatewayEvent):
     user_id: int = 0
     nickname: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class UserUpdate(GatewayEvent):
     user_id: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class MemberBan(GatewayEvent):
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class MemberUnban(GatewayEvent):
     user_id: int = 0
 
 
 # --- Channels ---
 
-@dataclass
+@dataclass(slots=True)
 class FeedCreate(GatewayEvent):
     feed_id: int = 0
     name: str = ""
@@ -132,68 +132,68 @@ class FeedCreate(GatewayEvent):
     topic: str | None = None
     category_id: int | None = None
 
-@dataclass
+@dataclass(slots=True)
 class FeedUpdate(GatewayEvent):
     feed_id: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class FeedDelete(GatewayEvent):
     feed_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class RoomCreate(GatewayEvent):
     room_id: int = 0
     name: str = ""
     channel_type: str | None = None
     category_id: int | None = None
 
-@dataclass
+@dataclass(slots=True)
 class RoomUpdate(GatewayEvent):
     room_id: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class RoomDelete(GatewayEvent):
     room_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class CategoryCreate(GatewayEvent):
     category_id: int = 0
     name: str = ""
     position: int | None = None
 
-@dataclass
+@dataclass(slots=True)
 class CategoryUpdate(GatewayEvent):
     category_id: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class CategoryDelete(GatewayEvent):
     category_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class ThreadCreate(GatewayEvent):
     thread_id: int = 0
     parent_feed_id: int = 0
     name: str = ""
     parent_msg_id: int | None = None
 
-@dataclass
+@dataclass(slots=True)
 class ThreadUpdate(GatewayEvent):
     thread_id: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class ThreadDelete(GatewayEvent):
     thread_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class ThreadSubscribe(GatewayEvent):
     thread_id: int = 0
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class ThreadUnsubscribe(GatewayEvent):
     thread_id: int = 0
     user_id: int = 0
@@ -201,7 +201,7 @@ class ThreadUnsubscribe(GatewayEvent):
 
 # --- Roles ---
 
-@dataclass
+@dataclass(slots=True)
 class RoleCreate(GatewayEvent):
     role_id: int = 0
     name: str = ""
@@ -209,16 +209,16 @@ class RoleCreate(GatewayEvent):
     permissions: int = 0
     position: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class RoleUpdate(GatewayEvent):
     role_id: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class RoleDelete(GatewayEvent):
     role_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class PermissionOverrideUpdate(GatewayEvent):
     space_type: str = ""
     space_id: int = 0
@@ -227,19 +227,19 @@ class PermissionOverrideUpdate(GatewayEvent):
     allow: int = 0
     deny: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class PermissionOverrideDelete(GatewayEvent):
     space_type: str = ""
     space_id: int = 0
     target_type: str = ""
     target_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class RoleAssign(GatewayEvent):
     role_id: int = 0
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class RoleRevoke(GatewayEvent):
     role_id: int = 0
     user_id: int = 0
@@ -247,82 +247,82 @@ class RoleRevoke(GatewayEvent):
 
 # --- Emoji/Sticker ---
 
-@dataclass
+@dataclass(slots=True)
 class EmojiCreate(GatewayEvent):
     emoji_id: int = 0
     name: str = ""
     creator_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class EmojiUpdate(GatewayEvent):
     emoji_id: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class EmojiDelete(GatewayEvent):
     emoji_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class StickerCreate(GatewayEvent):
     sticker_id: int = 0
     name: str = ""
     creator_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class StickerUpdate(GatewayEvent):
     sticker_id: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class StickerDelete(GatewayEvent):
     sticker_id: int = 0
 
 
 # --- Server ---
 
-@dataclass
+@dataclass(slots=True)
 class ServerUpdate(GatewayEvent):
     extra: dict[str, Any] = field(default_factory=dict)
 
 
 # --- Invites ---
 
-@dataclass
+@dataclass(slots=True)
 class InviteCreate(GatewayEvent):
     code: str = ""
     creator_id: int = 0
     feed_id: int | None = None
 
-@dataclass
+@dataclass(slots=True)
 class InviteDelete(GatewayEvent):
     code: str = ""
 
 
 # --- DMs ---
 
-@dataclass
+@dataclass(slots=True)
 class DMCreate(GatewayEvent):
     dm_id: int = 0
     participant_ids: list[int] = field(default_factory=list)
     is_group: bool = False
     name: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class DMUpdate(GatewayEvent):
     dm_id: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class DMRecipientAdd(GatewayEvent):
     dm_id: int = 0
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class DMRecipientRemove(GatewayEvent):
     dm_id: int = 0
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class DMReadNotify(GatewayEvent):
     dm_id: int = 0
     user_id: int = 0
@@ -331,13 +331,13 @@ class DMReadNotify(GatewayEvent):
 
 # --- Presence ---
 
-@dataclass
+@dataclass(slots=True)
 class TypingStart(GatewayEvent):
     user_id: int = 0
     feed_id: int | None = None
     dm_id: int | None = None
 
-@dataclass
+@dataclass(slots=True)
 class PresenceUpdate(GatewayEvent):
     user_id: int = 0
     status: str = ""
@@ -347,32 +347,32 @@ class PresenceUpdate(GatewayEvent):
 
 # --- Friends/Blocks ---
 
-@dataclass
+@dataclass(slots=True)
 class FriendRequest(GatewayEvent):
     user_id: int = 0
     target_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class FriendAdd(GatewayEvent):
     user_id: int = 0
     target_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class FriendReject(GatewayEvent):
     user_id: int = 0
     target_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class FriendRemove(GatewayEvent):
     user_id: int = 0
     target_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class BlockAdd(GatewayEvent):
     user_id: int = 0
     target_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class BlockRemove(GatewayEvent):
     user_id: int = 0
     target_id: int = 0
@@ -380,48 +380,48 @@ class BlockRemove(GatewayEvent):
 
 # --- Voice/Stage ---
 
-@dataclass
+@dataclass(slots=True)
 class VoiceStateUpdate(GatewayEvent):
     room_id: int = 0
     members: list[dict] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class VoiceCodecNeg(GatewayEvent):
     media_type: str = ""
     codec: str = ""
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class StageRequest(GatewayEvent):
     room_id: int = 0
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class StageInvite(GatewayEvent):
     room_id: int = 0
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class StageInviteDecline(GatewayEvent):
     room_id: int = 0
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class StageRevoke(GatewayEvent):
     room_id: int = 0
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class StageTopicUpdate(GatewayEvent):
     room_id: int = 0
     topic: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class StageResponse(GatewayEvent):
     user_id: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class MediaTokenRefresh(GatewayEvent):
     room_id: int = 0
     media_token: str = ""
@@ -429,100 +429,100 @@ class MediaTokenRefresh(GatewayEvent):
 
 # --- E2EE ---
 
-@dataclass
+@dataclass(slots=True)
 class MLSWelcome(GatewayEvent):
     data: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class MLSCommit(GatewayEvent):
     data: str = ""
     group_id: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class MLSProposal(GatewayEvent):
     data: str = ""
     group_id: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class DeviceListUpdate(GatewayEvent):
     devices: list[dict] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class DevicePairPrompt(GatewayEvent):
     device_name: str = ""
     ip: str = ""
     location: str = ""
     pair_id: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class CPaceISI(GatewayEvent):
     pair_id: str = ""
     data: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class CPaceRSI(GatewayEvent):
     pair_id: str = ""
     data: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class CPaceConfirm(GatewayEvent):
     pair_id: str = ""
     data: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class CPaceNewDeviceKey(GatewayEvent):
     pair_id: str = ""
     data: str = ""
     nonce: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class KeyResetNotify(GatewayEvent):
     user_id: int = 0
 
 
 # --- Webhooks ---
 
-@dataclass
+@dataclass(slots=True)
 class WebhookCreate(GatewayEvent):
     webhook_id: int = 0
     feed_id: int = 0
     name: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class WebhookUpdate(GatewayEvent):
     webhook_id: int = 0
     extra: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class WebhookDelete(GatewayEvent):
     webhook_id: int = 0
 
 
 # --- Bots ---
 
-@dataclass
+@dataclass(slots=True)
 class BotCommandsUpdate(GatewayEvent):
     bot_id: int = 0
     commands: list[dict] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class BotCommandsDelete(GatewayEvent):
     bot_id: int = 0
     command_names: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class InteractionCreate(GatewayEvent):
     interaction: dict = field(default_factory=dict)
 
 
 # --- Feed Subscription ---
 
-@dataclass
+@dataclass(slots=True)
 class FeedSubscribe(GatewayEvent):
     feed_id: int = 0
     user_id: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class FeedUnsubscribe(GatewayEvent):
     feed_id: int = 0
     user_id: int = 0
@@ -530,7 +530,7 @@ class FeedUnsubscribe(GatewayEvent):
 
 # --- Notifications ---
 
-@dataclass
+@dataclass(slots=True)
 class NotificationCreate(GatewayEvent):
     user_id: int = 0
     notification_type: str = ""
@@ -635,50 +635,49 @@ _EVENT_MAP: dict[str, type[GatewayEvent]] = {
     "notification_create": NotificationCreate,
 }
 
-# Known fields for each event type (event-specific, excluding base fields)
-_KNOWN_FIELDS: dict[str, set[str]] = {}
-# Event types where the subclass re-declares "type" as a data field
-# Events whose payload includes a "type" key that maps to `channel_type`
-# on the dataclass (e.g. FeedCreate, RoomCreate).
-_HAS_CHANNEL_TYPE: set[str] = set()
+# Per-type parse spec, computed once at import:
+# (dataclass, known payload fields, has an ``extra`` field,
+#  field that receives the payload's own "type" key or None)
+_EVENT_TABLE: dict[str, tuple[type[GatewayEvent], frozenset[str], bool, str | None]] = {}
 for _name, _cls in _EVENT_MAP.items():
     _own = {f.name for f in _cls.__dataclass_fields__.values()}
-    _KNOWN_FIELDS[_name] = _own - {"type", "seq", "raw"}
-    if "channel_type" in _own:
-        _HAS_CHANNEL_TYPE.add(_name)
+    if _name == "notification_create":
+        # notification_create uses "type" in data for the notification type
+        _type_field: str | None = "notification_type"
+    elif "channel_type" in _own:
+        # Payloads whose "type" is a channel/room kind (e.g. FeedCreate, RoomCreate)
+        _type_field = "channel_type"
+    else:
+        _type_field = None
+    _EVENT_TABLE[_name] = (
+        _cls, frozenset(_own - {"type", "seq", "raw"}), "extra" in _own, _type_field,
+    )
 
 
 def parse_event(raw: dict[str, Any]) -> GatewayEvent:
     """Parse a raw gateway message into a typed event dataclass."""
     event_type = raw.get("type", "")
     seq = raw.get("seq")
-    data = raw.get("d", {}) or {}
 
-    cls = _EVENT_MAP.get(event_type)
-    if cls is None:
+    spec = _EVENT_TABLE.get(event_type)
+    if spec is None:
         return GatewayEvent(type=event_type, seq=seq, raw=raw)
-
-    known = _KNOWN_FIELDS.get(event_type, set())
-    kwargs: dict[str, Any] = {}
-    extra: dict[str, Any] = {}
-
-    for key, val in data.items():
-        if key in known:
-            kwargs[key] = val
-        else:
-            extra[key] = val
-
-    # For events with an "extra" field, stuff unknown keys there
-    if "extra" in {f.name for f in cls.__dataclass_fields__.values()}:
+    cls, known, has_extra, type_field = spec
+
+    data = raw.get("d") or {}
+    if has_extra:
+        kwargs: dict[str, Any] = {}
+        extra: dict[str, Any] = {}
+        for key, val in data.items():
+            if key in known:
+                kwargs[key] = val
+            else:
+                extra[key] = val
         kwargs["extra"] = extra
+    else:
+        kwargs = {key: val for key, val in data.items() if key in known}
 
-    # Special case: notification_create uses "type" in data for notification type
-    if event_type == "notification_create" and "type" in data:
-        kwargs["notification_type"] = data["type"]
-
-    # For events whose payload includes "type" as a channel/room kind
-    # (e.g. FeedCreate, RoomCreate), map it to the `channel_type` field.
-    if event_type in _HAS_CHANNEL_TYPE and "type" in data:
-        kwargs["channel_type"] = data["type"]
+    if type_field is not None and "type" in data:
+        kwargs[type_field] = data["type"]
 
     return cls(type=event_type, seq=seq, raw=raw, **kwargs)
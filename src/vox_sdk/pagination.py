@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, AsyncIterator, TypeVar
+from collections import deque
+from collections.abc import AsyncIterator
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
 
@@ -11,10 +13,19 @@ from vox_sdk.http import HTTPClient
 T = TypeVar("T", bound=BaseModel)
 
 
+class _Page(BaseModel, Generic[T]):
+    """Response envelope; validated straight from the response bytes."""
+
+    items: list[T] = []
+    cursor: str | None = None
+
+
 class PaginatedIterator(AsyncIterator[T]):
     """Yields items across cursor-paginated API responses.
 
     Expects response bodies with ``items`` (list) and ``cursor`` (str | None).
+    A page is requested only when the caller asks for an item past the end of
+    the previous one, so stopping early never costs an extra request.
     """
 
     def __init__(
@@ -29,9 +40,10 @@ class PaginatedIterator(AsyncIterator[T]):
         self._http = http
         self._path = path
         self._model = model
+        self._page_model = _Page[model]  # type: ignore[valid-type]
         self._params = dict(params) if params else {}
         self._limit = limit
-        self._buffer: list[T] = []
+        self._buffer: deque[T] = deque()
         self._cursor: str | None = None
         self._exhausted = False
         self._started = False
@@ -40,31 +52,32 @@ class PaginatedIterator(AsyncIterator[T]):
         return self
 
     async def __anext__(self) -> T:
-        if self._buffer:
-            return self._buffer.pop(0)
-        if self._exhausted:
-            raise StopAsyncIteration
-        await self._fetch_page()
         if not self._buffer:
-            raise StopAsyncIteration
-        return self._buffer.pop(0)
+            if self._exhausted:
+                raise StopAsyncIteration
+            await self._fetch_page()
+            if not self._buffer:
+                raise StopAsyncIteration
+        return self._buffer.popleft()
 
     async def _fetch_page(self) -> None:
         params = {**self._params, "limit": self._limit}
         if self._cursor:
             params["cursor"] = self._cursor
         r = await self._http.get(self._path, params=params)
-        data = r.json()
-        items = data.get("items", [])
-        self._buffer = [self._model.model_validate(item) for item in items]
-        self._cursor = data.get("cursor")
-        if not self._cursor or not items:
+        page = self._page_model.model_validate_json(r.content)
+        self._buffer.extend(page.items)
+        self._cursor = page.cursor
+        if not self._cursor or not page.items:
             self._exhausted = True
         self._started = True
 
     async def flatten(self) -> list[T]:
         """Consume the full iterator into a list."""
-        result: list[T] = []
-        async for item in self:
-            result.append(item)
+        result: list[T] = list(self._buffer)
+        self._buffer.clear()
+        while not self._exhausted:
+            await self._fetch_page()
+            result.extend(self._buffer)
+            self._buffer.clear()
         return result
@@ -6,6 +6,9 @@ Provides a :class:`Permissions` wrapper for convenient bitfield manipulation.
 
 from __future__ import annotations
 
+from itertools import islice
+from typing import ClassVar
+
 
 # --- Bit flags (keep in sync with server vox/permissions.py) ---
 
@@ -92,6 +95,13 @@ _BIT_NAMES: dict[int, str] = {
     ADMINISTRATOR: "ADMINISTRATOR",
 }
 
+# Union of the named bits (distinct single bits, so the sum is their OR);
+# unnamed bits are masked off before iterating
+_NAMED_BITS = sum(_BIT_NAMES)
+
+# Keyword lookup for Permissions.from_kwargs: lowercase name -> bit value
+_NAME_TO_BIT: dict[str, int] = {name.lower(): bit for bit, name in _BIT_NAMES.items()}
+
 
 class Permissions:
     """Wraps a permission bitfield with convenient accessors.
@@ -127,6 +137,11 @@ class Permissions:
 
     __slots__ = ("_value",)
 
+    # Shared instances for the factories below; Permissions is immutable
+    _NONE: ClassVar[Permissions]
+    _ALL: ClassVar[Permissions]
+    _EVERYONE_DEFAULTS: ClassVar[Permissions]
+
     def __init__(self, value: int = 0) -> None:
         self._value = int(value)
 
@@ -135,17 +150,17 @@ class Permissions:
     @classmethod
     def none(cls) -> Permissions:
         """Return an empty permission set."""
-        return cls(0)
+        return cls._NONE if cls is Permissions else cls(0)
 
     @classmethod
     def all(cls) -> Permissions:
         """Return a permission set with every bit set."""
-        return cls(ALL_PERMISSIONS)
+        return cls._ALL if cls is Permissions else cls(ALL_PERMISSIONS)
 
     @classmethod
     def everyone_defaults(cls) -> Permissions:
         """Return the default @everyone permission set."""
-        return cls(EVERYONE_DEFAULTS)
+        return cls._EVERYONE_DEFAULTS if cls is Permissions else cls(EVERYONE_DEFAULTS)
 
     @classmethod
     def from_kwargs(cls, **flags: bool) -> Permissions:
@@ -155,13 +170,13 @@ class Permissions:
 
             Permissions.from_kwargs(send_messages=True, administrator=True)
         """
-        _name_to_bit = {name.lower(): bit for bit, name in _BIT_NAMES.items()}
         value = 0
         for key, enabled in flags.items():
-            if key not in _name_to_bit:
+            bit = _NAME_TO_BIT.get(key)
+            if bit is None:
                 raise ValueError(f"Unknown permission flag: {key!r}")
             if enabled:
-                value |= _name_to_bit[key]
+                value |= bit
         return cls(value)
 
     # --- Core accessors ---
@@ -176,17 +191,15 @@ class Permissions:
 
         If the ADMINISTRATOR bit is set, always returns ``True``.
         """
-        if self._value & ADMINISTRATOR:
-            return True
+        value = self._value
         required = permissions._value if isinstance(permissions, Permissions) else int(permissions)
-        return (self._value & required) == required
+        # Plain bit check first; the ADMINISTRATOR bypass only matters when it fails
+        return (value & required) == required or (value & ADMINISTRATOR) != 0
 
     def has_any(self, permissions: int | Permissions) -> bool:
         """Return ``True`` if *any* bit in ``permissions`` is set."""
-        if self._value & ADMINISTRATOR:
-            return True
         required = permissions._value if isinstance(permissions, Permissions) else int(permissions)
-        return bool(self._value & required)
+        return (self._value & (required | ADMINISTRATOR)) != 0
 
     # --- Bitwise operators ---
 
@@ -225,17 +238,21 @@ class Permissions:
 
     def __iter__(self):
         """Yield the name of each set permission flag."""
-        for bit, name in _BIT_NAMES.items():
-            if self._value & bit:
-                yield name
+        # Visit only the set bits, lowest first: v & -v isolates the lowest one
+        v = self._value & _NAMED_BITS
+        while v:
+            lsb = v & -v
+            yield _BIT_NAMES[lsb]
+            v ^= lsb
 
     def __repr__(self) -> str:
         if self._value == 0:
             return "Permissions(0)"
-        names = list(self)
-        if len(names) <= 5:
-            return f"Permissions({' | '.join(names)})"
-        return f"Permissions({' | '.join(names[:4])} | ... +{len(names) - 4} more)"
+        # Count via popcount so at most five names are looked up
+        count = (self._value & _NAMED_BITS).bit_count()
+        if count <= 5:
+            return f"Permissions({' | '.join(self)})"
+        return f"Permissions({' | '.join(islice(self, 4))} | ... +{count - 4} more)"
 
     def __str__(self) -> str:
         return repr(self)
@@ -247,6 +264,11 @@ class Permissions:
     # --- Equality & hashing ---
 
     def __eq__(self, other: object) -> bool:
+        # Identity covers the shared factory instances; exact int is the common raw case
+        if self is other:
+            return True
+        if type(other) is int:
+            return self._value == other
         if isinstance(other, Permissions):
             return self._value == other._value
         if isinstance(other, int):
@@ -261,3 +283,8 @@ class Permissions:
 
     def __bool__(self) -> bool:
         return self._value != 0
+
+
+Permissions._NONE = Permissions(0)
+Permissions._ALL = Permissions(ALL_PERMISSIONS)
+Permissions._EVERYONE_DEFAULTS = Permissions(EVERYONE_DEFAULTS)
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import re
 import time
 from dataclasses import dataclass, field
+from typing import cast
 
 import httpx
 
@@ -38,24 +40,33 @@ _PREFIX_MAP: list[tuple[str, str]] = [
     ("/api/v1/users", "members"),
 ]
 
+_PREFIX_CATEGORIES = dict(_PREFIX_MAP)
+
+# One anchored scan in the same precedence order as the rules above:
+# "/messages" anywhere, then "/search" anywhere, then the first matching prefix.
+_CLASSIFY_RE = re.compile(
+    r"(?P<messages>(?=.*/messages))"
+    r"|(?P<search>(?=.*/search))"
+    r"|(?P<prefix>" + "|".join(re.escape(prefix) for prefix, _ in _PREFIX_MAP) + ")",
+    re.DOTALL,
+)
+
 
 def classify(path: str) -> str:
     """Map a URL path to a rate-limit category."""
-    if "/messages" in path:
-        return "messages"
-    if "/search" in path:
-        return "search"
-    for prefix, cat in _PREFIX_MAP:
-        if path.startswith(prefix):
-            return cat
-    return "server"
+    m = _CLASSIFY_RE.match(path)
+    if m is None:
+        return "server"
+    if m.lastgroup == "prefix":
+        return _PREFIX_CATEGORIES[m.group("prefix")]
+    return cast(str, m.lastgroup)
 
 
 # ---------------------------------------------------------------------------
 # Bucket info parsed from response headers
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class BucketInfo:
     limit: int = 0
     remaining: int = 0
@@ -74,19 +85,23 @@ class RateLimiter:
         self._locks: dict[str, asyncio.Lock] = {}
 
     def _lock_for(self, category: str) -> asyncio.Lock:
-        if category not in self._locks:
-            self._locks[category] = asyncio.Lock()
-        return self._locks[category]
+        lock = self._locks.get(category)
+        if lock is None:
+            lock = self._locks[category] = asyncio.Lock()
+        return lock
 
     def update_from_response(self, path: str, response: httpx.Response) -> None:
         """Update bucket info from X-RateLimit-* headers."""
+        self._update_category(classify(path), response)
+
+    def _update_category(self, category: str, response: httpx.Response) -> None:
+        """Like :meth:`update_from_response`, for an already-classified path."""
         headers = response.headers
         limit = headers.get("x-ratelimit-limit")
-        remaining = headers.get("x-ratelimit-remaining")
-        reset = headers.get("x-ratelimit-reset")
         if limit is None:
             return
-        category = classify(path)
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
         self._buckets[category] = BucketInfo(
             limit=int(limit),
             remaining=int(remaining) if remaining else 0,
@@ -95,7 +110,10 @@ class RateLimiter:
 
     async def wait_if_needed(self, path: str) -> None:
         """Sleep if the bucket for this path is exhausted."""
-        category = classify(path)
+        await self._wait_for_category(classify(path))
+
+    async def _wait_for_category(self, category: str) -> None:
+        """Like :meth:`wait_if_needed`, for an already-classified path."""
         bucket = self._buckets.get(category)
         if bucket is None:
             return
@@ -0,0 +1,66 @@
+"""Micro-benchmarks for the gateway frame path.
+
+Not collected by the default run (the file doesn't match ``test_*.py``).
+Run explicitly, without xdist:
+
+    pytest tests/bench_gateway.py -n 0 --no-cov --benchmark-only
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from helpers import HELLO_FRAME, PARSE_CASES, FakeWebSocket, dump_frame
+
+from vox_sdk.errors import VoxGatewayError
+from vox_sdk.gateway import GatewayClient
+from vox_sdk.models.events import parse_event
+
+_RAWS = [
+    {"type": event_type, "seq": i, "d": data}
+    for i, (event_type, _, data, _, _) in enumerate(PARSE_CASES)
+]
+
+_RUN_FRAMES = (HELLO_FRAME,) + tuple(
+    dump_frame({
+        "type": "message_create", "seq": i,
+        "d": {"msg_id": i, "feed_id": 1, "author_id": 2, "body": "hi", "timestamp": i},
+    })
+    for i in range(1, 10_001)
+)
+
+
+@pytest.mark.benchmark(group="parse")
+def test_parse_event(benchmark):
+    """parse_event over every parametrized event type, one call each."""
+    def parse_all():
+        for raw in _RAWS:
+            parse_event(raw)
+    benchmark(parse_all)
+
+
+async def _run_script(gw: GatewayClient, ws: FakeWebSocket) -> None:
+    with pytest.raises(VoxGatewayError):
+        await gw._run(ws)
+
+
+@pytest.mark.benchmark(group="run")
+def test_run_10k_frames(benchmark):
+    """_run draining 10k message_create frames into one handler."""
+    received = []
+
+    def setup():
+        ws = FakeWebSocket(_RUN_FRAMES)
+        gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
+        gw._ws = ws
+
+        @gw.on("message_create")
+        async def on_message(event):
+            received.append(event.msg_id)
+
+        return (_run_script(gw, ws),), {}
+
+    benchmark.pedantic(asyncio.run, setup=setup, rounds=5)
+    assert len(received) == 5 * 10_000
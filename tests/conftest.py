@@ -2,55 +2,88 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
+from helpers import Call, RecordingTransport
 
 from vox_sdk.http import HTTPClient
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
+
+if uvloop is not None:
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
 
 @pytest.fixture
 def mock_transport():
-    """Returns an httpx mock transport that records requests."""
-    calls: list[dict[str, Any]] = []
-    default_response = httpx.Response(200, json={})
-
-    class RecordingTransport(httpx.AsyncBaseTransport):
-        def __init__(self):
-            self.response = default_response
-
-        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
-            body = None
-            if request.content:
-                try:
-                    body = json.loads(request.content)
-                except Exception:
-                    body = request.content
-            calls.append({
-                "method": request.method,
-                "url": str(request.url),
-                "path": request.url.path,
-                "headers": dict(request.headers),
-                "body": body,
-            })
-            return self.response
-
-    transport = RecordingTransport()
-    return transport, calls
+    """Returns an httpx mock transport that records requests, and its calls."""
+    calls: list[Call] = []
+    return RecordingTransport(calls), calls
+
+
+@pytest.fixture
+def register_response(mock_transport):
+    """Register a canned response for a ``(method, path)`` pair."""
+    transport, _calls = mock_transport
+    return transport.register
+
+
+@pytest.fixture
+def mock_async_client(mock_transport):
+    """An httpx.AsyncClient routed through the mock transport."""
+    transport, _calls = mock_transport
+    return httpx.AsyncClient(base_url="https://vox.test", transport=transport)
+
+
+@pytest.fixture
+def attach_transport(mock_async_client):
+    """Point a Client's HTTP layer at the mock transport; returns the client."""
+    def attach(client: Any) -> Any:
+        client.http._client = mock_async_client
+        return client
+    return attach
 
 
 @pytest.fixture
-def http_client(mock_transport):
+def http_client(mock_transport, mock_async_client):
     """HTTPClient with a mock transport."""
     transport, calls = mock_transport
     client = HTTPClient("https://vox.test", token="test-token")
     # Replace the inner httpx client with one using our mock transport
-    client._client = httpx.AsyncClient(
-        base_url="https://vox.test",
-        transport=transport,
-    )
+    client._client = mock_async_client
     return client, transport, calls
+
+
+async def _no_sleep(delay: float) -> None:
+    pass
+
+
+@pytest.fixture
+async def make_client():
+    """Build HTTPClients answering via ``handler(request)``; all closed at teardown.
+
+    ``handler`` may be sync or async, as with ``httpx.MockTransport``. Retry
+    backoff doesn't actually wait.
+    """
+    clients: list[HTTPClient] = []
+
+    def make(handler: Any) -> HTTPClient:
+        client = HTTPClient("https://vox.test", token="t", sleep=_no_sleep)
+        client._client = httpx.AsyncClient(
+            base_url="https://vox.test", transport=httpx.MockTransport(handler)
+        )
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.close()
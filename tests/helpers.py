@@ -0,0 +1,208 @@
+"""Helpers shared by the SDK tests: mock HTTP transport and scripted gateway frames."""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from typing import Any
+
+import httpx
+import websockets.exceptions
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def json_response(
+    status_code: int, data: Any, headers: dict[str, str] | None = None
+) -> httpx.Response:
+    """Build a canned JSON response, serialized with orjson when available."""
+    if orjson is not None:
+        content = orjson.dumps(data)
+    else:
+        content = json.dumps(data, separators=(",", ":")).encode()
+    return httpx.Response(
+        status_code,
+        content=content,
+        headers={"content-type": "application/json", **headers} if headers else _JSON_HEADERS,
+    )
+
+
+_UNSET: Any = object()
+
+
+class Call:
+    """A request recorded by the mock transport.
+
+    A plain slotted class holding only the request. The url and other fields
+    are read from it on access, and the decoded body is cached on first use.
+    ``headers`` is the request's own case-insensitive ``httpx.Headers``.
+    """
+
+    __slots__ = ("_body", "request")
+
+    def __init__(self, request: httpx.Request) -> None:
+        self.request = request
+        self._body: Any = _UNSET
+
+    def __repr__(self) -> str:
+        return f"Call({self.method} {self.url})"
+
+    @property
+    def method(self) -> str:
+        return self.request.method
+
+    @property
+    def url(self) -> str:
+        return str(self.request.url)
+
+    @property
+    def path(self) -> str:
+        return self.request.url.path
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self.request.headers
+
+    @property
+    def body(self) -> Any:
+        if self._body is _UNSET:
+            content = self.request.content
+            if not content:
+                self._body = None
+            else:
+                try:
+                    self._body = _json_loads(content)
+                except ValueError:
+                    # Not JSON (e.g. multipart); both decoders raise ValueError subclasses
+                    self._body = content
+        return self._body
+
+
+class RecordingTransport(httpx.MockTransport):
+    """Mock transport that records requests into ``calls``.
+
+    Canned responses are looked up by ``(method, path)`` in ``responses``;
+    anything unregistered gets ``response``. Routes set up with ``queue``
+    take precedence and replay their effects in order.
+    """
+
+    def __init__(self, calls: list[Call]) -> None:
+        super().__init__(self._handle)
+        self.calls = calls
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget recorded calls and canned responses."""
+        self.calls.clear()
+        self.response = httpx.Response(200, json={})
+        self.responses: dict[tuple[str, str], httpx.Response] = {}
+        self.queued: dict[tuple[str, str], deque[httpx.Response | Exception]] = {}
+
+    def register(self, method: str, path: str, response: httpx.Response) -> None:
+        self.responses[(method, path)] = response
+
+    def queue(self, method: str, path: str, *effects: httpx.Response | Exception) -> None:
+        """Answer successive requests with ``effects``; exceptions are raised.
+
+        The last effect repeats once the others are used up.
+        """
+        self.queued[(method, path)] = deque(effects)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(Call(request))
+        key = (request.method, request.url.path)
+        effects = self.queued.get(key)
+        if effects:
+            effect = effects.popleft() if len(effects) > 1 else effects[0]
+            if isinstance(effect, Exception):
+                raise effect
+            return effect
+        return self.responses.get(key, self.response)
+
+
+# ---------------------------------------------------------------------------
+# Gateway: scripted websocket and frames
+# ---------------------------------------------------------------------------
+
+def dump_frame(obj: Any) -> bytes:
+    """Serialize a gateway frame as the server would send it."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+# Shared end-of-script error, built once rather than per recv()
+_CONNECTION_CLOSED = websockets.exceptions.ConnectionClosed(None, None)
+
+
+class FakeWebSocket:
+    """Mimics a websockets connection for testing _run() directly.
+
+    ``frames`` are pre-serialized payloads (see ``dump_frame``).
+    """
+
+    def __init__(self, frames: tuple[bytes | str, ...] = ()):
+        self._frames = tuple(frames)
+        self._cursor = 0
+        self.sent_raw: list[bytes | str] = []
+        self._closed = False
+
+    @property
+    def sent(self) -> list[dict]:
+        """Sent frames, decoded on access."""
+        return [_json_loads(data) for data in self.sent_raw]
+
+    async def recv(self):
+        if self._cursor >= len(self._frames):
+            # Drop the previous raise's traceback so frames don't pile up
+            raise _CONNECTION_CLOSED.with_traceback(None)
+        frame = self._frames[self._cursor]
+        self._cursor += 1
+        return frame
+
+    async def send(self, data):
+        self.sent_raw.append(data)
+
+    async def close(self):
+        self._closed = True
+
+
+HELLO_FRAME = dump_frame({"type": "hello", "d": {"heartbeat_interval": 30000}})
+
+# (event_type, dataclass name, payload, field to check, expected value)
+PARSE_CASES = [
+    ("message_update", "MessageUpdate", {"msg_id": 1, "body": "edited"}, "msg_id", 1),
+    ("message_delete", "MessageDelete", {"msg_id": 1, "feed_id": 2}, "msg_id", 1),
+    ("member_join", "MemberJoin", {"user_id": 5, "display_name": "New"}, "user_id", 5),
+    ("member_leave", "MemberLeave", {"user_id": 5}, "user_id", 5),
+    ("feed_create", "FeedCreate", {"feed_id": 1, "name": "general"}, "feed_id", 1),
+    (
+        "role_create", "RoleCreate",
+        {"role_id": 1, "name": "Admin", "color": 0xFF0000, "permissions": 8, "position": 0},
+        "color", 0xFF0000,
+    ),
+    ("dm_create", "DMCreate", {"dm_id": 1, "participant_ids": [1, 2]}, "dm_id", 1),
+    ("typing_start", "TypingStart", {"user_id": 1, "feed_id": 5}, "user_id", 1),
+    ("presence_update", "PresenceUpdate", {"user_id": 1, "status": "online"}, "user_id", 1),
+    ("voice_state_update", "VoiceStateUpdate", {"room_id": 1, "members": []}, "room_id", 1),
+    (
+        "webhook_create", "WebhookCreate",
+        {"webhook_id": 1, "feed_id": 2, "name": "wh"}, "webhook_id", 1,
+    ),
+    (
+        "emoji_create", "EmojiCreate",
+        {"emoji_id": 1, "name": "fire", "creator_id": 2}, "emoji_id", 1,
+    ),
+    (
+        "interaction_create", "InteractionCreate",
+        {"interaction": {"id": "int-1"}}, "interaction", {"id": "int-1"},
+    ),
+    ("resumed", "Resumed", {}, None, None),
+]
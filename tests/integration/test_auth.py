@@ -8,7 +8,7 @@ from vox_sdk.models.auth import RegisterResponse
 
 from .conftest import register
 
-pytestmark = pytest.mark.anyio
+pytestmark = pytest.mark.asyncio
 
 
 class TestAuth:
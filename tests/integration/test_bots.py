@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from .conftest import make_sdk_client, register
 
-pytestmark = pytest.mark.anyio
+pytestmark = pytest.mark.asyncio
 
 
 async def _make_bot(app, db_session: AsyncSession, owner_sdk, owner_reg):
@@ -9,7 +9,7 @@ from vox_sdk.models.events import Ready
 
 from .conftest import make_live_sdk_client, register_live
 
-pytestmark = pytest.mark.anyio
+pytestmark = pytest.mark.asyncio
 
 
 class TestGateway:
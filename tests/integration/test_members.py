@@ -4,7 +4,7 @@ import pytest
 
 from .conftest import make_sdk_client, register
 
-pytestmark = pytest.mark.anyio
+pytestmark = pytest.mark.asyncio
 
 
 class TestMembers:
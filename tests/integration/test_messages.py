@@ -6,7 +6,7 @@ from vox_sdk import VoxHTTPError
 
 from .conftest import register
 
-pytestmark = pytest.mark.anyio
+pytestmark = pytest.mark.asyncio
 
 
 class TestMessages:
@@ -13,7 +13,7 @@ from vox_sdk.gateway import GatewayClient  # noqa: E402
 
 from .conftest import make_live_sdk_client, register_live  # noqa: E402
 
-pytestmark = pytest.mark.anyio
+pytestmark = pytest.mark.asyncio
 
 
 class TestMlsRelay:
@@ -6,7 +6,7 @@ from vox_sdk import VoxHTTPError
 
 from .conftest import make_sdk_client, register
 
-pytestmark = pytest.mark.anyio
+pytestmark = pytest.mark.asyncio
 
 
 class TestVoice:
@@ -28,33 +28,50 @@ from vox_sdk.api.emoji import EmojiAPI
 from vox_sdk.api.sync import SyncAPI
 
 
+_EXPECTED_APIS = {
+    "messages": MessagesAPI,
+    "channels": ChannelsAPI,
+    "members": MembersAPI,
+    "roles": RolesAPI,
+    "server": ServerAPI,
+    "users": UsersAPI,
+    "invites": InvitesAPI,
+    "voice": VoiceAPI,
+    "dms": DMsAPI,
+    "webhooks": WebhooksAPI,
+    "bots": BotsAPI,
+    "e2ee": E2EEAPI,
+    "moderation": ModerationAPI,
+    "files": FilesAPI,
+    "federation": FederationAPI,
+    "search": SearchAPI,
+    "emoji": EmojiAPI,
+    "sync": SyncAPI,
+}
+
+
+@pytest.fixture
+async def fresh_client():
+    """A logged-out Client, closed on teardown."""
+    client = Client("https://vox.test")
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+async def mock_client(attach_transport):
+    """A Client wired to the mock transport, closed on teardown."""
+    client = attach_transport(Client("https://vox.test"))
+    yield client
+    await client.close()
+
+
 class TestLazyAPIProperties:
     def test_lazy_api_properties(self):
         """Each API property returns the correct type and is cached."""
         client = Client("https://vox.test")
 
-        expected = {
-            "messages": MessagesAPI,
-            "channels": ChannelsAPI,
-            "members": MembersAPI,
-            "roles": RolesAPI,
-            "server": ServerAPI,
-            "users": UsersAPI,
-            "invites": InvitesAPI,
-            "voice": VoiceAPI,
-            "dms": DMsAPI,
-            "webhooks": WebhooksAPI,
-            "bots": BotsAPI,
-            "e2ee": E2EEAPI,
-            "moderation": ModerationAPI,
-            "files": FilesAPI,
-            "federation": FederationAPI,
-            "search": SearchAPI,
-            "emoji": EmojiAPI,
-            "sync": SyncAPI,
-        }
-
-        for prop_name, expected_type in expected.items():
+        for prop_name, expected_type in _EXPECTED_APIS.items():
             first = getattr(client, prop_name)
             assert isinstance(first, expected_type), f"{prop_name} should be {expected_type.__name__}"
             second = getattr(client, prop_name)
@@ -74,81 +91,52 @@ class TestContextManager:
 
 class TestLogin:
     @pytest.mark.asyncio
-    async def test_login_stores_token(self, mock_transport):
+    async def test_login_stores_token(self, register_response, mock_client):
         """login() sets http.token on success."""
-        transport, calls = mock_transport
-        transport.response = httpx.Response(
+        register_response("POST", "/api/v1/auth/login", httpx.Response(
             200,
             json={"token": "tok-abc", "user_id": 1, "display_name": "Alice", "roles": []},
-        )
-
-        client = Client("https://vox.test")
-        client.http._client = httpx.AsyncClient(
-            base_url="https://vox.test", transport=transport,
-        )
+        ))
 
-        result = await client.login("alice", "password123")
-        assert client.http.token == "tok-abc"
+        result = await mock_client.login("alice", "password123")
+        assert mock_client.http.token == "tok-abc"
         assert result.token == "tok-abc"
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_login_mfa_does_not_store_token(self, mock_transport):
+    async def test_login_mfa_does_not_store_token(self, register_response, mock_client):
         """When MFA is required, token is NOT set."""
-        transport, calls = mock_transport
-        transport.response = httpx.Response(
+        register_response("POST", "/api/v1/auth/login", httpx.Response(
             200,
             json={
                 "mfa_required": True,
                 "mfa_ticket": "ticket-xyz",
                 "available_methods": ["totp"],
             },
-        )
-
-        client = Client("https://vox.test")
-        client.http._client = httpx.AsyncClient(
-            base_url="https://vox.test", transport=transport,
-        )
+        ))
 
-        result = await client.login("alice", "password123")
-        assert client.http.token is None
+        result = await mock_client.login("alice", "password123")
+        assert mock_client.http.token is None
         assert result.mfa_ticket == "ticket-xyz"
-        await client.close()
 
 
 class TestLoginErrors:
     @pytest.mark.asyncio
-    async def test_login_error_propagates(self, mock_transport):
+    async def test_login_error_propagates(self, register_response, mock_client):
         """A 401 from login raises VoxHTTPError and token stays None."""
         from vox_sdk.errors import VoxHTTPError
 
-        transport, calls = mock_transport
-        transport.response = httpx.Response(
+        register_response("POST", "/api/v1/auth/login", httpx.Response(
             401,
             json={"error": {"code": "AUTH_FAILED", "message": "Invalid credentials."}},
-        )
-
-        client = Client("https://vox.test")
-        client.http._client = httpx.AsyncClient(
-            base_url="https://vox.test", transport=transport,
-        )
+        ))
 
         with pytest.raises(VoxHTTPError) as exc_info:
-            await client.login("alice", "wrong")
+            await mock_client.login("alice", "wrong")
         assert exc_info.value.status == 401
-        assert client.http.token is None
-        await client.close()
+        assert mock_client.http.token is None
 
 
 class TestCloseClient:
-    @pytest.mark.asyncio
-    async def test_close_without_gateway(self):
-        """Close works cleanly when no gateway is connected."""
-        client = Client("https://vox.test")
-        assert client._gateway is None
-        await client.close()
-        assert client.http._client.is_closed
-
     @pytest.mark.asyncio
     async def test_close_with_gateway(self):
         """Close calls close() on both gateway and http."""
@@ -163,27 +151,20 @@ class TestCloseClient:
 
 class TestTokenPropagation:
     @pytest.mark.asyncio
-    async def test_token_propagates_to_api_groups(self, mock_transport):
+    async def test_token_propagates_to_api_groups(self, register_response, mock_client):
         """API groups use the client's HTTP client (and thus its token)."""
-        transport, calls = mock_transport
-        transport.response = httpx.Response(200, json={
+        register_response("POST", "/api/v1/auth/login", httpx.Response(200, json={
             "token": "tok-abc", "user_id": 1, "display_name": "Alice", "roles": [],
-        })
-
-        client = Client("https://vox.test")
-        client.http._client = httpx.AsyncClient(
-            base_url="https://vox.test", transport=transport,
-        )
+        }))
 
-        await client.login("alice", "password123")
+        await mock_client.login("alice", "password123")
         # Token should be set
-        assert client.http.token == "tok-abc"
+        assert mock_client.http.token == "tok-abc"
 
         # API groups should share the same HTTP client
-        assert client.messages._http is client.http
-        assert client.channels._http is client.http
-        assert client.roles._http is client.http
-        await client.close()
+        assert mock_client.messages._http is mock_client.http
+        assert mock_client.channels._http is mock_client.http
+        assert mock_client.roles._http is mock_client.http
 
 
 class TestConstructorTimeout:
@@ -194,11 +175,16 @@ class TestConstructorTimeout:
         assert client.http._client.timeout.read == 5.0
 
 
-class TestConnectGateway:
+class TestLoggedOutClient:
     @pytest.mark.asyncio
-    async def test_connect_gateway_requires_login(self):
-        """Calling connect_gateway() without token raises RuntimeError."""
-        client = Client("https://vox.test")
+    async def test_close_without_gateway(self, fresh_client):
+        """A client with no token and no gateway closes cleanly."""
+        assert fresh_client._gateway is None
+        await fresh_client.close()
+        assert fresh_client.http._client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_connect_without_token(self, fresh_client):
+        """A client with no token refuses to open a gateway."""
         with pytest.raises(RuntimeError, match="Must be logged in"):
-            await client.connect_gateway()
-        await client.close()
+            await fresh_client.connect_gateway()
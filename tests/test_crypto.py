@@ -7,7 +7,17 @@ import json
 
 import pytest
 
-pytestmark = pytest.mark.anyio
+from vox_sdk.crypto.backup import decrypt_backup, encrypt_backup
+
+try:
+    import cryptography
+except ImportError:
+    cryptography = None  # type: ignore[assignment]
+
+try:
+    import vox_mls
+except ImportError:
+    vox_mls = None  # type: ignore[assignment]
 
 
 # ---------------------------------------------------------------------------
@@ -15,21 +25,20 @@ pytestmark = pytest.mark.anyio
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.skipif(cryptography is None, reason="cryptography not installed")
 class TestBackup:
     @pytest.fixture(autouse=True)
     def _import_backup(self):
-        pytest.importorskip("cryptography")
-        from vox_sdk.crypto.backup import decrypt_backup, encrypt_backup
-
         self.encrypt_backup = encrypt_backup
         self.decrypt_backup = decrypt_backup
 
-    def test_backup_round_trip(self):
+    @pytest.mark.parametrize("version", [2, 3])
+    def test_backup_round_trip(self, version):
         """Encrypt then decrypt, verify data matches."""
         data = b"secret MLS state data for backup test"
         passphrase = "correct-horse-battery-staple"
 
-        blob = self.encrypt_backup(data, passphrase)
+        blob = self.encrypt_backup(data, passphrase, version=version)
         assert isinstance(blob, str)
 
         recovered = self.decrypt_backup(blob, passphrase)
@@ -43,31 +52,118 @@ class TestBackup:
         with pytest.raises(Exception):
             self.decrypt_backup(blob, "wrong-passphrase")
 
+    def test_backup_defaults_to_json_envelope(self):
+        """Without an explicit version, backups stay readable by older SDKs."""
+        blob = self.encrypt_backup(b"some state", "passphrase")
+        assert json.loads(base64.b64decode(blob))["v"] == 2
+
+    def test_backup_rejects_unknown_write_version(self):
+        with pytest.raises(ValueError, match="Unsupported backup format version"):
+            self.encrypt_backup(b"some state", "passphrase", version=1)
+
     def test_backup_invalid_version(self):
-        """Tamper version field, verify ValueError."""
+        """Tamper version byte, verify ValueError."""
         data = b"some state"
-        blob = self.encrypt_backup(data, "passphrase")
+        raw = base64.b64decode(self.encrypt_backup(data, "passphrase", version=3))
+        assert raw[:4] == b"VBK\x03"
+
+        tampered = base64.b64encode(b"VBK\x63" + raw[4:]).decode()
+        with pytest.raises(ValueError, match="Unsupported backup format version"):
+            self.decrypt_backup(tampered, "passphrase")
 
-        # Decode envelope, change version, re-encode
-        envelope = json.loads(base64.b64decode(blob))
-        envelope["v"] = 99
+    def test_backup_invalid_json_version(self):
+        """Legacy JSON envelopes with an unknown version are rejected."""
+        envelope = {"v": 99, "salt": "", "nonce": "", "ct": ""}
         tampered = base64.b64encode(json.dumps(envelope).encode()).decode()
 
         with pytest.raises(ValueError, match="Unsupported backup format version"):
             self.decrypt_backup(tampered, "passphrase")
 
+    def test_backup_legacy_v2_envelope(self):
+        """v2 JSON envelopes written by older SDKs still decrypt."""
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+        salt, nonce = b"s" * 16, b"n" * 12
+        key = Scrypt(salt=salt, length=32, n=2**17, r=8, p=1).derive(b"passphrase")
+        salt_b64 = base64.b64encode(salt).decode()
+        aad = json.dumps({"v": 2, "salt": salt_b64}, sort_keys=True).encode()
+        envelope = {
+            "v": 2,
+            "salt": salt_b64,
+            "nonce": base64.b64encode(nonce).decode(),
+            "ct": base64.b64encode(AESGCM(key).encrypt(nonce, b"old state", aad)).decode(),
+        }
+        blob = base64.b64encode(json.dumps(envelope).encode()).decode()
+
+        assert self.decrypt_backup(blob, "passphrase") == b"old state"
+
 
 # ---------------------------------------------------------------------------
 # MLS engine tests (require vox_mls native extension)
 # ---------------------------------------------------------------------------
 
+_MLS_MEMBERS = {
+    "alice": (1, "alice-device"),
+    "bob": (2, "bob-device"),
+    "charlie": (3, "charlie-device"),
+}
+
+
+def _member_engine(identities: dict[str, bytes], name: str):
+    user_id, device_id = _MLS_MEMBERS[name]
+    engine = vox_mls.MlsEngine(db_path=None)
+    engine.import_identity(identities[name], user_id, device_id)
+    return engine
+
+
+@pytest.fixture(scope="session")
+def mls_identities():
+    """Exported member identities, generated once per session."""
+    if vox_mls is None:
+        pytest.skip("vox_mls not installed")
+    identities = {}
+    for name, (user_id, device_id) in _MLS_MEMBERS.items():
+        engine = vox_mls.MlsEngine(db_path=None)
+        engine.generate_identity(user_id, device_id)
+        identities[name] = engine.export_identity()
+    return identities
+
 
+@pytest.fixture
+def mls_member(mls_identities):
+    """Factory for fresh engines holding a pre-generated member identity."""
+    return lambda name: _member_engine(mls_identities, name)
+
+
+@pytest.mark.skipif(vox_mls is None, reason="vox_mls not installed")
 class TestMlsEngine:
     @pytest.fixture(autouse=True)
     def _import_mls(self):
-        vox_mls = pytest.importorskip("vox_mls")
         self.MlsEngine = vox_mls.MlsEngine
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def joined_state(cls, mls_identities):
+        """Exported Alice/Bob state for a two-member group, built once per class."""
+        alice = _member_engine(mls_identities, "alice")
+        bob = _member_engine(mls_identities, "bob")
+
+        bob_kps = bob.generate_key_packages(1)
+        welcome, _commit = alice.create_group("shared-group", [bob_kps[0]])
+        bob.join_group(welcome)
+        return alice.export_state(), bob.export_state()
+
+    @pytest.fixture
+    def joined_pair(self, joined_state):
+        """Fresh Alice and Bob engines restored from the shared group snapshot."""
+        alice_state, bob_state = joined_state
+        alice = self.MlsEngine(db_path=None)
+        alice.import_state(alice_state)
+        bob = self.MlsEngine(db_path=None)
+        bob.import_state(bob_state)
+        return alice, bob
+
     def test_generate_identity(self):
         """Create engine, generate identity, verify identity_key() returns bytes."""
         engine = self.MlsEngine(db_path=None)
@@ -91,36 +187,51 @@ class TestMlsEngine:
         assert len(bob_kps) == 1
 
         # Alice creates a group and adds Bob
-        welcome, commit = alice.create_group("test-group", [bytes(bob_kps[0])])
+        welcome, commit = alice.create_group("test-group", [bob_kps[0]])
         assert welcome is not None
 
         # Bob joins from the Welcome
-        group_id = bob.join_group(bytes(welcome))
+        group_id = bob.join_group(welcome)
         assert group_id == "test-group"
 
         # Alice encrypts, Bob decrypts
         plaintext = b"hello from alice"
         ciphertext = alice.encrypt("test-group", plaintext)
-        decrypted = bob.decrypt("test-group", bytes(ciphertext))
-        assert bytes(decrypted) == plaintext
+        decrypted = bob.decrypt("test-group", ciphertext)
+        assert decrypted == plaintext
 
-    def test_multiple_messages(self):
-        """Send 5 messages, all decrypt correctly."""
-        alice = self.MlsEngine(db_path=None)
-        alice.generate_identity(1, "alice-device")
+    @pytest.mark.parametrize("count", [1, 2, 5])
+    def test_multiple_messages(self, joined_pair, count):
+        """Send several messages in one batch, all decrypt correctly."""
+        alice, bob = joined_pair
 
-        bob = self.MlsEngine(db_path=None)
-        bob.generate_identity(2, "bob-device")
+        msgs = [f"message number {i}".encode() for i in range(count)]
+        cts = alice.encrypt_many("shared-group", msgs)
+        assert len(cts) == count
+        assert bob.decrypt_many("shared-group", cts) == [(True, m) for m in msgs]
 
-        bob_kps = bob.generate_key_packages(1)
-        welcome, commit = alice.create_group("multi-msg", [bytes(bob_kps[0])])
-        bob.join_group(bytes(welcome))
+    def test_batch_matches_single_calls(self, joined_pair):
+        """Batched ciphertexts decrypt one at a time, and vice versa."""
+        alice, bob = joined_pair
+
+        cts = alice.encrypt_many("shared-group", [b"one", b"two"])
+        assert [bob.decrypt("shared-group", ct) for ct in cts] == [b"one", b"two"]
+
+        cts = [alice.encrypt("shared-group", m) for m in (b"three", b"four")]
+        assert bob.decrypt_many("shared-group", cts) == [(True, b"three"), (True, b"four")]
+
+    def test_decrypt_many_reports_corrupt_ciphertext(self, joined_pair):
+        """A corrupt ciphertext yields (False, reason); its neighbours still decrypt."""
+        alice, bob = joined_pair
+
+        one, two = alice.encrypt_many("shared-group", [b"one", b"two"])
+        result = bob.decrypt_many("shared-group", [one, b"not a ciphertext", two])
 
-        for i in range(5):
-            msg = f"message number {i}".encode()
-            ct = alice.encrypt("multi-msg", msg)
-            pt = bob.decrypt("multi-msg", bytes(ct))
-            assert bytes(pt) == msg
+        assert result[0] == (True, b"one")
+        ok, reason = result[1]
+        assert ok is False
+        assert isinstance(reason, str) and reason
+        assert result[2] == (True, b"two")
 
     def test_group_exists_and_list(self):
         """Create group, verify group_exists() and list_groups()."""
@@ -146,12 +257,12 @@ class TestMlsEngine:
 
         original_ik = engine.identity_key()
         state = engine.export_state()
-        assert isinstance(bytes(state), bytes)
+        assert isinstance(state, bytes)
         assert len(state) > 0
 
         # New engine, import state
         engine2 = self.MlsEngine(db_path=None)
-        engine2.import_state(bytes(state))
+        engine2.import_state(state)
 
         assert engine2.identity_key() == original_ik
         assert engine2.group_exists("export-test")
@@ -168,134 +279,106 @@ class TestMlsEngine:
         original_ik = engine.identity_key()
 
         identity = engine.export_identity()
-        assert isinstance(bytes(identity), bytes)
+        assert isinstance(identity, bytes)
 
         engine2 = self.MlsEngine(db_path=None)
-        engine2.import_identity(bytes(identity), 1, "device-a")
+        engine2.import_identity(identity, 1, "device-a")
         assert engine2.identity_key() == original_ik
 
-    def test_encrypt_after_state_import(self):
+    def test_encrypt_after_state_import(self, joined_pair):
         """Encrypt/decrypt still works after export_state + import_state."""
-        alice = self.MlsEngine(db_path=None)
-        alice.generate_identity(1, "alice-device")
-
-        bob = self.MlsEngine(db_path=None)
-        bob.generate_identity(2, "bob-device")
-
-        bob_kps = bob.generate_key_packages(1)
-        welcome, _commit = alice.create_group("restore-group", [bytes(bob_kps[0])])
-        bob.join_group(bytes(welcome))
+        alice, bob = joined_pair
 
         # Alice encrypts a message before export
         msg1 = b"before export"
-        ct1 = alice.encrypt("restore-group", msg1)
+        ct1 = alice.encrypt("shared-group", msg1)
 
         # Alice exports state, creates new engine, imports state
         state = alice.export_state()
         alice2 = self.MlsEngine(db_path=None)
-        alice2.import_state(bytes(state))
+        alice2.import_state(state)
 
         # Alice encrypts a second message on the restored engine
         msg2 = b"after import"
-        ct2 = alice2.encrypt("restore-group", msg2)
+        ct2 = alice2.encrypt("shared-group", msg2)
 
         # Bob decrypts both messages
-        assert bytes(bob.decrypt("restore-group", bytes(ct1))) == msg1
-        assert bytes(bob.decrypt("restore-group", bytes(ct2))) == msg2
-
-    def test_add_member_post_creation(self):
-        """Create 2-person group, add a third member, verify encrypt/decrypt for all."""
-        alice = self.MlsEngine(db_path=None)
-        alice.generate_identity(1, "alice-device")
-
-        bob = self.MlsEngine(db_path=None)
-        bob.generate_identity(2, "bob-device")
+        assert bob.decrypt("shared-group", ct1) == msg1
+        assert bob.decrypt("shared-group", ct2) == msg2
 
-        charlie = self.MlsEngine(db_path=None)
-        charlie.generate_identity(3, "charlie-device")
+    def test_add_member_post_creation(self, joined_pair, mls_member):
+        """Start from a 2-person group, add a third member, verify encrypt/decrypt for all."""
+        alice, bob = joined_pair
 
-        # Alice creates group with Bob
-        bob_kps = bob.generate_key_packages(1)
-        welcome, _commit = alice.create_group("add-test", [bytes(bob_kps[0])])
-        bob.join_group(bytes(welcome))
+        charlie = mls_member("charlie")
 
         # Alice adds Charlie
         charlie_kps = charlie.generate_key_packages(1)
-        welcome2, commit2 = alice.add_member("add-test", bytes(charlie_kps[0]))
-        charlie.join_group(bytes(welcome2))
-        bob.process_message("add-test", bytes(commit2))
+        welcome2, commit2 = alice.add_member("shared-group", charlie_kps[0])
+        charlie.join_group(welcome2)
+        bob.process_message("shared-group", commit2)
 
         # Alice encrypts, Bob and Charlie both decrypt
         msg = b"hello everyone"
-        ct = alice.encrypt("add-test", msg)
-        assert bytes(bob.decrypt("add-test", bytes(ct))) == msg
-        assert bytes(charlie.decrypt("add-test", bytes(ct))) == msg
+        ct = alice.encrypt("shared-group", msg)
+        assert bob.decrypt("shared-group", ct) == msg
+        assert charlie.decrypt("shared-group", ct) == msg
 
-    def test_remove_member(self):
+    def test_remove_member(self, mls_member):
         """Create 3-person group, remove one, verify removed member cannot decrypt."""
-        alice = self.MlsEngine(db_path=None)
-        alice.generate_identity(1, "alice-device")
-
-        bob = self.MlsEngine(db_path=None)
-        bob.generate_identity(2, "bob-device")
-
-        charlie = self.MlsEngine(db_path=None)
-        charlie.generate_identity(3, "charlie-device")
+        alice = mls_member("alice")
+        bob = mls_member("bob")
+        charlie = mls_member("charlie")
 
         # Alice creates group with Bob and Charlie
         bob_kps = bob.generate_key_packages(1)
         charlie_kps = charlie.generate_key_packages(1)
         welcome, _commit = alice.create_group(
-            "remove-test", [bytes(bob_kps[0]), bytes(charlie_kps[0])]
+            "remove-test", [bob_kps[0], charlie_kps[0]]
         )
-        bob.join_group(bytes(welcome))
-        charlie.join_group(bytes(welcome))
+        bob.join_group(welcome)
+        charlie.join_group(welcome)
 
         # Alice removes Charlie by credential identity
         commit = alice.remove_member("remove-test", "3:charlie-device")
-        bob.process_message("remove-test", bytes(commit))
+        bob.process_message("remove-test", commit)
 
         # Alice encrypts a new message
         msg = b"after removal"
         ct = alice.encrypt("remove-test", msg)
 
         # Bob can still decrypt
-        assert bytes(bob.decrypt("remove-test", bytes(ct))) == msg
+        assert bob.decrypt("remove-test", ct) == msg
 
         # Charlie cannot decrypt (her group state is stale)
         with pytest.raises(Exception):
-            charlie.decrypt("remove-test", bytes(ct))
+            charlie.decrypt("remove-test", ct)
 
-    def test_process_commit(self):
+    def test_process_commit(self, mls_member):
         """Alice adds Charlie, Bob processes the commit, Bob can still encrypt/decrypt."""
-        alice = self.MlsEngine(db_path=None)
-        alice.generate_identity(1, "alice-device")
-
-        bob = self.MlsEngine(db_path=None)
-        bob.generate_identity(2, "bob-device")
-
-        charlie = self.MlsEngine(db_path=None)
-        charlie.generate_identity(3, "charlie-device")
+        alice = mls_member("alice")
+        bob = mls_member("bob")
+        charlie = mls_member("charlie")
 
         # Alice creates group with Bob
         bob_kps = bob.generate_key_packages(1)
-        welcome, _commit = alice.create_group("commit-test", [bytes(bob_kps[0])])
-        bob.join_group(bytes(welcome))
+        welcome, _commit = alice.create_group("commit-test", [bob_kps[0]])
+        bob.join_group(welcome)
 
         # Alice adds Charlie
         charlie_kps = charlie.generate_key_packages(1)
-        welcome2, commit2 = alice.add_member("commit-test", bytes(charlie_kps[0]))
-        charlie.join_group(bytes(welcome2))
+        welcome2, commit2 = alice.add_member("commit-test", charlie_kps[0])
+        charlie.join_group(welcome2)
 
         # Bob processes the commit
-        result = bob.process_message("commit-test", bytes(commit2))
+        result = bob.process_message("commit-test", commit2)
         assert result.kind == "commit"
 
         # Bob encrypts, Alice and Charlie decrypt
         msg = b"bob says hi"
         ct = bob.encrypt("commit-test", msg)
-        assert bytes(alice.decrypt("commit-test", bytes(ct))) == msg
-        assert bytes(charlie.decrypt("commit-test", bytes(ct))) == msg
+        assert alice.decrypt("commit-test", ct) == msg
+        assert charlie.decrypt("commit-test", ct) == msg
 
     def test_decrypt_wrong_group(self):
         """Attempt decrypt with wrong group ID, expect PyKeyError."""
@@ -353,16 +436,13 @@ class TestMlsEngine:
         engine2 = self.MlsEngine(db_path=db_file)
         assert engine2.identity_key() == original_ik
 
-    def test_remove_member_invalid_identity(self):
+    def test_remove_member_invalid_identity(self, mls_member):
         """Removing a member with unknown identity raises error."""
-        alice = self.MlsEngine(db_path=None)
-        alice.generate_identity(1, "alice-device")
-
-        bob = self.MlsEngine(db_path=None)
-        bob.generate_identity(2, "bob-device")
+        alice = mls_member("alice")
+        bob = mls_member("bob")
 
         bob_kps = bob.generate_key_packages(1)
-        alice.create_group("rm-invalid", [bytes(bob_kps[0])])
+        alice.create_group("rm-invalid", [bob_kps[0]])
 
         with pytest.raises(RuntimeError, match="not found in group"):
             alice.remove_member("rm-invalid", "999:nonexistent")
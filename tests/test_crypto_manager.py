@@ -3,36 +3,79 @@
 from __future__ import annotations
 
 import base64
+import shutil
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-pytestmark = pytest.mark.anyio
+try:
+    import cryptography
+except ImportError:
+    cryptography = None  # type: ignore[assignment]
+
+pytestmark = pytest.mark.asyncio
 
 vox_mls = pytest.importorskip("vox_mls")
 from vox_mls import MlsEngine  # noqa: E402
 
+from vox_sdk.api.e2ee import E2EEAPI
+from vox_sdk.crypto.backup import encrypt_backup
 from vox_sdk.crypto.manager import CryptoManager  # noqa: E402
+from vox_sdk.gateway import GatewayClient
+
+requires_cryptography = pytest.mark.skipif(
+    cryptography is None, reason="cryptography not installed"
+)
 
 
 def _make_mock_client(*, with_gateway: bool = True) -> MagicMock:
-    """Build a mock Client with e2ee and optional gateway."""
+    """Build a mock Client with e2ee and optional gateway.
+
+    Both are specced against the real classes, so async methods come back as
+    AsyncMock and misspelled attributes raise instead of passing silently.
+    """
     client = MagicMock()
-    client.e2ee = AsyncMock()
-    client.e2ee.get_mls_key_packages = AsyncMock(return_value=[])
-    client.e2ee.upload_mls_key_packages = AsyncMock()
-    client.e2ee.upload_key_backup = AsyncMock()
-    client.e2ee.download_key_backup = AsyncMock()
-    if with_gateway:
-        gw = MagicMock()
-        gw.add_handler = MagicMock()
-        gw.send_mls_relay = AsyncMock()
-        client.gateway = gw
-    else:
-        client.gateway = None
+    client.e2ee = AsyncMock(spec=E2EEAPI)
+    client.e2ee.get_mls_key_packages.return_value = []
+    client.gateway = MagicMock(spec=GatewayClient) if with_gateway else None
     return client
 
 
+@pytest.fixture
+def bob() -> tuple[MlsEngine, str]:
+    """A fresh engine for Bob and one single-use base64 key package from it."""
+    engine = MlsEngine(db_path=None)
+    engine.generate_identity(2, "bob-dev")
+    kp = engine.generate_key_packages(1)[0]
+    return engine, base64.b64encode(kp).decode()
+
+
+@pytest.fixture
+def bob_kp_b64(bob) -> str:
+    return bob[1]
+
+
+@pytest.fixture(scope="module")
+def alice_db(tmp_path_factory):
+    """SQLite MLS store holding Alice's identity, generated once per module."""
+    path = tmp_path_factory.mktemp("mls") / "alice.db"
+    engine = MlsEngine(db_path=str(path))
+    engine.generate_identity(1, "dev-1")
+    del engine
+    return path
+
+
+@pytest.fixture
+async def alice_cm(alice_db, tmp_path):
+    """An initialized CryptoManager on a mock client, restored from a copy of alice_db."""
+    db_path = tmp_path / "alice.db"
+    shutil.copyfile(alice_db, db_path)
+    client = _make_mock_client()
+    cm = CryptoManager(client, db_path=str(db_path))
+    await cm.initialize(user_id=1, device_id="dev-1")
+    return cm, client
+
+
 class TestInitialize:
     async def test_initialize_generates_identity(self):
         """Verify generate_identity called on engine."""
@@ -70,90 +113,64 @@ class TestInitialize:
 
 
 class TestCreateGroup:
-    async def test_create_group_uses_mls_key_packages(self):
-        """Verify get_mls_key_packages called (not get_prekeys)."""
-        client = _make_mock_client()
-        # Provide a real key package from a second engine
-        bob = MlsEngine(db_path=None)
-        bob.generate_identity(2, "bob-dev")
-        kp = bob.generate_key_packages(1)[0]
-        kp_b64 = base64.b64encode(bytes(kp)).decode()
-        client.e2ee.get_mls_key_packages = AsyncMock(return_value=[kp_b64])
+    @pytest.fixture
+    def alice_with_bob_kp(self, alice_cm, bob_kp_b64):
+        """alice_cm with Bob's key package served by get_mls_key_packages."""
+        cm, client = alice_cm
+        client.e2ee.get_mls_key_packages.return_value = [bob_kp_b64]
+        return cm, client
+
+    @pytest.fixture
+    def alice_without_gateway(self, alice_with_bob_kp):
+        """alice_with_bob_kp after the gateway has gone away."""
+        cm, client = alice_with_bob_kp
+        client.gateway = None
+        return cm, client
 
-        cm = CryptoManager(client, db_path=None)
-        await cm.initialize(user_id=1, device_id="dev-1")
+    @pytest.fixture
+    async def dm_group_client(self, alice_with_bob_kp):
+        """The mock client after Alice created the dm:42 group with Bob."""
+        cm, client = alice_with_bob_kp
         await cm.create_group_for_dm(dm_id=42, participant_ids=[1, 2])
+        return client
 
-        client.e2ee.get_mls_key_packages.assert_awaited_once_with(2)
-        # get_prekeys should NOT have been called
-        client.e2ee.get_prekeys = AsyncMock()
-        client.e2ee.get_prekeys.assert_not_awaited()
+    async def test_create_group_uses_mls_key_packages(self, dm_group_client):
+        """Verify get_mls_key_packages called (not get_prekeys)."""
+        dm_group_client.e2ee.get_mls_key_packages.assert_awaited_once_with(2)
+        dm_group_client.e2ee.get_prekeys.assert_not_awaited()
 
-    async def test_create_group_uses_send_mls_relay(self):
+    async def test_create_group_uses_send_mls_relay(self, dm_group_client):
         """Verify send_mls_relay called with 'welcome' and 'commit'."""
-        client = _make_mock_client()
-        bob = MlsEngine(db_path=None)
-        bob.generate_identity(2, "bob-dev")
-        kp = bob.generate_key_packages(1)[0]
-        kp_b64 = base64.b64encode(bytes(kp)).decode()
-        client.e2ee.get_mls_key_packages = AsyncMock(return_value=[kp_b64])
-
-        cm = CryptoManager(client, db_path=None)
-        await cm.initialize(user_id=1, device_id="dev-1")
-        await cm.create_group_for_dm(dm_id=42, participant_ids=[1, 2])
-
-        gw = client.gateway
-        relay_calls = gw.send_mls_relay.call_args_list
-        relay_types = {call.args[0] for call in relay_calls}
-        assert "welcome" in relay_types
-        assert "commit" in relay_types
+        relay_calls = dm_group_client.gateway.send_mls_relay.call_args_list
+        assert {call.args[0] for call in relay_calls} >= {"welcome", "commit"}
 
-    async def test_create_group_requires_gateway(self):
+    async def test_create_group_requires_gateway(self, alice_without_gateway):
         """gateway=None raises RuntimeError."""
-        client = _make_mock_client(with_gateway=False)
-
-        bob = MlsEngine(db_path=None)
-        bob.generate_identity(2, "bob-dev")
-        kp = bob.generate_key_packages(1)[0]
-        kp_b64 = base64.b64encode(bytes(kp)).decode()
-        client.e2ee.get_mls_key_packages = AsyncMock(return_value=[kp_b64])
-
-        cm = CryptoManager(client, db_path=None)
-        await cm.initialize(user_id=1, device_id="dev-1")
-
+        cm, _ = alice_without_gateway
         with pytest.raises(RuntimeError, match="Gateway not connected"):
             await cm.create_group_for_dm(dm_id=42, participant_ids=[1, 2])
 
 
 class TestEncryptDecrypt:
-    async def test_encrypt_decrypt_round_trip(self):
+    async def test_encrypt_decrypt_round_trip(self, alice_cm, bob):
         """Real MLS engine, mocked client, verify encrypt->decrypt."""
-        client = _make_mock_client()
-
-        alice_cm = CryptoManager(client, db_path=None)
-        await alice_cm.initialize(user_id=1, device_id="alice-dev")
-
-        # Create a Bob engine to provide key packages
-        bob_engine = MlsEngine(db_path=None)
-        bob_engine.generate_identity(2, "bob-dev")
-        kp = bob_engine.generate_key_packages(1)[0]
-        kp_b64 = base64.b64encode(bytes(kp)).decode()
+        cm, client = alice_cm
+        bob_engine, kp_b64 = bob
         client.e2ee.get_mls_key_packages = AsyncMock(return_value=[kp_b64])
 
-        await alice_cm.create_group_for_dm(dm_id=42, participant_ids=[1, 2])
+        await cm.create_group_for_dm(dm_id=42, participant_ids=[1, 2])
 
         # Extract the welcome data that was relayed
         relay_calls = client.gateway.send_mls_relay.call_args_list
         welcome_b64 = next(
             call.args[1] for call in relay_calls if call.args[0] == "welcome"
         )
-        welcome_bytes = base64.b64decode(welcome_b64)
 
         # Bob joins
-        bob_engine.join_group(welcome_bytes)
+        bob_engine.join_group(base64.b64decode(welcome_b64))
 
         # Alice encrypts via CryptoManager
-        blob = alice_cm.encrypt_message("hello bob", dm_id=42)
+        blob = cm.encrypt_message("hello bob", dm_id=42)
         assert isinstance(blob, str)
 
         # Bob decrypts directly with engine
@@ -162,15 +179,11 @@ class TestEncryptDecrypt:
         assert bytes(pt) == b"hello bob"
 
 
+@requires_cryptography
 class TestBackup:
-    async def test_backup_uses_export_state(self):
+    async def test_backup_uses_export_state(self, alice_cm):
         """Verify backup uses export_state (not export_identity)."""
-        pytest.importorskip("cryptography")
-
-        client = _make_mock_client()
-        cm = CryptoManager(client, db_path=None)
-        await cm.initialize(user_id=1, device_id="dev-1")
-
+        cm, client = alice_cm
         await cm.backup_to_server("my-passphrase")
         client.e2ee.upload_key_backup.assert_awaited_once()
 
@@ -203,20 +216,17 @@ class TestHandlerDedup:
         assert first_count == 3
 
         # Simulate gateway reconnect (new object)
-        new_gw = MagicMock()
-        new_gw.add_handler = MagicMock()
+        new_gw = MagicMock(spec=GatewayClient)
         client.gateway = new_gw
 
         await cm.initialize(user_id=1, device_id="dev-1")
         assert new_gw.add_handler.call_count == 3
 
 
+@requires_cryptography
 class TestRestore:
     async def test_restore_repopulates_user_and_device_id(self):
         """After restore_from_server, _user_id and _device_id are set."""
-        pytest.importorskip("cryptography")
-        from vox_sdk.crypto.backup import encrypt_backup
-
         client = _make_mock_client()
 
         # Build a real engine, generate identity, export state
@@ -243,11 +253,9 @@ class TestRestore:
 
 
 class TestRefreshKeyPackages:
-    async def test_refresh_key_packages(self):
+    async def test_refresh_key_packages(self, alice_cm):
         """Verify upload_mls_key_packages called with 100 packages."""
-        client = _make_mock_client()
-        cm = CryptoManager(client, db_path=None)
-        await cm.initialize(user_id=1, device_id="dev-1")
+        cm, client = alice_cm
 
         await cm.refresh_key_packages()
         client.e2ee.upload_mls_key_packages.assert_awaited_once()
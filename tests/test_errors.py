@@ -11,53 +11,79 @@ from vox_sdk.errors import VoxHTTPError, VoxGatewayError, VoxNetworkError, _RESU
 from vox_sdk.models.errors import ErrorCode
 
 
+_RECONNECT_ONLY = (4000, 4001, 4002, 4006, 4009, 4010, 4011)
+_FATAL = (4003, 4004, 4005)
+
+# (code, can_resume, can_reconnect) for representative close codes
+_GW_CASES = (
+    [(4007, True, True), (4008, True, True)]
+    + [(code, False, True) for code in _RECONNECT_ONLY]
+    + [(code, False, False) for code in _FATAL]
+)
+
+
+@pytest.fixture(scope="module")
+def forbidden_response() -> httpx.Response:
+    return httpx.Response(
+        403,
+        json={"error": {"code": "FORBIDDEN", "message": "Not allowed"}},
+    )
+
+
+@pytest.fixture(scope="module")
+def server_error_response() -> httpx.Response:
+    return httpx.Response(500, text="Internal Server Error")
+
+
+@pytest.fixture(scope="module")
+def rate_limited_response() -> httpx.Response:
+    return httpx.Response(
+        429,
+        json={
+            "error": {
+                "code": "RATE_LIMITED",
+                "message": "Slow down",
+                "retry_after_ms": 5000,
+            }
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def not_found_response() -> httpx.Response:
+    return httpx.Response(
+        404,
+        json={"error": {"code": "NOT_FOUND", "message": "Resource not found"}},
+    )
+
+
 class TestVoxHTTPError:
-    def test_from_response(self):
+    def test_from_response(self, forbidden_response):
         """Build VoxHTTPError.from_response() from a mock httpx response."""
-        response = httpx.Response(
-            403,
-            json={"error": {"code": "FORBIDDEN", "message": "Not allowed"}},
-        )
-        err = VoxHTTPError.from_response(response)
+        err = VoxHTTPError.from_response(forbidden_response)
         assert err.status == 403
         assert err.code == ErrorCode.FORBIDDEN
         assert err.error is not None
         assert err.error.message == "Not allowed"
-        assert err.response is response
+        assert err.response is forbidden_response
 
-    def test_from_response_no_body(self):
+    def test_from_response_no_body(self, server_error_response):
         """Handle non-JSON error body gracefully."""
-        response = httpx.Response(500, text="Internal Server Error")
-        err = VoxHTTPError.from_response(response)
+        err = VoxHTTPError.from_response(server_error_response)
         assert err.status == 500
         assert err.error is None
         assert err.code is None
 
-    def test_properties(self):
+    def test_properties(self, rate_limited_response):
         """Verify .code, .retry_after_ms, .status."""
-        response = httpx.Response(
-            429,
-            json={
-                "error": {
-                    "code": "RATE_LIMITED",
-                    "message": "Slow down",
-                    "retry_after_ms": 5000,
-                }
-            },
-        )
-        err = VoxHTTPError.from_response(response)
+        err = VoxHTTPError.from_response(rate_limited_response)
         assert err.status == 429
         assert err.code == ErrorCode.RATE_LIMITED
         assert err.retry_after_ms == 5000
 
-    def test_str(self):
+    def test_str(self, not_found_response):
         """Verify string representation."""
-        response = httpx.Response(
-            404,
-            json={"error": {"code": "NOT_FOUND", "message": "Resource not found"}},
-        )
-        err = VoxHTTPError.from_response(response)
-        s = str(err)
+        s = str(VoxHTTPError.from_response(not_found_response))
         assert "404" in s
         assert "NOT_FOUND" in s
         assert "Resource not found" in s
@@ -70,26 +96,16 @@ class TestVoxHTTPError:
 
 
 class TestVoxGatewayError:
-    def test_all_codes(self):
+    @pytest.mark.parametrize("code,resume,reconnect", _GW_CASES)
+    def test_all_codes(self, code, resume, reconnect):
         """Verify can_resume/can_reconnect for representative codes."""
-        # Resumable (should also be reconnectable)
-        for code in (4007, 4008):
-            err = VoxGatewayError(code, "test")
-            assert err.can_resume is True, f"Code {code} should be resumable"
-            assert err.can_reconnect is True, f"Code {code} should be reconnectable"
-
-        # Reconnectable only (not resumable)
-        reconnect_only = {4000, 4001, 4002, 4006, 4009, 4010, 4011}
-        for code in reconnect_only - _RESUMABLE_CODES:
-            err = VoxGatewayError(code, "test")
-            assert err.can_resume is False, f"Code {code} should not be resumable"
-            assert err.can_reconnect is True, f"Code {code} should be reconnectable"
-
-        # Fatal (neither resumable nor reconnectable)
-        for code in (4003, 4004, 4005):
-            err = VoxGatewayError(code, "test")
-            assert err.can_resume is False, f"Code {code} should not be resumable"
-            assert err.can_reconnect is False, f"Code {code} should not be reconnectable"
+        err = VoxGatewayError(code, "test")
+        assert (err.can_resume, err.can_reconnect) == (resume, reconnect)
+
+    def test_cases_cover_code_sets(self):
+        """_GW_CASES stays in sync with the resumable/reconnectable sets."""
+        assert {c for c, resume, _ in _GW_CASES if resume} == _RESUMABLE_CODES
+        assert {c for c, _, reconnect in _GW_CASES if reconnect} == _RECONNECTABLE_CODES
 
     def test_str(self):
         """Verify string representation."""
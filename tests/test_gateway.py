@@ -2,11 +2,11 @@
 
 import asyncio
 import json
-from collections import deque
-from unittest.mock import AsyncMock, patch
+import types
+from unittest.mock import patch
 
 import pytest
-import websockets.exceptions
+from helpers import HELLO_FRAME, PARSE_CASES, FakeWebSocket, dump_frame
 
 from vox_sdk.errors import VoxGatewayError
 from vox_sdk.gateway import GatewayClient
@@ -21,28 +21,27 @@ from vox_sdk.models.events import (
 )
 
 
-# ---------------------------------------------------------------------------
-# FakeWebSocket — feeds scripted messages and records sent messages
-# ---------------------------------------------------------------------------
+# Scripted frames, serialized once at import
+_READY_FRAME = dump_frame({
+    "type": "ready", "seq": 1,
+    "d": {
+        "session_id": "sess_1", "user_id": 1,
+        "display_name": "A", "server_name": "S",
+        "protocol_version": 1, "capabilities": [],
+    },
+})
+_HEARTBEAT_ACK_FRAME = dump_frame({"type": "heartbeat_ack", "d": {}})
+_MESSAGE_SEQ1_FRAME = dump_frame({"type": "message_create", "seq": 1, "d": {"msg_id": 1}})
+_MESSAGE_SEQ5_FRAME = dump_frame({"type": "message_create", "seq": 5, "d": {"msg_id": 1}})
+_MESSAGE_SEQ12_FRAME = dump_frame({"type": "message_create", "seq": 12, "d": {"msg_id": 2}})
 
-class FakeWebSocket:
-    """Mimics a websockets connection for testing _run() directly."""
 
-    def __init__(self, messages: list[dict]):
-        self._messages = deque(json.dumps(m) for m in messages)
-        self.sent: list[dict] = []
-        self._closed = False
-
-    async def recv(self):
-        if not self._messages:
-            raise websockets.exceptions.ConnectionClosed(None, None)
-        return self._messages.popleft()
-
-    async def send(self, data):
-        self.sent.append(json.loads(data))
-
-    async def close(self):
-        self._closed = True
+@pytest.fixture
+def fake_ws_factory():
+    """Build a FakeWebSocket that replays the given pre-serialized frames."""
+    def factory(*frames: bytes | str) -> FakeWebSocket:
+        return FakeWebSocket(frames)
+    return factory
 
 
 class TestParseEvent:
@@ -204,6 +203,23 @@ class TestGatewayClientUnit:
         assert len(bad_called) == 1, "bad_handler should have been called"
         assert len(called) == 1
 
+    @pytest.mark.asyncio
+    async def test_dispatch_runs_handlers_concurrently(self):
+        """Handlers for one event run together, so one can wait on another."""
+        gw = GatewayClient("http://localhost/gateway", "tok")
+        first_ran = asyncio.Event()
+
+        @gw.on("test_event")
+        async def waits_for_wildcard(event):
+            await first_ran.wait()
+
+        @gw.on("*")
+        async def wildcard(event):
+            first_ran.set()
+
+        event = GatewayEvent(type="test_event", raw={"type": "test_event", "d": {}})
+        await asyncio.wait_for(gw._dispatch(event), timeout=1.0)
+
     def test_url_construction(self):
         """Verify http->ws URL conversion and query params."""
         from vox_sdk.gateway import GatewayClient
@@ -232,19 +248,9 @@ class TestGatewayRun:
         return gw
 
     @pytest.mark.asyncio
-    async def test_run_identify_flow(self):
+    async def test_run_identify_flow(self, fake_ws_factory):
         """Hello → identify with token + protocol_version → ready sets session_id."""
-        ws = FakeWebSocket([
-            {"type": "hello", "d": {"heartbeat_interval": 30000}},
-            {
-                "type": "ready", "seq": 1,
-                "d": {
-                    "session_id": "sess_1", "user_id": 1,
-                    "display_name": "A", "server_name": "S",
-                    "protocol_version": 1, "capabilities": [],
-                },
-            },
-        ])
+        ws = fake_ws_factory(HELLO_FRAME, _READY_FRAME)
         gw = self._make_gw()
         gw._ws = ws  # send() requires _ws to be set
         # _run will exhaust messages then get ConnectionClosed → VoxGatewayError
@@ -261,11 +267,20 @@ class TestGatewayRun:
         assert gw._session_id == "sess_1"
 
     @pytest.mark.asyncio
-    async def test_run_resume_flow(self):
+    async def test_run_accepts_text_frames(self, fake_ws_factory):
+        """str (text-frame) payloads parse the same as the bytes script."""
+        ws = fake_ws_factory(HELLO_FRAME.decode(), _READY_FRAME.decode())
+        gw = self._make_gw()
+        gw._ws = ws
+        with pytest.raises(VoxGatewayError):
+            await gw._run(ws)
+        assert ws.sent[0]["type"] == "identify"
+        assert gw._session_id == "sess_1"
+
+    @pytest.mark.asyncio
+    async def test_run_resume_flow(self, fake_ws_factory):
         """Pre-set session_id → resume sent instead of identify."""
-        ws = FakeWebSocket([
-            {"type": "hello", "d": {"heartbeat_interval": 30000}},
-        ])
+        ws = fake_ws_factory(HELLO_FRAME)
         gw = self._make_gw()
         gw._ws = ws  # send() requires _ws to be set
         gw._session_id = "sess_old"
@@ -276,41 +291,59 @@ class TestGatewayRun:
 
         resume = ws.sent[0]
         assert resume["type"] == "resume"
-        assert resume["d"]["session_id"] == "sess_old"
-        assert resume["d"]["last_seq"] == 42
+        assert resume["d"] == {"token": "tok", "session_id": "sess_old", "last_seq": 42}
 
     @pytest.mark.asyncio
-    async def test_run_rejects_non_hello_first(self):
+    async def test_run_skips_malformed_frames(self, fake_ws_factory):
+        """Non-object frames and unhashable types are skipped, not fatal."""
+        ws = fake_ws_factory(
+            HELLO_FRAME, dump_frame([1, 2]), dump_frame({"type": ["x"], "seq": 1}), _READY_FRAME
+        )
+        gw = self._make_gw()
+        gw._ws = ws
+        with pytest.raises(VoxGatewayError):
+            await gw._run(ws)
+        assert gw._session_id == "sess_1"
+
+    @pytest.mark.asyncio
+    async def test_run_rejects_non_hello_first(self, fake_ws_factory):
         """First message must be hello, otherwise 4000 error."""
-        ws = FakeWebSocket([
-            {"type": "message_create", "seq": 1, "d": {"msg_id": 1}},
-        ])
+        ws = fake_ws_factory(_MESSAGE_SEQ1_FRAME)
         gw = self._make_gw()
         with pytest.raises(VoxGatewayError) as exc_info:
             await gw._run(ws)
         assert exc_info.value.code == 4000
 
     @pytest.mark.asyncio
-    async def test_run_tracks_seq(self):
+    async def test_run_tracks_seq(self, fake_ws_factory):
         """Events with seq values update gw._seq."""
-        ws = FakeWebSocket([
-            {"type": "hello", "d": {"heartbeat_interval": 30000}},
-            {"type": "message_create", "seq": 5, "d": {"msg_id": 1}},
-            {"type": "message_create", "seq": 12, "d": {"msg_id": 2}},
-        ])
+        ws = fake_ws_factory(HELLO_FRAME, _MESSAGE_SEQ5_FRAME, _MESSAGE_SEQ12_FRAME)
+        gw = self._make_gw()
+        gw._ws = ws
+        with pytest.raises(VoxGatewayError):
+            await gw._run(ws)
+        assert gw._seq == 12
+
+    @pytest.mark.asyncio
+    async def test_run_skips_unhandled_events(self, fake_ws_factory, monkeypatch):
+        """Events with no handler are not parsed, but still advance _seq."""
+        parsed = []
+        monkeypatch.setattr(
+            "vox_sdk.gateway.parse_event",
+            lambda raw: parsed.append(raw["type"]) or parse_event(raw),
+        )
+        ws = fake_ws_factory(HELLO_FRAME, _MESSAGE_SEQ5_FRAME, _MESSAGE_SEQ12_FRAME)
         gw = self._make_gw()
         gw._ws = ws
         with pytest.raises(VoxGatewayError):
             await gw._run(ws)
+        assert parsed == ["hello"]
         assert gw._seq == 12
 
     @pytest.mark.asyncio
-    async def test_run_heartbeat_ack_not_dispatched(self):
+    async def test_run_heartbeat_ack_not_dispatched(self, fake_ws_factory):
         """heartbeat_ack events are not dispatched to handlers."""
-        ws = FakeWebSocket([
-            {"type": "hello", "d": {"heartbeat_interval": 30000}},
-            {"type": "heartbeat_ack", "d": {}},
-        ])
+        ws = fake_ws_factory(HELLO_FRAME, _HEARTBEAT_ACK_FRAME)
         gw = self._make_gw()
         gw._ws = ws
         dispatched = []
@@ -328,12 +361,10 @@ class TestGatewayRun:
         assert len(dispatched) == 0
 
     @pytest.mark.asyncio
-    async def test_run_connection_closed_while_active(self):
+    async def test_run_connection_closed_while_active(self, fake_ws_factory):
         """ConnectionClosed during recv while _closed=False raises VoxGatewayError."""
-        ws = FakeWebSocket([
-            {"type": "hello", "d": {"heartbeat_interval": 30000}},
-            # No more messages → ConnectionClosed on next recv
-        ])
+        # No more frames after hello → ConnectionClosed on next recv
+        ws = fake_ws_factory(HELLO_FRAME)
         gw = self._make_gw()
         gw._ws = ws
         with pytest.raises(VoxGatewayError):
@@ -343,22 +374,7 @@ class TestGatewayRun:
 class TestParseEventParametrized:
     """Parametrized tests for parse_event covering many event types."""
 
-    @pytest.mark.parametrize("event_type,data_cls,data,check_field,check_value", [
-        ("message_update", "MessageUpdate", {"msg_id": 1, "body": "edited"}, "msg_id", 1),
-        ("message_delete", "MessageDelete", {"msg_id": 1, "feed_id": 2}, "msg_id", 1),
-        ("member_join", "MemberJoin", {"user_id": 5, "display_name": "New"}, "user_id", 5),
-        ("member_leave", "MemberLeave", {"user_id": 5}, "user_id", 5),
-        ("feed_create", "FeedCreate", {"feed_id": 1, "name": "general"}, "feed_id", 1),
-        ("role_create", "RoleCreate", {"role_id": 1, "name": "Admin", "color": 0xFF0000, "permissions": 8, "position": 0}, "color", 0xFF0000),
-        ("dm_create", "DMCreate", {"dm_id": 1, "participant_ids": [1, 2]}, "dm_id", 1),
-        ("typing_start", "TypingStart", {"user_id": 1, "feed_id": 5}, "user_id", 1),
-        ("presence_update", "PresenceUpdate", {"user_id": 1, "status": "online"}, "user_id", 1),
-        ("voice_state_update", "VoiceStateUpdate", {"room_id": 1, "members": []}, "room_id", 1),
-        ("webhook_create", "WebhookCreate", {"webhook_id": 1, "feed_id": 2, "name": "wh"}, "webhook_id", 1),
-        ("emoji_create", "EmojiCreate", {"emoji_id": 1, "name": "fire", "creator_id": 2}, "emoji_id", 1),
-        ("interaction_create", "InteractionCreate", {"interaction": {"id": "int-1"}}, "interaction", {"id": "int-1"}),
-        ("resumed", "Resumed", {}, None, None),
-    ])
+    @pytest.mark.parametrize("event_type,data_cls,data,check_field,check_value", PARSE_CASES)
     def test_parse_event_types(self, event_type, data_cls, data, check_field, check_value):
         from vox_sdk.models import events as ev
         raw = {"type": event_type, "seq": 1, "d": data}
@@ -397,6 +413,17 @@ class TestGatewayEdgeCases:
         except ImportError:
             assert "compress" not in gw._url
 
+    def test_json_dumps_handles_what_orjson_rejects(self):
+        """Non-str keys and ints wider than 64 bits still serialize."""
+        from vox_sdk.gateway import _json_dumps
+
+        payload = {"d": {1: "one"}, "big": 2**70}
+        assert json.loads(_json_dumps(payload)) == json.loads(json.dumps(payload))
+
+
+async def _fast_sleep(*args, **kwargs):
+    """Stand-in for asyncio.sleep that skips reconnect backoff."""
+
 
 class TestGatewayReconnect:
     """Tests for the run() reconnect loop."""
@@ -418,10 +445,10 @@ class TestGatewayReconnect:
                 assert self._seq == 10
                 return  # clean close
 
-        monkeypatch.setattr(GatewayClient, "connect", mock_connect)
-        monkeypatch.setattr("asyncio.sleep", AsyncMock())
+        monkeypatch.setattr("asyncio.sleep", _fast_sleep)
 
         gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
+        gw.connect = types.MethodType(mock_connect, gw)
         await gw.run()
         assert call_count["n"] == 2
 
@@ -442,22 +469,21 @@ class TestGatewayReconnect:
                 assert self._seq == 0
                 return
 
-        monkeypatch.setattr(GatewayClient, "connect", mock_connect)
-        monkeypatch.setattr("asyncio.sleep", AsyncMock())
+        monkeypatch.setattr("asyncio.sleep", _fast_sleep)
 
         gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
+        gw.connect = types.MethodType(mock_connect, gw)
         await gw.run()
         assert call_count["n"] == 2
 
     @pytest.mark.asyncio
-    async def test_run_fatal_code_raises(self, monkeypatch):
+    async def test_run_fatal_code_raises(self):
         """run() re-raises on fatal (non-reconnectable) close codes."""
         async def mock_connect(self):
             raise VoxGatewayError(4004, "AUTH_FAILED")
 
-        monkeypatch.setattr(GatewayClient, "connect", mock_connect)
-
         gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
+        gw.connect = types.MethodType(mock_connect, gw)
         with pytest.raises(VoxGatewayError) as exc_info:
             await gw.run()
         assert exc_info.value.code == 4004
@@ -471,10 +497,10 @@ class TestGatewayReconnect:
             call_count["n"] += 1
             raise VoxGatewayError(4000, "UNKNOWN_ERROR")
 
-        monkeypatch.setattr(GatewayClient, "connect", mock_connect)
-        monkeypatch.setattr("asyncio.sleep", AsyncMock())
+        monkeypatch.setattr("asyncio.sleep", _fast_sleep)
 
         gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
+        gw.connect = types.MethodType(mock_connect, gw)
         with pytest.raises(VoxGatewayError):
             await gw.run(max_reconnect_attempts=3)
         assert call_count["n"] == 3  # stops after 3 attempts
@@ -484,12 +510,9 @@ class TestHeartbeatTimeout:
     """Tests for heartbeat ACK timeout detection."""
 
     @pytest.mark.asyncio
-    async def test_heartbeat_ack_updates_timestamp(self):
+    async def test_heartbeat_ack_updates_timestamp(self, fake_ws_factory):
         """Receiving heartbeat_ack updates _last_heartbeat_ack."""
-        ws = FakeWebSocket([
-            {"type": "hello", "d": {"heartbeat_interval": 30000}},
-            {"type": "heartbeat_ack", "d": {}},
-        ])
+        ws = fake_ws_factory(HELLO_FRAME, _HEARTBEAT_ACK_FRAME)
         gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
         gw._ws = ws
 
@@ -499,11 +522,10 @@ class TestHeartbeatTimeout:
         assert gw._last_heartbeat_ack > 0
 
     @pytest.mark.asyncio
-    async def test_heartbeat_timeout_closes_ws(self, monkeypatch):
+    async def test_heartbeat_timeout_closes_ws(self, fake_ws_factory):
         """If heartbeat ACK is overdue, the heartbeat loop closes the WS."""
-        ws = FakeWebSocket([
-            {"type": "hello", "d": {"heartbeat_interval": 100}},
-        ])
+        # The loop is driven directly, so no frames are read
+        ws = fake_ws_factory()
         gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
         gw._ws = ws
 
@@ -522,28 +544,26 @@ class TestHeartbeatTimeout:
 
 class TestConnectInBackground:
     @pytest.mark.asyncio
-    async def test_timeout(self, monkeypatch):
+    async def test_timeout(self):
         """connect_in_background raises on timeout."""
         async def mock_connect(self):
             # Never set ready event, just block
             await asyncio.sleep(999)
 
-        monkeypatch.setattr(GatewayClient, "connect", mock_connect)
-
         gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
+        gw.connect = types.MethodType(mock_connect, gw)
         with pytest.raises(VoxGatewayError) as exc_info:
             await gw.connect_in_background(timeout=0.05)
         assert "Timed out" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_error_propagation(self, monkeypatch):
+    async def test_error_propagation(self):
         """connect_in_background propagates connect errors."""
         async def mock_connect(self):
             raise VoxGatewayError(4004, "AUTH_FAILED")
 
-        monkeypatch.setattr(GatewayClient, "connect", mock_connect)
-
         gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
+        gw.connect = types.MethodType(mock_connect, gw)
         with pytest.raises(VoxGatewayError) as exc_info:
             await gw.connect_in_background(timeout=2.0)
         assert exc_info.value.code == 4004
@@ -551,22 +571,36 @@ class TestConnectInBackground:
 
 class TestConvenienceHelpers:
     @pytest.mark.asyncio
-    async def test_send_typing(self):
+    async def test_send_typing(self, fake_ws_factory):
         """send_typing sends typing_start with feed_id."""
-        ws = FakeWebSocket([])
+        ws = fake_ws_factory()
         gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
         gw._ws = ws
         await gw.send_typing(42)
-        assert ws.sent[0]["type"] == "typing_start"
-        assert ws.sent[0]["d"]["feed_id"] == 42
+        frame = ws.sent[0]
+        assert frame["type"] == "typing_start"
+        assert frame["d"]["feed_id"] == 42
 
     @pytest.mark.asyncio
-    async def test_update_presence(self):
+    async def test_update_presence(self, fake_ws_factory):
         """update_presence sends presence_update with status."""
-        ws = FakeWebSocket([])
+        ws = fake_ws_factory()
         gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
         gw._ws = ws
         await gw.update_presence("dnd", custom_status="busy")
-        assert ws.sent[0]["type"] == "presence_update"
-        assert ws.sent[0]["d"]["status"] == "dnd"
-        assert ws.sent[0]["d"]["custom_status"] == "busy"
+        frame = ws.sent[0]
+        assert frame["type"] == "presence_update"
+        assert frame["d"]["status"] == "dnd"
+        assert frame["d"]["custom_status"] == "busy"
+
+    @pytest.mark.asyncio
+    async def test_update_presence_escapes_and_omits(self, fake_ws_factory):
+        """Template frames JSON-escape strings and omit a missing custom_status."""
+        ws = fake_ws_factory()
+        gw = GatewayClient("http://localhost/gateway", "tok", compress=False)
+        gw._ws = ws
+        await gw.update_presence("online")
+        await gw.update_presence("idle", custom_status='say "hi"\n')
+        plain, custom = ws.sent
+        assert plain == {"type": "presence_update", "d": {"status": "online"}}
+        assert custom["d"]["custom_status"] == 'say "hi"\n'
@@ -1,44 +1,74 @@
 """Tests for the HTTP client."""
 
-import json
-
 import httpx
 import pytest
+from helpers import RecordingTransport, json_response
 
 from vox_sdk.errors import VoxHTTPError, VoxNetworkError
 from vox_sdk.http import HTTPClient
+from vox_sdk.rate_limit import RateLimiter
+
+
+@pytest.fixture(scope="module")
+def sleep_delays() -> list[float]:
+    """Backoff delays the shared client asked for; retries never actually wait."""
+    return []
+
+
+@pytest.fixture(scope="module")
+async def shared_http_client(sleep_delays):
+    """One HTTPClient + mock transport for the whole module, closed at the end."""
+    calls: list = []
+    transport = RecordingTransport(calls)
+
+    async def record_sleep(delay: float) -> None:
+        sleep_delays.append(delay)
+
+    client = HTTPClient("https://vox.test", token="test-token", sleep=record_sleep)
+    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=transport)
+    yield client, transport, calls
+    await client.close()
+
+
+@pytest.fixture
+def http_client(shared_http_client, sleep_delays):
+    """The shared client with recorded calls, responses, sleeps and rate limits reset."""
+    client, transport, _calls = shared_http_client
+    transport.reset()
+    sleep_delays.clear()
+    client._rate_limiter = RateLimiter()
+    return shared_http_client
 
 
 @pytest.mark.asyncio
 async def test_get_adds_auth_header(http_client):
     client, transport, calls = http_client
-    transport.response = httpx.Response(200, json={"ok": True})
+    transport.response = json_response(200, {"ok": True})
 
     response = await client.get("/api/v1/server")
     assert response.status_code == 200
     assert len(calls) == 1
-    assert calls[0]["headers"]["authorization"] == "Bearer test-token"
+    assert calls[0].headers["authorization"] == "Bearer test-token"
 
 
 @pytest.mark.asyncio
 async def test_post_sends_json(http_client):
     client, transport, calls = http_client
-    transport.response = httpx.Response(201, json={"user_id": 1, "token": "abc"})
+    transport.response = json_response(201, {"user_id": 1, "token": "abc"})
 
     response = await client.post(
         "/api/v1/auth/register",
         json={"username": "test", "password": "pass"},
     )
     assert response.status_code == 201
-    assert calls[0]["body"] == {"username": "test", "password": "pass"}
+    assert calls[0].body == {"username": "test", "password": "pass"}
 
 
 @pytest.mark.asyncio
 async def test_raises_on_4xx(http_client):
     client, transport, calls = http_client
-    transport.response = httpx.Response(
-        404,
-        json={"error": {"code": "NOT_FOUND", "message": "Not found."}},
+    transport.response = json_response(
+        404, {"error": {"code": "NOT_FOUND", "message": "Not found."}}
     )
 
     with pytest.raises(VoxHTTPError) as exc_info:
@@ -48,45 +78,11 @@ async def test_raises_on_4xx(http_client):
     assert exc_info.value.code.value == "NOT_FOUND"
 
 
-@pytest.mark.asyncio
-async def test_retry_on_429(http_client, monkeypatch):
-    client, transport, calls = http_client
-    import asyncio
-
-    # Speed up the test by making sleep instant
-    real_sleep = asyncio.sleep
-    monkeypatch.setattr(asyncio, "sleep", lambda _: real_sleep(0))
-
-    attempt = {"count": 0}
-    original_response = httpx.Response(
-        429,
-        json={"error": {"code": "RATE_LIMITED", "message": "Slow down.", "retry_after_ms": 10}},
-        headers={"retry-after": "1", "x-ratelimit-limit": "5", "x-ratelimit-remaining": "0", "x-ratelimit-reset": "0"},
-    )
-    success_response = httpx.Response(200, json={"ok": True})
-
-    class RetryTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            attempt["count"] += 1
-            if attempt["count"] < 3:
-                return original_response
-            return success_response
-
-    client._client = httpx.AsyncClient(
-        base_url="https://vox.test",
-        transport=RetryTransport(),
-    )
-
-    response = await client.get("/api/v1/server")
-    assert response.status_code == 200
-    assert attempt["count"] == 3  # 2 retries + 1 success
-
-
 @pytest.mark.asyncio
 async def test_no_auth_header_when_no_token():
     client = HTTPClient("https://vox.test", token=None)
-    headers = client._headers()
-    assert "Authorization" not in headers
+    assert "Authorization" not in client._base_headers
+    await client.close()
 
 
 @pytest.mark.asyncio
@@ -95,249 +91,137 @@ async def test_token_setter():
     assert client.token is None
     client.token = "new-token"
     assert client.token == "new-token"
-    headers = client._headers()
-    assert headers["Authorization"] == "Bearer new-token"
+    assert client._base_headers["Authorization"] == "Bearer new-token"
     await client.close()
 
 
-@pytest.mark.asyncio
-async def test_retry_429_uses_correct_delay(http_client, monkeypatch):
-    """429 retry should sleep for retry_after_ms / 1000."""
-    client, transport, calls = http_client
-    import asyncio
-
-    sleep_delays: list[float] = []
-    real_sleep = asyncio.sleep
-
-    async def recording_sleep(delay):
-        sleep_delays.append(delay)
-        # Don't actually sleep
-
-    monkeypatch.setattr(asyncio, "sleep", recording_sleep)
-
-    attempt = {"count": 0}
+_AUTH = {"authorization": "Bearer test-token"}
 
-    class RetryTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            attempt["count"] += 1
-            if attempt["count"] < 2:
-                return httpx.Response(
-                    429,
-                    json={"error": {"code": "RATE_LIMITED", "message": "Slow down.", "retry_after_ms": 2500}},
-                    headers={"x-ratelimit-limit": "5", "x-ratelimit-remaining": "0", "x-ratelimit-reset": "0"},
-                )
-            return httpx.Response(200, json={"ok": True})
-
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=RetryTransport())
-    await client.get("/api/v1/server")
-
-    assert len(sleep_delays) == 1
-    assert sleep_delays[0] == 2.5  # 2500ms / 1000
+# (method, path, request kwargs, expected JSON body, expected headers subset)
+_REQUEST_CASES = {
+    "put": ("PUT", "/api/v1/feeds/1/pins/5", {}, None, _AUTH),
+    "patch": ("PATCH", "/api/v1/server", {"json": {"name": "Updated"}}, {"name": "Updated"}, _AUTH),
+    "delete": ("DELETE", "/api/v1/feeds/1", {}, None, _AUTH),
+    "custom_headers_merged": (
+        "GET", "/api/v1/server", {"headers": {"x-custom": "val"}}, None,
+        {**_AUTH, "x-custom": "val"},
+    ),
+    "params_forwarded": (
+        "GET", "/api/v1/members", {"params": {"limit": "10", "after": "5"}}, None, _AUTH,
+    ),
+}
 
 
 @pytest.mark.asyncio
-async def test_retry_429_header_fallback(http_client, monkeypatch):
-    """429 with unparseable JSON body falls back to retry-after header."""
+@pytest.mark.parametrize(
+    "method,path,kwargs,body,headers", list(_REQUEST_CASES.values()), ids=list(_REQUEST_CASES)
+)
+async def test_request_sent(http_client, method, path, kwargs, body, headers):
     client, transport, calls = http_client
-    import asyncio
-
-    sleep_delays: list[float] = []
-
-    async def recording_sleep(delay):
-        sleep_delays.append(delay)
-
-    monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+    transport.response = httpx.Response(204)
+    await getattr(client, method.lower())(path, **kwargs)
 
-    attempt = {"count": 0}
-
-    class RetryTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            attempt["count"] += 1
-            if attempt["count"] < 2:
-                return httpx.Response(
-                    429,
-                    content=b"not json",
-                    headers={
-                        "content-type": "text/plain",
-                        "retry-after": "2",
-                        "x-ratelimit-limit": "5",
-                        "x-ratelimit-remaining": "0",
-                        "x-ratelimit-reset": "0",
-                    },
-                )
-            return httpx.Response(200, json={"ok": True})
-
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=RetryTransport())
-    await client.get("/api/v1/server")
-
-    assert len(sleep_delays) == 1
-    assert sleep_delays[0] == 2.0
+    call = calls[0]
+    assert call.method == method
+    assert call.path == path
+    assert call.body == body
+    assert {name: call.headers.get(name) for name in headers} == headers
+    assert dict(call.request.url.params) == kwargs.get("params", {})
 
 
 @pytest.mark.asyncio
-async def test_retry_exhaustion_raises(http_client, monkeypatch):
-    """All 3 attempts return 429 → raises VoxHTTPError with status 429."""
-    client, transport, calls = http_client
-    import asyncio
-
-    real_sleep = asyncio.sleep
-    monkeypatch.setattr(asyncio, "sleep", lambda _: real_sleep(0))
-
-    class AlwaysRateLimited(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            return httpx.Response(
-                429,
-                json={"error": {"code": "RATE_LIMITED", "message": "Slow down.", "retry_after_ms": 10}},
-                headers={"x-ratelimit-limit": "5", "x-ratelimit-remaining": "0", "x-ratelimit-reset": "0"},
-            )
-
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=AlwaysRateLimited())
-
-    with pytest.raises(VoxHTTPError) as exc_info:
-        await client.get("/api/v1/server")
-    assert exc_info.value.status == 429
-
-
-@pytest.mark.asyncio
-async def test_put_sends_request(http_client):
-    client, transport, calls = http_client
-    transport.response = httpx.Response(204, json={})
-    await client.put("/api/v1/feeds/1/pins/5")
-    assert calls[0]["method"] == "PUT"
-    assert calls[0]["path"] == "/api/v1/feeds/1/pins/5"
-
-
-@pytest.mark.asyncio
-async def test_patch_sends_request(http_client):
-    client, transport, calls = http_client
-    transport.response = httpx.Response(200, json={"ok": True})
-    await client.patch("/api/v1/server", json={"name": "Updated"})
-    assert calls[0]["method"] == "PATCH"
-    assert calls[0]["body"] == {"name": "Updated"}
-
-
-@pytest.mark.asyncio
-async def test_delete_sends_request(http_client):
-    client, transport, calls = http_client
-    transport.response = httpx.Response(204, json={})
-    await client.delete("/api/v1/feeds/1")
-    assert calls[0]["method"] == "DELETE"
-    assert calls[0]["path"] == "/api/v1/feeds/1"
-
-
-@pytest.mark.asyncio
-async def test_custom_headers_merged(http_client):
-    client, transport, calls = http_client
-    transport.response = httpx.Response(200, json={})
-    await client.request("GET", "/api/v1/server", headers={"x-custom": "val"})
-    assert calls[0]["headers"]["x-custom"] == "val"
-    assert calls[0]["headers"]["authorization"] == "Bearer test-token"
-
-
-@pytest.mark.asyncio
-async def test_params_forwarded(http_client):
-    client, transport, calls = http_client
-    transport.response = httpx.Response(200, json={})
-    await client.get("/api/v1/members", params={"limit": "10", "after": "5"})
-    url = calls[0]["url"]
-    assert "limit=10" in url
-    assert "after=5" in url
-
-
-@pytest.mark.asyncio
-async def test_close_closes_inner_client(http_client):
-    client, transport, calls = http_client
+async def test_close_closes_inner_client(mock_async_client):
+    client = HTTPClient("https://vox.test", token="test-token")
+    client._client = mock_async_client
     assert not client._client.is_closed
     await client.close()
     assert client._client.is_closed
 
 
-# --- 5xx retry tests ---
-
-
 @pytest.mark.asyncio
-async def test_retry_on_500(http_client, monkeypatch):
-    """500 status should be retried with backoff."""
-    client, transport, calls = http_client
-    import asyncio
-
-    sleep_delays: list[float] = []
+async def test_clients_do_not_share_async_client():
+    """Each HTTPClient owns its AsyncClient, so one closing never affects another."""
+    first = HTTPClient("https://vox.test")
+    second = HTTPClient("https://vox.test")
+    assert first._client is not second._client
 
-    async def recording_sleep(delay):
-        sleep_delays.append(delay)
-
-    monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+    await first.close()
+    assert first._client.is_closed
+    assert not second._client.is_closed
+    await second.close()
 
-    attempt = {"count": 0}
 
-    class RetryTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            attempt["count"] += 1
-            if attempt["count"] < 3:
-                return httpx.Response(500, text="Internal Server Error")
-            return httpx.Response(200, json={"ok": True})
+# --- Retry/backoff tests ---
 
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=RetryTransport())
-    response = await client.get("/api/v1/server")
-    assert response.status_code == 200
-    assert attempt["count"] == 3
-    # 2 retries: delay = 1*2^0=1, 1*2^1=2
-    assert len(sleep_delays) == 2
-    assert sleep_delays[0] == 1.0
-    assert sleep_delays[1] == 2.0
 
+_RL_HEADERS = {"x-ratelimit-limit": "5", "x-ratelimit-remaining": "0", "x-ratelimit-reset": "0"}
 
-@pytest.mark.asyncio
-async def test_retry_on_503_exhaustion(http_client, monkeypatch):
-    """All 3 attempts return 503 → raises VoxHTTPError."""
-    client, transport, calls = http_client
-    import asyncio
 
-    real_sleep = asyncio.sleep
-    monkeypatch.setattr(asyncio, "sleep", lambda _: real_sleep(0))
+def _rate_limited(retry_after_ms: int, **headers: str) -> httpx.Response:
+    body = {
+        "error": {"code": "RATE_LIMITED", "message": "Slow down.", "retry_after_ms": retry_after_ms}
+    }
+    return json_response(429, body, headers={**headers, **_RL_HEADERS})
 
-    class AlwaysUnavailable(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            return httpx.Response(503, text="Service Unavailable")
 
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=AlwaysUnavailable())
-    with pytest.raises(VoxHTTPError) as exc_info:
-        await client.get("/api/v1/server")
-    assert exc_info.value.status == 503
+def _error_response(status: int, retry_after_ms: int | None) -> httpx.Response:
+    """A fresh failing response; 429s without ``retry_after_ms`` have a text body."""
+    if status != 429:
+        return httpx.Response(status, content=b"Server Error")
+    if retry_after_ms is None:
+        return httpx.Response(
+            429,
+            content=b"not json",
+            headers={"content-type": "text/plain", "retry-after": "2", **_RL_HEADERS},
+        )
+    return _rate_limited(retry_after_ms, **{"retry-after": "1"})
 
 
-# --- Transport error wrapping ---
+async def _final_status(client: HTTPClient, path: str) -> int:
+    try:
+        response = await client.get(path)
+    except VoxHTTPError as exc:
+        return exc.status
+    return response.status_code
 
 
+# Failing statuses are sent in order, then a 200. 3 attempts max, so three
+# failures exhaust the retries and surface the last error.
 @pytest.mark.asyncio
-async def test_transport_error_wrapped():
-    """Transport errors (connect timeout, etc.) are wrapped in VoxNetworkError."""
+@pytest.mark.parametrize("statuses,retry_after_ms,calls_made,delays,final_status", [
+    pytest.param((429, 429), 10, 3, [0.01, 0.01], 200, id="429_then_ok"),
+    pytest.param((429,), 2500, 2, [2.5], 200, id="429_uses_retry_after_ms"),
+    pytest.param((429,), None, 2, [2.0], 200, id="429_header_fallback"),
+    pytest.param((429, 429, 429), 10, 3, [0.01, 0.01], 429, id="429_exhaustion"),
+    pytest.param((500, 500), None, 3, [1.0, 2.0], 200, id="500_backoff"),
+    pytest.param((503, 503, 503), None, 3, [1.0, 2.0], 503, id="503_exhaustion"),
+])
+async def test_retry(
+    http_client, sleep_delays, statuses, retry_after_ms, calls_made, delays, final_status
+):
+    client, transport, calls = http_client
+    failures = [_error_response(status, retry_after_ms) for status in statuses]
+    transport.queue("GET", "/api/v1/server", *failures, json_response(200, {"ok": True}))
 
-    class FailingTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            raise httpx.ConnectTimeout("Connection timed out")
+    assert await _final_status(client, "/api/v1/server") == final_status
+    assert len(calls) == calls_made
+    assert sleep_delays == delays
 
-    client = HTTPClient("https://vox.test", token="test-token")
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=FailingTransport())
 
-    with pytest.raises(VoxNetworkError) as exc_info:
-        await client.get("/api/v1/server")
-    assert "Connection timed out" in str(exc_info.value)
-    assert exc_info.value.__cause__ is not None
-    await client.close()
+# --- Transport error wrapping ---
 
 
 @pytest.mark.asyncio
-async def test_connect_error_wrapped():
-    """Connection refused is wrapped in VoxNetworkError."""
+@pytest.mark.parametrize("exc", [
+    httpx.ConnectTimeout("Connection timed out"),
+    httpx.ConnectError("Connection refused"),
+], ids=["timeout", "refused"])
+async def test_transport_error_wrapped(http_client, exc):
+    """Transport errors (connect timeout, refused, etc.) are wrapped in VoxNetworkError."""
+    client, transport, _calls = http_client
+    transport.queue("GET", "/api/v1/server", exc)
 
-    class RefusingTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            raise httpx.ConnectError("Connection refused")
-
-    client = HTTPClient("https://vox.test", token="test-token")
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=RefusingTransport())
-
-    with pytest.raises(VoxNetworkError):
+    with pytest.raises(VoxNetworkError) as exc_info:
         await client.get("/api/v1/server")
-    await client.close()
+    assert str(exc) in str(exc_info.value)
+    assert exc_info.value.__cause__ is exc
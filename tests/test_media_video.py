@@ -7,6 +7,42 @@ import pytest
 from vox_sdk._media import VoxMediaClient
 
 
+def _wait_for_event(client, predicate=lambda _: True, timeout=1.0, step=0.005):
+    """Poll until an event matching ``predicate`` arrives; None after ``timeout`` seconds."""
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        ev = client.poll_event()
+        if ev is not None and predicate(ev):
+            return ev
+        if ev is None:
+            time.sleep(step)
+    return None
+
+
+@pytest.fixture(scope="class")
+def started_client():
+    """One running client per test class; starting the native runtime is the slow part."""
+    client = VoxMediaClient()
+    client.start()
+    yield client
+    client.stop()
+
+
+@pytest.fixture
+def media_client(started_client):
+    """The class's running client, put back to default state for each test."""
+    client = started_client
+    client.set_mute(False)
+    client.set_deaf(False)
+    client.set_video(False)
+    client.set_input_volume(1.0)
+    client.set_output_volume(1.0)
+    client.set_noise_gate(0.0)
+    while client.poll_event() is not None:
+        pass
+    return client
+
+
 class TestVoxMediaClientConstruction:
     """Basic construction and state tests (no hardware needed)."""
 
@@ -51,216 +87,130 @@ class TestVideoMethods:
         with pytest.raises(RuntimeError, match="not started"):
             client.set_video_config(640, 480, 30, 500)
 
-    def test_set_video_sends_command(self):
+    def test_set_video_sends_command(self, media_client):
         """set_video(True) should succeed (sends command to runtime) and update state."""
-        client = VoxMediaClient()
-        client.start()
-        try:
-            client.set_video(True)
-            assert client.is_video_enabled is True
+        client = media_client
+        client.set_video(True)
+        assert client.is_video_enabled is True
 
-            client.set_video(False)
-            assert client.is_video_enabled is False
-        finally:
-            client.stop()
+        client.set_video(False)
+        assert client.is_video_enabled is False
 
-    def test_set_video_config_sends_command(self):
+    def test_set_video_config_sends_command(self, media_client):
         """set_video_config should succeed without raising."""
-        client = VoxMediaClient()
-        client.start()
-        try:
-            client.set_video_config(1280, 720, 30, 1000)
-            client.set_video_config()  # defaults
-        finally:
-            client.stop()
+        client = media_client
+        client.set_video_config(1280, 720, 30, 1000)
+        client.set_video_config()  # defaults
 
-    def test_poll_video_frame_returns_none_when_empty(self):
+    def test_poll_video_frame_returns_none_when_empty(self, media_client):
         """poll_video_frame returns None when no frames are available."""
-        client = VoxMediaClient()
-        client.start()
-        try:
-            assert client.poll_video_frame() is None
-        finally:
-            client.stop()
+        client = media_client
+        assert client.poll_video_frame() is None
 
 
 class TestVideoEvents:
     """Test video-related events propagated back from the media runtime."""
 
-    def test_video_enable_without_connect_emits_error(self):
+    def test_video_enable_without_connect_emits_error(self, media_client):
         """Enabling video without an active SFU connection should emit a video_error event
         (camera won't start without a session, command is just queued)."""
-        client = VoxMediaClient()
-        client.start()
-        try:
-            client.set_video(True)
-            # Give the runtime a moment to process
-            time.sleep(0.1)
-            # The command is accepted but there's no active session,
-            # so it's just silently ignored (no crash)
-            # poll_event should not have a crash-type event
-            events = []
-            while True:
-                ev = client.poll_event()
-                if ev is None:
-                    break
-                events.append(ev)
-            # No connect_failed or crash events expected
-            for ev_type, _ in events:
-                assert ev_type != "connect_failed"
-        finally:
-            client.stop()
+        client = media_client
+        client.set_video(True)
+        # The command is accepted but there's no active session,
+        # so it's just silently ignored (no crash).
+        # No connect_failed or crash events expected within the window.
+        assert _wait_for_event(client, lambda ev: ev[0] == "connect_failed", timeout=0.1) is None
 
 
 class TestPollVideoFrameSignature:
     """Test poll_video_frame return type contract."""
 
-    def test_poll_returns_none_or_tuple(self):
+    def test_poll_returns_none_or_tuple(self, media_client):
         """poll_video_frame should return None or a 4-tuple (user_id, w, h, bytes)."""
-        client = VoxMediaClient()
-        client.start()
-        try:
-            result = client.poll_video_frame()
-            # Without a connection, should be None
-            assert result is None
-        finally:
-            client.stop()
+        client = media_client
+        result = client.poll_video_frame()
+        # Without a connection, should be None
+        assert result is None
 
 
 class TestMuteDeafVideo:
     """Test that mute/deaf/video state toggles work independently."""
 
-    def test_independent_toggles(self):
-        client = VoxMediaClient()
-        client.start()
-        try:
-            client.set_mute(True)
-            assert client.is_muted is True
-            assert client.is_deafened is False
-            assert client.is_video_enabled is False
+    def test_independent_toggles(self, media_client):
+        client = media_client
+        client.set_mute(True)
+        assert client.is_muted is True
+        assert client.is_deafened is False
+        assert client.is_video_enabled is False
 
-            client.set_deaf(True)
-            assert client.is_muted is True
-            assert client.is_deafened is True
-            assert client.is_video_enabled is False
+        client.set_deaf(True)
+        assert client.is_muted is True
+        assert client.is_deafened is True
+        assert client.is_video_enabled is False
 
-            client.set_video(True)
-            assert client.is_muted is True
-            assert client.is_deafened is True
-            assert client.is_video_enabled is True
+        client.set_video(True)
+        assert client.is_muted is True
+        assert client.is_deafened is True
+        assert client.is_video_enabled is True
 
-            client.set_video(False)
-            assert client.is_video_enabled is False
-            assert client.is_muted is True
-        finally:
-            client.stop()
+        client.set_video(False)
+        assert client.is_video_enabled is False
+        assert client.is_muted is True
 
 
 class TestVolumeAndGate:
     """Test volume and noise gate API methods."""
 
-    def test_set_input_volume(self):
-        client = VoxMediaClient()
-        client.start()
-        try:
-            client.set_input_volume(0.5)
-            client.set_input_volume(1.0)
-            client.set_input_volume(2.0)
-        finally:
-            client.stop()
-
-    def test_set_output_volume(self):
-        client = VoxMediaClient()
-        client.start()
-        try:
-            client.set_output_volume(0.0)
-            client.set_output_volume(1.0)
-            client.set_output_volume(2.0)
-        finally:
-            client.stop()
-
-    def test_set_noise_gate(self):
-        client = VoxMediaClient()
-        client.start()
-        try:
-            client.set_noise_gate(0.05)
-            client.set_noise_gate(0.0)
-            client.set_noise_gate(1.0)
-        finally:
-            client.stop()
-
-    def test_set_user_volume(self):
-        client = VoxMediaClient()
-        client.start()
-        try:
-            client.set_user_volume(42, 0.5)
-            client.set_user_volume(42, 1.0)
-            client.set_user_volume(99, 2.0)
-        finally:
-            client.stop()
-
-    def test_volume_methods_before_start_raises(self):
+    @pytest.mark.parametrize("method,args", [
+        ("set_input_volume", (0.5,)),
+        ("set_input_volume", (1.0,)),
+        ("set_input_volume", (2.0,)),
+        ("set_output_volume", (0.0,)),
+        ("set_output_volume", (1.0,)),
+        ("set_output_volume", (2.0,)),
+        ("set_noise_gate", (0.05,)),
+        ("set_noise_gate", (0.0,)),
+        ("set_noise_gate", (1.0,)),
+        ("set_user_volume", (42, 0.5)),
+        ("set_user_volume", (42, 1.0)),
+        ("set_user_volume", (99, 2.0)),
+        ("set_user_volume", (1, 1.0)),
+    ])
+    def test_setter_accepts(self, media_client, method, args):
+        getattr(media_client, method)(*args)
+
+    @pytest.mark.parametrize("method,args", [
+        ("set_input_volume", (1.0,)),
+        ("set_output_volume", (1.0,)),
+        ("set_noise_gate", (0.0,)),
+        ("set_user_volume", (1, 1.0)),
+    ])
+    def test_volume_methods_before_start_raises(self, method, args):
         client = VoxMediaClient()
         with pytest.raises(RuntimeError, match="not started"):
-            client.set_input_volume(1.0)
-        with pytest.raises(RuntimeError, match="not started"):
-            client.set_output_volume(1.0)
-        with pytest.raises(RuntimeError, match="not started"):
-            client.set_noise_gate(0.0)
-        with pytest.raises(RuntimeError, match="not started"):
-            client.set_user_volume(1, 1.0)
-
-    def test_volume_defaults_no_crash(self):
-        """Setting all volumes to their default values should not error."""
-        client = VoxMediaClient()
-        client.start()
-        try:
-            client.set_input_volume(1.0)
-            client.set_output_volume(1.0)
-            client.set_noise_gate(0.0)
-            client.set_user_volume(1, 1.0)
-        finally:
-            client.stop()
+            getattr(client, method)(*args)
 
 
 class TestConnectWithoutServer:
     """Test connect + video commands without a real SFU (exercises command pipeline)."""
 
-    def test_connect_bad_address_emits_event(self):
+    def test_connect_bad_address_emits_event(self, media_client):
         """Connecting to a bad address should emit connect_failed."""
-        client = VoxMediaClient()
-        client.start()
-        try:
-            # Use a short idle timeout so the QUIC connect fails faster.
-            # Connect to localhost port 1 which should refuse/timeout.
-            client.connect(
-                "127.0.0.1:1", "fake-token", 1, 1,
-                idle_timeout_secs=2,
-            )
-            # Wait for async connect to fail (QUIC timeout + processing)
-            deadline = time.time() + 35
-            events = []
-            while time.time() < deadline:
-                ev = client.poll_event()
-                if ev is not None:
-                    events.append(ev)
-                    if ev[0] == "connect_failed":
-                        break
-                time.sleep(0.1)
-
-            event_types = [e[0] for e in events]
-            assert "connect_failed" in event_types
-        finally:
-            client.stop()
-
-    def test_set_video_config_then_connect(self):
+        client = media_client
+        # Port 0 is rejected by quinn before any packet is sent, so this
+        # exercises the connect_failed path without waiting on a QUIC timeout.
+        client.connect(
+            "127.0.0.1:0", "fake-token", 1, 1,
+            idle_timeout_secs=2,
+        )
+        ev = _wait_for_event(client, lambda ev: ev[0] == "connect_failed", timeout=5)
+        assert ev is not None
+
+    def test_set_video_config_then_connect(self, media_client):
         """Setting video config before connect should not crash."""
-        client = VoxMediaClient()
-        client.start()
-        try:
-            client.set_video_config(320, 240, 15, 250)
-            client.set_video(True)
-            # No crash = success; the command is queued but no session exists
-            time.sleep(0.1)
-        finally:
-            client.stop()
+        client = media_client
+        client.set_video_config(320, 240, 15, 250)
+        client.set_video(True)
+        # No crash = success; the command is queued but no session exists.
+        # Return as soon as the runtime reports anything back.
+        _wait_for_event(client, timeout=0.1)
@@ -17,6 +17,40 @@ from vox_sdk.models.invites import InviteResponse
 from vox_sdk.models.files import FileResponse
 
 
+LOGIN_PAYLOAD = {"token": "tok", "user_id": 42, "display_name": "Alice", "roles": [1, 2]}
+MFA_PAYLOAD = {"mfa_required": True, "mfa_ticket": "mfa_abc", "available_methods": ["totp"]}
+MESSAGE_PAYLOAD = {"msg_id": 1, "feed_id": 10, "author_id": 42, "body": "hello", "timestamp": 1700000000}
+FEED_PAYLOAD = {"feed_id": 1, "name": "general", "type": "text", "position": 0}
+MEMBER_PAYLOAD = {"user_id": 42, "display_name": "Alice", "role_ids": [1, 2]}
+MEMBER_EXTRA_PAYLOAD = {"user_id": 1, "display_name": "x", "role_ids": [], "some_new_field": "value"}
+ROLE_PAYLOAD = {"role_id": 1, "name": "Admin", "permissions": 8, "position": 1}
+USER_PAYLOAD = {"user_id": 42, "username": "alice", "created_at": 1700000000}
+SERVER_INFO_PAYLOAD = {"name": "Test Server", "member_count": 100}
+MEDIA_CERT_PAYLOAD = {"fingerprint": "sha256:abcdef1234567890", "cert_der": [48, 130, 1, 0]}
+VOICE_JOIN_PAYLOAD = {
+    "media_url": "quic://sfu.test:4443",
+    "media_token": "tok",
+    "members": [
+        {"user_id": 1, "mute": False, "deaf": False, "video": False,
+         "streaming": False, "server_mute": False, "server_deaf": False},
+    ],
+}
+DM_PAYLOAD = {"dm_id": 1, "participant_ids": [1, 2], "is_group": False}
+INVITE_PAYLOAD = {"code": "abc123", "creator_id": 1, "uses": 5}
+FILE_PAYLOAD = {"file_id": "f_abc", "name": "image.png", "size": 1024, "mime": "image/png", "url": "/files/f_abc"}
+
+
+@pytest.fixture(scope="module")
+def member():
+    """Read-only: validated once for every test that only inspects it."""
+    return MemberResponse.model_validate(MEMBER_PAYLOAD)
+
+
+@pytest.fixture(scope="module")
+def member_with_extra():
+    return MemberResponse.model_validate(MEMBER_EXTRA_PAYLOAD)
+
+
 class TestAuthModels:
     def test_register_response(self):
         r = RegisterResponse(user_id=1, token="abc")
@@ -24,18 +58,12 @@ class TestAuthModels:
         assert r.token == "abc"
 
     def test_login_response(self):
-        r = LoginResponse.model_validate({
-            "token": "tok", "user_id": 42, "display_name": "Alice", "roles": [1, 2]
-        })
+        r = LoginResponse.model_validate(LOGIN_PAYLOAD)
         assert r.user_id == 42
         assert r.roles == [1, 2]
 
     def test_mfa_required(self):
-        r = MFARequiredResponse.model_validate({
-            "mfa_required": True,
-            "mfa_ticket": "mfa_abc",
-            "available_methods": ["totp"],
-        })
+        r = MFARequiredResponse.model_validate(MFA_PAYLOAD)
         assert r.mfa_ticket == "mfa_abc"
 
 
@@ -66,110 +94,90 @@ class TestErrorModels:
 
 class TestCoreModels:
     def test_message_response(self):
-        r = MessageResponse.model_validate({
-            "msg_id": 1,
-            "feed_id": 10,
-            "author_id": 42,
-            "body": "hello",
-            "timestamp": 1700000000,
-        })
+        r = MessageResponse.model_validate(MESSAGE_PAYLOAD)
         assert r.msg_id == 1
         assert r.attachments == []
 
     def test_feed_response(self):
-        r = FeedResponse.model_validate({
-            "feed_id": 1,
-            "name": "general",
-            "type": "text",
-            "position": 0,
-        })
+        r = FeedResponse.model_validate(FEED_PAYLOAD)
         assert r.feed_id == 1
         assert r.permission_overrides == []
 
-    def test_member_response(self):
-        r = MemberResponse.model_validate({
-            "user_id": 42,
-            "display_name": "Alice",
-            "role_ids": [1, 2],
-        })
-        assert r.role_ids == [1, 2]
+    def test_member_response(self, member):
+        assert member.role_ids == [1, 2]
 
     def test_role_response(self):
-        r = RoleResponse.model_validate({
-            "role_id": 1,
-            "name": "Admin",
-            "permissions": 8,
-            "position": 1,
-        })
+        r = RoleResponse.model_validate(ROLE_PAYLOAD)
         assert r.permissions == 8
 
     def test_user_response(self):
-        r = UserResponse.model_validate({
-            "user_id": 42,
-            "username": "alice",
-            "created_at": 1700000000,
-        })
+        r = UserResponse.model_validate(USER_PAYLOAD)
         assert r.federated is False
 
     def test_server_info(self):
-        r = ServerInfoResponse.model_validate({
-            "name": "Test Server",
-            "member_count": 100,
-        })
+        r = ServerInfoResponse.model_validate(SERVER_INFO_PAYLOAD)
         assert r.name == "Test Server"
 
-    def test_extra_fields_ignored(self):
+    def test_extra_fields_ignored(self, member_with_extra):
         """Models should ignore unknown fields from the server."""
-        r = MemberResponse.model_validate({
-            "user_id": 1,
-            "display_name": "x",
-            "role_ids": [],
-            "some_new_field": "value",
-        })
-        assert r.user_id == 1
+        assert member_with_extra.user_id == 1
 
     def test_media_cert_response(self):
-        r = MediaCertResponse.model_validate({
-            "fingerprint": "sha256:abcdef1234567890",
-            "cert_der": [48, 130, 1, 0],
-        })
+        r = MediaCertResponse.model_validate(MEDIA_CERT_PAYLOAD)
         assert r.fingerprint == "sha256:abcdef1234567890"
         assert r.cert_der == [48, 130, 1, 0]
 
     def test_voice_join_response(self):
-        r = VoiceJoinResponse.model_validate({
-            "media_url": "quic://sfu.test:4443",
-            "media_token": "tok",
-            "members": [
-                {"user_id": 1, "mute": False, "deaf": False, "video": False,
-                 "streaming": False, "server_mute": False, "server_deaf": False},
-            ],
-        })
+        r = VoiceJoinResponse.model_validate(VOICE_JOIN_PAYLOAD)
         assert len(r.members) == 1
         assert r.members[0].user_id == 1
 
     def test_dm_response(self):
-        r = DMResponse.model_validate({
-            "dm_id": 1,
-            "participant_ids": [1, 2],
-            "is_group": False,
-        })
+        r = DMResponse.model_validate(DM_PAYLOAD)
         assert r.participant_ids == [1, 2]
 
     def test_invite_response(self):
-        r = InviteResponse.model_validate({
-            "code": "abc123",
-            "creator_id": 1,
-            "uses": 5,
-        })
+        r = InviteResponse.model_validate(INVITE_PAYLOAD)
         assert r.code == "abc123"
 
     def test_file_response(self):
-        r = FileResponse.model_validate({
-            "file_id": "f_abc",
-            "name": "image.png",
-            "size": 1024,
-            "mime": "image/png",
-            "url": "/files/f_abc",
-        })
+        r = FileResponse.model_validate(FILE_PAYLOAD)
         assert r.size == 1024
+
+
+class TestLazyExports:
+    def test_export_lists_agree(self):
+        """__all__, _LAZY_IMPORTS and the TYPE_CHECKING imports name the same models."""
+        import ast
+        import inspect
+
+        from vox_sdk import models
+
+        tree = ast.parse(inspect.getsource(models))
+        guard = next(
+            node for node in tree.body
+            if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+        )
+        type_checking = {
+            f"{stmt.module.rsplit('.', 1)[1]}:{alias.name}"
+            for stmt in guard.body
+            for alias in stmt.names
+        }
+        lazy = {f"{module}:{name}" for name, module in models._LAZY_IMPORTS.items()}
+
+        assert set(models.__all__) == set(models._LAZY_IMPORTS)
+        assert len(models.__all__) == len(set(models.__all__))
+        assert type_checking == lazy
+
+    def test_exports_resolve_to_submodule_classes(self):
+        from vox_sdk import models
+
+        for name in models.__all__:
+            assert getattr(models, name).__name__ == name
+        assert models.VoiceJoinResponse is VoiceJoinResponse
+
+    def test_unknown_name_raises_attribute_error(self):
+        from vox_sdk import models
+
+        with pytest.raises(AttributeError):
+            models.NotAModel  # noqa: B018
@@ -1,191 +1,135 @@
 """Tests for cursor-based pagination."""
 
-import json
+import asyncio
+from collections import deque
 
 import httpx
 import pytest
+from helpers import json_response
 
-from vox_sdk.http import HTTPClient
+from vox_sdk.errors import VoxHTTPError
 from vox_sdk.models.members import MemberResponse
 from vox_sdk.pagination import PaginatedIterator
 
+_ALICE = {"user_id": 1, "display_name": "Alice", "role_ids": []}
+_BOB = {"user_id": 2, "display_name": "Bob", "role_ids": []}
+_CHARLIE = {"user_id": 3, "display_name": "Charlie", "role_ids": []}
+
+_EMPTY_PAGE = json_response(200, {"items": [], "cursor": None})
 
-@pytest.mark.asyncio
-async def test_single_page():
-    """Pagination with a single page (no cursor)."""
-    page_data = {
-        "items": [
-            {"user_id": 1, "display_name": "Alice", "role_ids": []},
-            {"user_id": 2, "display_name": "Bob", "role_ids": []},
-        ],
-        "cursor": None,
-    }
 
-    class MockTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            return httpx.Response(200, json=page_data)
+def _members(client, **kwargs):
+    return PaginatedIterator(client, "/api/v1/members", MemberResponse, **kwargs)
 
-    client = HTTPClient("https://vox.test", token="t")
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=MockTransport())
 
-    items = await PaginatedIterator(
-        client, "/api/v1/members", MemberResponse
-    ).flatten()
+@pytest.mark.asyncio
+async def test_single_page(make_client):
+    """Pagination with a single page (no cursor)."""
+    page = json_response(200, {"items": [_ALICE, _BOB], "cursor": None})
+    client = make_client(lambda request: page)
+
+    items = await _members(client).flatten()
 
     assert len(items) == 2
     assert items[0].user_id == 1
     assert items[1].display_name == "Bob"
-    await client.close()
 
 
 @pytest.mark.asyncio
-async def test_multi_page():
+async def test_multi_page(make_client):
     """Pagination across two pages."""
-    call_count = {"n": 0}
-
-    class MockTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            call_count["n"] += 1
-            url = str(request.url)
-            if "cursor=page2" in url:
-                return httpx.Response(200, json={
-                    "items": [{"user_id": 3, "display_name": "Charlie", "role_ids": []}],
-                    "cursor": None,
-                })
-            return httpx.Response(200, json={
-                "items": [
-                    {"user_id": 1, "display_name": "Alice", "role_ids": []},
-                    {"user_id": 2, "display_name": "Bob", "role_ids": []},
-                ],
-                "cursor": "page2",
-            })
-
-    client = HTTPClient("https://vox.test", token="t")
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=MockTransport())
-
-    items = await PaginatedIterator(
-        client, "/api/v1/members", MemberResponse
-    ).flatten()
-
-    assert len(items) == 3
-    assert call_count["n"] == 2
-    await client.close()
-
+    responses = deque([
+        json_response(200, {"items": [_ALICE, _BOB], "cursor": "page2"}),
+        json_response(200, {"items": [_CHARLIE], "cursor": None}),
+    ])
 
-@pytest.mark.asyncio
-async def test_empty_result():
-    """Pagination with zero results."""
+    items = await _members(make_client(lambda request: responses.popleft())).flatten()
 
-    class MockTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            return httpx.Response(200, json={"items": [], "cursor": None})
+    assert [m.user_id for m in items] == [1, 2, 3]
+    assert not responses
 
-    client = HTTPClient("https://vox.test", token="t")
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=MockTransport())
 
-    items = await PaginatedIterator(
-        client, "/api/v1/members", MemberResponse
-    ).flatten()
+@pytest.mark.asyncio
+async def test_empty_result(make_client):
+    """Pagination with zero results."""
+    client = make_client(lambda request: _EMPTY_PAGE)
 
-    assert items == []
-    await client.close()
+    assert await _members(client).flatten() == []
 
 
 @pytest.mark.asyncio
-async def test_custom_params_forwarded():
+async def test_custom_params_forwarded(make_client):
     """Extra params are forwarded to each page request."""
-    urls: list[str] = []
-
-    class MockTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            urls.append(str(request.url))
-            return httpx.Response(200, json={"items": [], "cursor": None})
+    params: list[httpx.QueryParams] = []
 
-    client = HTTPClient("https://vox.test", token="t")
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=MockTransport())
+    def handler(request):
+        params.append(request.url.params)
+        return _EMPTY_PAGE
 
-    await PaginatedIterator(
-        client, "/api/v1/members", MemberResponse, params={"role_id": "5"}
-    ).flatten()
+    await _members(make_client(handler), params={"role_id": "5"}).flatten()
 
-    assert "role_id=5" in urls[0]
-    await client.close()
+    assert params[0].get("role_id") == "5"
 
 
 @pytest.mark.asyncio
-async def test_limit_parameter_used():
+async def test_limit_parameter_used(make_client):
     """Non-default limit is sent as query param."""
-    urls: list[str] = []
+    params: list[httpx.QueryParams] = []
 
-    class MockTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            urls.append(str(request.url))
-            return httpx.Response(200, json={"items": [], "cursor": None})
+    def handler(request):
+        params.append(request.url.params)
+        return _EMPTY_PAGE
 
-    client = HTTPClient("https://vox.test", token="t")
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=MockTransport())
+    await _members(make_client(handler), limit=10).flatten()
 
-    await PaginatedIterator(
-        client, "/api/v1/members", MemberResponse, limit=10
-    ).flatten()
-
-    assert "limit=10" in urls[0]
-    await client.close()
+    assert params[0].get("limit") == "10"
 
 
 @pytest.mark.asyncio
-async def test_error_during_pagination():
+async def test_error_during_pagination(make_client):
     """A 500 on page 2 raises VoxHTTPError."""
-    from vox_sdk.errors import VoxHTTPError
-
-    call_count = {"n": 0}
-
-    class MockTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            call_count["n"] += 1
-            if call_count["n"] > 1:
-                return httpx.Response(
-                    500,
-                    json={"error": {"code": "INTERNAL_ERROR", "message": "boom"}},
-                )
-            return httpx.Response(200, json={
-                "items": [{"user_id": 1, "display_name": "A", "role_ids": []}],
-                "cursor": "page2",
-            })
-
-    client = HTTPClient("https://vox.test", token="t")
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=MockTransport())
+    error = json_response(500, {"error": {"code": "INTERNAL_ERROR", "message": "boom"}})
+    # Page 1, then page 2 failing on every retry attempt
+    responses = deque([json_response(200, {"items": [_ALICE], "cursor": "page2"})] + [error] * 3)
 
     with pytest.raises(VoxHTTPError) as exc_info:
-        await PaginatedIterator(
-            client, "/api/v1/members", MemberResponse
-        ).flatten()
+        await _members(make_client(lambda request: responses.popleft())).flatten()
     assert exc_info.value.status == 500
-    await client.close()
+    assert not responses
 
 
 @pytest.mark.asyncio
-async def test_async_for_iteration():
+async def test_async_for_iteration(make_client):
     """async for yields same items as flatten()."""
-    page_data = {
-        "items": [
-            {"user_id": 1, "display_name": "Alice", "role_ids": []},
-            {"user_id": 2, "display_name": "Bob", "role_ids": []},
-        ],
-        "cursor": None,
-    }
-
-    class MockTransport(httpx.AsyncBaseTransport):
-        async def handle_async_request(self, request):
-            return httpx.Response(200, json=page_data)
-
-    client = HTTPClient("https://vox.test", token="t")
-    client._client = httpx.AsyncClient(base_url="https://vox.test", transport=MockTransport())
+    page = json_response(200, {"items": [_ALICE, _BOB], "cursor": None})
+    client = make_client(lambda request: page)
 
     items = []
-    async for member in PaginatedIterator(client, "/api/v1/members", MemberResponse):
+    async for member in _members(client):
         items.append(member)
 
     assert len(items) == 2
     assert items[0].user_id == 1
-    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_next_page_fetched_on_demand(make_client):
+    """Page 2 is requested only when an item past page 1 is asked for."""
+    cursors: list[str | None] = []
+
+    def handler(request):
+        cursors.append(request.url.params.get("cursor"))
+        if cursors[-1] == "page2":
+            return json_response(200, {"items": [], "cursor": None})
+        return json_response(200, {"items": [_ALICE, _BOB], "cursor": "page2"})
+
+    it = _members(make_client(handler))
+    async for _ in it:
+        break
+    await it.__anext__()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert cursors == [None]
+
+    assert [m.user_id async for m in it] == []
+    assert cursors == [None, "page2"]
@@ -57,6 +57,11 @@ class TestPermissionsInit:
     def test_everyone_defaults_factory(self):
         assert Permissions.everyone_defaults().value == EVERYONE_DEFAULTS
 
+    def test_factories_share_instances(self):
+        assert Permissions.none() is Permissions.none()
+        assert Permissions.all() is Permissions.all()
+        assert Permissions.everyone_defaults() is Permissions.everyone_defaults()
+
     def test_from_kwargs(self):
         p = Permissions.from_kwargs(send_messages=True, attach_files=True, view_space=False)
         assert p.value == SEND_MESSAGES | ATTACH_FILES
@@ -1,5 +1,6 @@
 """Tests for the rate limiter."""
 
+import asyncio
 import time
 
 import httpx
@@ -45,6 +46,9 @@ class TestClassify:
     def test_stickers(self):
         assert classify("/api/v1/stickers") == "emoji"
 
+    def test_newline_in_path_does_not_hide_messages(self):
+        assert classify("/api/v1/feeds/a\n/messages") == "messages"
+
 
 class TestRateLimiter:
     def test_update_from_response(self):
@@ -92,8 +96,6 @@ class TestRateLimiter:
     @pytest.mark.asyncio
     async def test_wait_if_needed_exhausted_future_reset(self, monkeypatch):
         """Exhausted bucket with future reset should sleep until reset."""
-        import asyncio
-
         rl = RateLimiter()
         reset_time = time.time() + 5
         rl._buckets["auth"] = BucketInfo(limit=5, remaining=0, reset=reset_time)
@@ -115,8 +117,6 @@ class TestRateLimiter:
     @pytest.mark.asyncio
     async def test_wait_if_needed_recheck_after_lock(self, monkeypatch):
         """If bucket is replenished while waiting for the lock, skip sleeping."""
-        import asyncio
-
         rl = RateLimiter()
         reset_time = time.time() + 5
         rl._buckets["auth"] = BucketInfo(limit=5, remaining=0, reset=reset_time)